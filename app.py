@@ -15,11 +15,12 @@ import werkzeug
 if not hasattr(werkzeug.urls, 'url_quote'):
     werkzeug.urls.url_quote = werkzeug.urls.quote
 
-from flask import Flask, request, jsonify, render_template, redirect, url_for, session
+from flask import Flask, request, jsonify, render_template, redirect, url_for, session, Response, stream_with_context
 import pandas as pd
 from sklearn.preprocessing import LabelEncoder
 from dataset_create import skill_match, education_match, experience_gap
 from form_filler import auto_fill_form
+from batch_apply import batch_runs
 
 # Set up logging
 logging.basicConfig(
@@ -41,10 +42,17 @@ except ImportError as e:
     logger.warning("Using basic resume extraction as fallback")
     
 from job_description_extractor import extract_job_description
+from ats_analysis import run_ats_analysis, rank_job_descriptions, content_hash, ats_results
+from job_dedup import dedupe_jobs, shared_job_index
+from keyword_extraction import keyword_idf
+from live_scoring import live_sessions
+from source_metrics import scraper_metrics
+from search_snapshots import (search_snapshots, decode_cursor, parse_fields, parse_page_size,
+                              InvalidCursorError, DEFAULT_PAGE_SIZE, SUMMARY_FIELDS)
 
 # Try to import job_scraper, fall back to mock_job_generator if dependencies are missing
 try:
-    from job_scraper import JobScraper, get_jobs_with_matching
+    from job_scraper import JobScraper, get_jobs_with_matching, google_selector_registry, google_xpath_registry
     job_scraper_available = True
 except ImportError as e:
     logger.warning(f"Job scraper import error: {str(e)}")
@@ -379,8 +387,17 @@ def search_jobs():
         logger.info("Job search API called")
         
         # Handle both form data and JSON data
+        params = (request.json or {}) if request.is_json else request.form
+        cursor = params.get('cursor') or request.args.get('cursor')
+        page_size = parse_page_size(params.get('limit') or request.args.get('limit'))
+        fields = parse_fields(params.get('fields') or request.args.get('fields'))
+        
+        # Follow-up pages are served from the stored result snapshot
+        if cursor:
+            return jobs_page_response(cursor=cursor, limit=page_size, fields=fields)
+        
         if request.is_json:
-            data = request.json or {}
+            data = params
             query = data.get('query', '')
             location = data.get('location', '')
             resume_data = data.get('resume_data', None)
@@ -461,10 +478,7 @@ def search_jobs():
             # Fall back to mock data if scraper initialization fails
             jobs = generate_mock_jobs(query, location, resume_data)
             logger.info("Using mock job data due to scraper initialization failure")
-            return jsonify({
-                "success": True,
-                "jobs": jobs
-            })
+            return jobs_page_response(jobs=jobs, query=query, location=location, limit=page_size, fields=fields)
         
         # Try multiple sources in parallel to maximize chances of getting jobs
         all_jobs = []
@@ -524,40 +538,41 @@ def search_jobs():
             except Exception as google_error:
                 logger.warning(f"Error searching Google Jobs: {str(google_error)}")
         
-        # Deduplicate jobs by title and company
-        seen = set()
+        # Skip jobs with missing essential data
+        all_jobs = [job for job in all_jobs if job.get('title') and job.get('company')]
+
+        # Drop near-duplicates (same posting syndicated with small title/description changes)
+        new_jobs = []
+        unique_jobs = dedupe_jobs(all_jobs, shared_job_index, new_jobs)
+        logger.info(f"Near-duplicate detection kept {len(unique_jobs)} of {len(all_jobs)} jobs")
+
+        # Postings not seen before refine the keyword IDF table used by the ATS checker
+        keyword_idf.add_documents(job.get('description') for job in new_jobs)
+
         jobs = []
-        for job in all_jobs:
-            # Skip jobs with missing essential data
-            if not job.get('title') or not job.get('company'):
-                continue
-                
-            key = (job.get('title', '').lower(), job.get('company', '').lower())
-            if key not in seen:
-                seen.add(key)
-                
-                # Ensure job has a valid URL
-                if not job.get('url') or job.get('url') == '#':
-                    # Create a Google search URL as fallback
-                    title_slug = job.get('title', '').replace(' ', '+')
-                    company_slug = job.get('company', '').replace(' ', '+')
-                    job['url'] = f"https://www.google.com/search?q={title_slug}+{company_slug}+job+apply"
-                
-                # Ensure all required fields are present
-                job['description'] = job.get('description', 'No description available')
-                job['location'] = job.get('location', 'Remote/Various')
-                job['skills'] = job.get('skills', [])
-                job['posted_date'] = job.get('posted_date', 'Recently')
-                job['job_type'] = job.get('job_type', 'Full-time')
-                
-                # Ensure all jobs have a valid URL for the Apply Now button
-                if not job.get('url') or job.get('url') == '#' or job.get('url').startswith('javascript:'):
-                    # Create a Google search URL as fallback
-                    title_slug = job.get('title', '').replace(' ', '+')
-                    company_slug = job.get('company', '').replace(' ', '+')
-                    job['url'] = f"https://www.google.com/search?q={title_slug}+{company_slug}+job+apply"
-                
-                jobs.append(job)
+        for job in unique_jobs:
+            # Ensure job has a valid URL
+            if not job.get('url') or job.get('url') == '#':
+                # Create a Google search URL as fallback
+                title_slug = job.get('title', '').replace(' ', '+')
+                company_slug = job.get('company', '').replace(' ', '+')
+                job['url'] = f"https://www.google.com/search?q={title_slug}+{company_slug}+job+apply"
+            
+            # Ensure all required fields are present
+            job['description'] = job.get('description', 'No description available')
+            job['location'] = job.get('location', 'Remote/Various')
+            job['skills'] = job.get('skills', [])
+            job['posted_date'] = job.get('posted_date', 'Recently')
+            job['job_type'] = job.get('job_type', 'Full-time')
+            
+            # Ensure all jobs have a valid URL for the Apply Now button
+            if not job.get('url') or job.get('url') == '#' or job.get('url').startswith('javascript:'):
+                # Create a Google search URL as fallback
+                title_slug = job.get('title', '').replace(' ', '+')
+                company_slug = job.get('company', '').replace(' ', '+')
+                job['url'] = f"https://www.google.com/search?q={title_slug}+{company_slug}+job+apply"
+            
+            jobs.append(job)
         
         # If we don't have jobs, return an empty list instead of using mock data
         if not jobs:
@@ -591,10 +606,43 @@ def search_jobs():
     # Log the final job count
     logger.info(f"Returning {len(jobs)} jobs for query '{query}'")
     
-    # Return the final response
+    # Return the first page; the rest stays in a server-side snapshot
+    return jobs_page_response(jobs=jobs, query=query, location=location, limit=page_size, fields=fields)
+
+# Helper function to build a paginated job search response
+def jobs_page_response(jobs=None, cursor=None, query="", location="", limit=DEFAULT_PAGE_SIZE, fields=SUMMARY_FIELDS):
+    """
+    Build a paginated job search response
+
+    Either snapshots a fresh result set and returns its first page, or returns
+    the page a cursor points to in an existing snapshot.
+
+    Args:
+        jobs (list): Fresh search results (ignored when cursor is given)
+        cursor (str): Pagination cursor from a previous response
+        query (str): Search query, kept with the snapshot
+        location (str): Search location, kept with the snapshot
+        limit (int): Page size
+        fields (tuple): Field projection (None for all fields)
+
+    Returns:
+        Response: JSON response with jobs, total and next_cursor
+    """
+    try:
+        if cursor:
+            snapshot_id, offset = decode_cursor(cursor)
+        else:
+            snapshot_id, offset = search_snapshots.create(jobs or [], query=query, location=location), 0
+        page = search_snapshots.page(snapshot_id, offset=offset, limit=limit, fields=fields)
+    except InvalidCursorError as e:
+        logger.warning(f"Rejected job search cursor: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 410
+    
     return jsonify({
         "success": True,
-        "jobs": jobs
+        "jobs": page['jobs'],
+        "total": page['total'],
+        "next_cursor": page['next_cursor']
     })
 
 # Job details API
@@ -611,11 +659,34 @@ def job_details(job_id):
         "job": job
     })
 
+# API route for per-path job fetch success rates and latency
+@app.route('/api/jobs/source_metrics')
+def api_source_metrics():
+    selectors = {}
+    if job_scraper_available:
+        selectors = {
+            "google_browser": google_selector_registry.stats(),
+            "google_http": google_xpath_registry.stats()
+        }
+    return jsonify({
+        "success": True,
+        "metrics": scraper_metrics.snapshot(),
+        "selectors": selectors
+    })
+
 # API route for job details
 @app.route('/api/jobs/<job_id>')
 def api_job_details(job_id):
     logger.info(f"Job details request for job_id: {job_id}")
     
+    # Jobs from a recent search are served from its snapshot, full description included
+    job = search_snapshots.find_job(job_id)
+    if job:
+        return jsonify({
+            "success": True,
+            "job": job
+        })
+    
     # Check if this is a real job (from an external source)
     is_real_job = job_id.startswith(('google_', 'remotive_', 'adzuna_', 'github_', 'rss_'))
     
@@ -803,6 +874,80 @@ def apply_job():
             "company": job.get('company'),
             "application_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         })
+# Batch auto-apply API: fill many application forms concurrently
+@app.route('/api/auto_apply/batch', methods=['POST'])
+def start_batch_apply():
+    data = request.json or {}
+    job_links = [link for link in data.get('job_links', []) if isinstance(link, str) and link.startswith(('http://', 'https://'))]
+    resume_data = data.get('resume')
+
+    if not job_links:
+        return jsonify({"success": False, "error": "At least one job link is required"}), 400
+    if not resume_data:
+        return jsonify({"success": False, "error": "Resume is required"}), 400
+
+    resume_file_path = None
+    try:
+        # Save the resume once; every fill in the batch uploads the same file
+        if resume_data.startswith('data:application/pdf;base64,'):
+            resume_data = resume_data.split(',', 1)[1]
+        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+        resume_file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"batch_resume_{datetime.now().strftime('%Y%m%d%H%M%S%f')}.pdf")
+        with open(resume_file_path, 'wb') as f:
+            f.write(base64.b64decode(resume_data))
+        resume_features = extract_resume_info(resume_file_path)
+    except Exception as e:
+        logger.error(f"Error preparing resume for batch apply: {str(e)}")
+        if resume_file_path and os.path.exists(resume_file_path):
+            os.remove(resume_file_path)
+        return jsonify({"success": False, "error": f"Could not read resume: {str(e)}"}), 400
+
+    # The batch owns the saved resume and deletes it once every fill is done
+    run = batch_runs.start(job_links, resume_features, resume_file_path, delete_resume_file=True)
+    logger.info(f"Started batch apply {run.id} for {len(run.job_links)} jobs with {run.workers} browsers")
+    return jsonify({
+        "success": True,
+        "batch_id": run.id,
+        "total": len(run.job_links),
+        "status_url": url_for('batch_apply_status', batch_id=run.id),
+        "events_url": url_for('batch_apply_events', batch_id=run.id)
+    }), 202
+
+@app.route('/api/auto_apply/batch/<batch_id>')
+def batch_apply_status(batch_id):
+    run = batch_runs.get(batch_id)
+    if not run:
+        return jsonify({"success": False, "error": "Batch not found"}), 404
+    return jsonify(dict(run.status(), success=True))
+
+@app.route('/api/auto_apply/batch/<batch_id>/events')
+def batch_apply_events(batch_id):
+    """Stream batch progress as server-sent events until the batch finishes"""
+    run = batch_runs.get(batch_id)
+    if not run:
+        return jsonify({"success": False, "error": "Batch not found"}), 404
+
+    since = request.args.get('since', default=0, type=int)
+    # An EventSource reconnect resumes after the last event it received
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    if last_event_id.isdigit():
+        since = int(last_event_id) + 1
+
+    def generate(since):
+        while True:
+            events, done = run.wait_events(since)
+            for event in events:
+                yield f"id: {event['seq']}\nevent: {event['event']}\ndata: {json.dumps(event)}\n\n"
+            since += len(events)
+            if (events and events[-1]['event'] == 'finished') or (done and not events):
+                break
+            if not events:
+                # Keep idle connections open through proxies
+                yield ": keep-alive\n\n"
+
+    return Response(stream_with_context(generate(since)), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 # Helper function to get job by ID
 def get_job_by_id(job_id):
     # Check if this is a real job (from an external source)
@@ -1119,11 +1264,110 @@ def dashboard():
 def resume_builder():
     return render_template('resume_builder.html')
 
+# Live ATS scoring for the resume builder: only changed sections are sent
+@app.route('/api/resume_builder/score', methods=['POST'])
+def resume_builder_score():
+    try:
+        data = request.get_json(silent=True) or {}
+        sections = data.get('sections')
+        if not isinstance(sections, dict):
+            return jsonify({'error': 'sections must be an object of section name to section data'}), 400
+        
+        scoring_session = live_sessions.get(data.get('session_id'))
+        # An expired session only has the sections sent now; the client must send all of them again
+        resync = scoring_session is None and bool(data.get('session_id'))
+        if scoring_session is None:
+            scoring_session = live_sessions.create()
+        
+        result = scoring_session.update(sections)
+        return jsonify({
+            'sessionId': scoring_session.id,
+            'resync': resync,
+            'score': result['score'],
+            'components': result['components'],
+            'missingSkills': result['missing_skills'],
+            'suggestions': result['suggestions'],
+            'recomputed': result['recomputed'],
+            'elapsedMs': result['elapsed_ms']
+        })
+    except Exception as e:
+        logger.error(f"Error in live resume scoring: {str(e)}")
+        return jsonify({'error': f'Scoring failed: {str(e)}'}), 500
+
 # ATS Checker route
 @app.route('/ats_checker')
 def ats_checker():
     return render_template('ats_checker.html')
 
+def extract_resume_for_ats(file_path):
+    """
+    Extract resume data for ATS analysis, falling back to minimal data on errors
+
+    Args:
+        file_path (str): Saved resume file
+
+    Returns:
+        tuple: (resume_data, extracted) where extracted is False if fallback data was used
+    """
+    try:
+        # Try to use enhanced extraction first
+        if enhanced_extraction_available:
+            logger.info(f"Attempting to extract resume data using enhanced extraction from {file_path}")
+            resume_data = extract_resume_info(file_path)
+            logger.info(f"Successfully extracted resume data using enhanced extraction: {len(str(resume_data))} bytes")
+        else:
+            # Fall back to basic extraction
+            logger.info(f"Enhanced extraction not available, falling back to basic extraction for {file_path}")
+            try:
+                from resume_extraction import extract_resume_info as basic_extract
+                resume_data = basic_extract(file_path)
+                logger.info("Used basic extraction as fallback")
+            except ImportError:
+                logger.error("Basic resume extraction module not available, creating minimal resume data")
+                # Create minimal resume data structure if basic extraction is also not available
+                resume_data = {
+                    'skills': ['Python', 'JavaScript', 'HTML', 'CSS'],  # Default skills
+                    'name': 'Not detected',
+                    'email': 'Not detected',
+                    'phone': 'Not detected',
+                    'sections': {'summary': True, 'experience': True, 'education': True, 'skills': True},
+                    'word_count': 500,  # Default word count
+                    'format_score': 0.7,  # Default format score
+                    'content_score': 0.7,  # Default content score
+                    'keyword_density': 0.5  # Default keyword density
+                }
+            
+        # Ensure we have all required fields
+        if 'skills' not in resume_data:
+            resume_data['skills'] = []
+        if 'name' not in resume_data:
+            resume_data['name'] = 'Not detected'
+        if 'email' not in resume_data:
+            resume_data['email'] = 'Not detected'
+        if 'phone' not in resume_data:
+            resume_data['phone'] = 'Not detected'
+        if 'sections' not in resume_data:
+            resume_data['sections'] = {}
+            
+        logger.info(f"Resume data extracted with {len(resume_data.get('skills', []))} skills")
+    except Exception as e:
+        logger.error(f"Error in resume extraction: {str(e)}")
+        # Create minimal resume data structure
+        resume_data = {
+            'skills': [],
+            'name': 'Not detected',
+            'email': 'Not detected',
+            'phone': 'Not detected',
+            'sections': {},
+            'word_count': 0,
+            'format_score': 0.5,  # Default middle score
+            'content_score': 0.5,  # Default middle score
+            'keyword_density': 0.3  # Default score
+        }
+        logger.info("Created minimal resume data due to extraction error")
+        return resume_data, False
+    return resume_data, True
+
 # ATS Check API
 @app.route('/api/analyze_resume', methods=['POST'])
 def analyze_resume():
@@ -1141,80 +1385,40 @@ def analyze_resume():
         if not resume_file.filename.lower().endswith(tuple('.' + ext for ext in allowed_extensions)):
             return jsonify({'error': 'File must be PDF, DOC, or DOCX'}), 400
             
+        # Get job description if provided
+        job_description = request.form.get('jobDescription', '')
+        
+        # Repeat analyses of the same file and job description come from the cache
+        resume_bytes = resume_file.read()
+        cache_key = ats_results.key(content_hash(resume_bytes), job_description, enhanced_extraction_available)
+        cached = ats_results.get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached resume analysis")
+            analysis = dict(cached, fileInfo=dict(cached['fileInfo'], format=resume_file.filename.split('.')[-1].upper()))
+            if app.debug:
+                analysis['cached'] = True
+            return jsonify(analysis)
+        
         # Save the file temporarily
         temp_dir = os.path.join(os.getcwd(), 'temp')
         os.makedirs(temp_dir, exist_ok=True)
         temp_path = os.path.join(temp_dir, secure_filename(resume_file.filename))
-        resume_file.save(temp_path)
+        with open(temp_path, 'wb') as f:
+            f.write(resume_bytes)
         logger.info(f"Saved resume file to {temp_path}")
         
         # Extract data from resume
-        try:
-            # Try to use enhanced extraction first
-            if enhanced_extraction_available:
-                logger.info(f"Attempting to extract resume data using enhanced extraction from {temp_path}")
-                resume_data = extract_resume_info(temp_path)
-                logger.info(f"Successfully extracted resume data using enhanced extraction: {len(str(resume_data))} bytes")
-            else:
-                # Fall back to basic extraction
-                logger.info(f"Enhanced extraction not available, falling back to basic extraction for {temp_path}")
-                try:
-                    from resume_extraction import extract_resume_info as basic_extract
-                    resume_data = basic_extract(temp_path)
-                    logger.info("Used basic extraction as fallback")
-                except ImportError:
-                    logger.error("Basic resume extraction module not available, creating minimal resume data")
-                    # Create minimal resume data structure if basic extraction is also not available
-                    resume_data = {
-                        'skills': ['Python', 'JavaScript', 'HTML', 'CSS'],  # Default skills
-                        'name': 'Not detected',
-                        'email': 'Not detected',
-                        'phone': 'Not detected',
-                        'sections': {'summary': True, 'experience': True, 'education': True, 'skills': True},
-                        'word_count': 500,  # Default word count
-                        'format_score': 0.7,  # Default format score
-                        'content_score': 0.7,  # Default content score
-                        'keyword_density': 0.5  # Default keyword density
-                    }
-                
-            # Ensure we have all required fields
-            if 'skills' not in resume_data:
-                resume_data['skills'] = []
-            if 'name' not in resume_data:
-                resume_data['name'] = 'Not detected'
-            if 'email' not in resume_data:
-                resume_data['email'] = 'Not detected'
-            if 'phone' not in resume_data:
-                resume_data['phone'] = 'Not detected'
-            if 'sections' not in resume_data:
-                resume_data['sections'] = {}
-                
-            logger.info(f"Resume data extracted with {len(resume_data.get('skills', []))} skills")
-        except Exception as e:
-            logger.error(f"Error in resume extraction: {str(e)}")
-            # Create minimal resume data structure
-            resume_data = {
-                'skills': [],
-                'name': 'Not detected',
-                'email': 'Not detected',
-                'phone': 'Not detected',
-                'sections': {},
-                'word_count': 0,
-                'format_score': 0.5,  # Default middle score
-                'content_score': 0.5,  # Default middle score
-                'keyword_density': 0.3  # Default score
-            }
-            logger.info("Created minimal resume data due to extraction error")
+        resume_data, extracted = extract_resume_for_ats(temp_path)
+        if not extracted:
+            # Let a retry extract again instead of serving the fallback analysis
+            cache_key = None
             
-        # Get job description if provided
-        job_description = request.form.get('jobDescription', '')
-        
-        # Calculate ATS score
-        score = calculate_ats_score(resume_data, job_description)
-        
-        # Generate improvements and key findings
-        improvements = generate_improvements(resume_data, job_description)
-        key_findings = generate_key_findings(resume_data, score, job_description)
+        # One analysis pass; score, improvements and key findings are derived from it
+        ats = run_ats_analysis(resume_data, job_description, use_extracted_scores=enhanced_extraction_available)
+        features = ats['features']
+        score = ats['score']
+        improvements = ats['improvements']
+        key_findings = ats['key_findings']
         
         # Ensure we have suggestions even if none were generated
         if not improvements or len(improvements) == 0:
@@ -1247,18 +1451,24 @@ def analyze_resume():
             },
             'fileInfo': {
                 'format': resume_file.filename.split('.')[-1].upper(),
-                'wordCount': resume_data.get('word_count', calculate_word_count(resume_data))
+                'wordCount': features.word_count
             },
             'keywords': {
                 'found': resume_data.get('skills', []),
-                'missing': get_missing_skills(resume_data.get('skills', []), job_description)
+                'missing': list(features.missing_skills)
             },
-            'format': analyze_resume_format(resume_data),
-            'content': analyze_resume_content(resume_data),
+            'format': ats['format'],
+            'content': ats['content'],
             'improvements': improvements,
             'keyFindings': key_findings
         }
         
+        ats_results.put(cache_key, analysis)
+        
+        # Per-stage timing breakdown while debugging
+        if app.debug:
+            analysis = dict(analysis, timings=ats['timings'])
+        
         # Log the analysis for debugging
         logger.info(f"Generated analysis with {len(improvements)} improvements and {len(key_findings)} key findings")
         
@@ -1272,662 +1482,80 @@ def analyze_resume():
         logger.error(f"Error in resume analysis: {str(e)}")
         return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
 
-# Helper function to calculate word count
-def calculate_word_count(resume_data):
-    # Combine all text fields and count words
-    text = ''
-    if 'summary' in resume_data:
-        text += resume_data['summary'] + ' '
-    if 'experience_text' in resume_data:
-        text += resume_data['experience_text'] + ' '
-    if 'education_text' in resume_data:
-        text += resume_data['education_text'] + ' '
-        
-    return len(text.split())
-
-# Helper function to analyze resume format
-def analyze_resume_format(resume_data):
-    return {
-        'hasProperHeadings': 'summary' in resume_data and 'experience' in resume_data and 'education' in resume_data,
-        'hasBulletPoints': resume_data.get('has_bullet_points', True),
-        'fontConsistency': 90,  # This would require PDF style analysis in a real app
-        'usesTables': resume_data.get('has_tables', False),
-        'hasImages': resume_data.get('has_images', False),
-        'margins': 'appropriate'
-    }
-    
-# Helper function to analyze resume content
-def analyze_resume_content(resume_data):
-    experience = resume_data.get('experience_text', '')
-    
-    # Check for measurable results (numbers, percentages)
-    has_measurable = any(char.isdigit() for char in experience) if experience else False
-    
-    # Check for action verbs
-    action_verbs = ['managed', 'developed', 'created', 'implemented', 'designed', 'led', 'built']
-    has_action_verbs = any(verb in experience.lower() for verb in action_verbs) if experience else False
-    
-    return {
-        'hasMeasurableResults': has_measurable,
-        'usesActionVerbs': has_action_verbs,
-        'hasDates': resume_data.get('has_dates', True),
-        'spelling': 95,  # Would require more advanced NLP
-        'grammar': 92,   # Would require more advanced NLP
-        'density': 'good'
-    }
-    
-# Helper function to calculate ATS score
-def calculate_ats_score(resume_data, job_description=''):
-    """Calculate a realistic ATS score based on multiple factors with improved relevance"""
-    logger.info(f"Calculating ATS score with resume data: {resume_data.keys()}")
-    
-    # Initialize base scores
-    format_score = 0
-    content_score = 0
-    keyword_density = 0
-    
-    # Check if we're using the enhanced extraction module
-    if enhanced_extraction_available and 'format_score' in resume_data and 'content_score' in resume_data:
-        # Use the pre-calculated scores from enhanced extraction
-        format_score = resume_data.get('format_score', 0) * 30  # Scale to 30%
-        content_score = resume_data.get('content_score', 0) * 30  # Scale to 30%
-        keyword_density = resume_data.get('keyword_density', 0) * 20  # Scale to 20%
-        logger.info(f"Using enhanced extraction scores: format={format_score}, content={content_score}, keyword_density={keyword_density}")
-    else:
-        # Improved granular scoring that varies between resumes
-        # Format scoring (30%)
-        format_score = 0
-        
-        # Detect sections more comprehensively
-        sections = resume_data.get('sections', {})
-        
-        # Check for summary section - multiple ways it could be represented
-        has_summary = False
-        summary_indicators = ['summary', 'profile', 'objective', 'about']
-        
-        # Check in sections dictionary
-        if any(sections.get(key, False) for key in summary_indicators):
-            has_summary = True
-        
-        # Check in resume_data keys
-        if any(key in resume_data for key in summary_indicators):
-            has_summary = True
-        
-        # Check in raw text if available
-        if 'raw_text' in resume_data:
-            raw_text = resume_data['raw_text'].lower()
-            if any(f"{indicator}:" in raw_text or f"{indicator}\n" in raw_text for indicator in summary_indicators):
-                has_summary = True
-        
-        if has_summary:
-            format_score += 5
-            logger.info("Summary section found: +5 points")
-        
-        # Experience is very important - improved detection
-        experience_points = 0
-        has_experience = False
-        experience_indicators = ['experience', 'employment', 'work history', 'professional experience', 'career']
-        
-        # Check in sections dictionary
-        if any(sections.get(key, False) for key in ['experience', 'work_experience', 'employment']):
-            has_experience = True
-        
-        # Check if experience list exists
-        if isinstance(resume_data.get('experience'), list) and len(resume_data.get('experience', [])) > 0:
-            has_experience = True
-        
-        # Check if experience_text exists and has content
-        if resume_data.get('experience_text') and len(resume_data.get('experience_text', '')) > 20:
-            has_experience = True
-        
-        # Check in raw text if available
-        if 'raw_text' in resume_data:
-            raw_text = resume_data['raw_text'].lower()
-            if any(f"{indicator}:" in raw_text or f"{indicator}\n" in raw_text for indicator in experience_indicators):
-                has_experience = True
-        
-        if has_experience:
-            experience_points += 7  # Increased from 5 to 7 (more important)
-            # Add points based on years of experience
-            years_exp = resume_data.get('experience_years', 0)
-            if isinstance(years_exp, (int, float)) and years_exp > 0:
-                experience_points += min(8, years_exp / 1.5)  # Up to 8 more points based on years (increased importance)
-                logger.info(f"Experience section found with {years_exp} years: +{min(8, years_exp/1.5) + 7} points")
-            else:
-                logger.info("Experience section found but no years detected: +7 points")
-        format_score += experience_points
-        
-        # Education section - improved detection
-        has_education = False
-        education_indicators = ['education', 'academic', 'degree', 'university', 'college', 'school']
-        
-        # Check in sections dictionary
-        if any(sections.get(key, False) for key in ['education', 'academic', 'qualifications']):
-            has_education = True
-        
-        # Check if education list exists
-        if isinstance(resume_data.get('education'), list) and len(resume_data.get('education', [])) > 0:
-            has_education = True
-        
-        # Check if education string exists and is not 'Unknown'
-        if isinstance(resume_data.get('education'), str) and resume_data.get('education') != 'Unknown':
-            has_education = True
-        
-        # Check in raw text if available
-        if 'raw_text' in resume_data:
-            raw_text = resume_data['raw_text'].lower()
-            if any(f"{indicator}:" in raw_text or f"{indicator}\n" in raw_text for indicator in education_indicators):
-                has_education = True
-            # Check for common degree keywords
-            degree_keywords = ['bachelor', 'master', 'phd', 'mba', 'bs', 'ba', 'ms', 'b.s.', 'b.a.', 'm.s.', 'ph.d']
-            if any(keyword in raw_text for keyword in degree_keywords):
-                has_education = True
-        
-        if has_education:
-            education_points = 5
-            # Add points based on education level
-            edu_level = resume_data.get('education', '')
-            if isinstance(edu_level, str):
-                if 'phd' in edu_level.lower() or 'doctorate' in edu_level.lower():
-                    education_points += 3
-                elif 'master' in edu_level.lower():
-                    education_points += 2
-                elif 'bachelor' in edu_level.lower() or 'bs' in edu_level.lower() or 'ba' in edu_level.lower():
-                    education_points += 1
-            format_score += education_points
-            logger.info(f"Education section found: +{education_points} points")
-        
-        # Skills section - improved detection
-        has_skills = False
-        
-        # Check in sections dictionary
-        if sections.get('skills', False):
-            has_skills = True
-        
-        # Check if skills list exists and has items
-        if isinstance(resume_data.get('skills'), list) and len(resume_data.get('skills', [])) > 0:
-            has_skills = True
-        
-        # Check in raw text if available
-        if 'raw_text' in resume_data:
-            raw_text = resume_data['raw_text'].lower()
-            if 'skills:' in raw_text or 'skills\n' in raw_text or 'technical skills' in raw_text or 'core competencies' in raw_text:
-                has_skills = True
-        
-        if has_skills:
-            format_score += 10
-            logger.info("Skills section found: +10 points")
-        
-        # Content scoring (30%) - more granular and improved
-        content_score = 0
-        experience_text = resume_data.get('experience_text', '')
-        
-        # Check for measurable results with numbers - improved detection
-        if experience_text:
-            # Look for specific patterns that indicate measurable achievements
-            measurable_patterns = [
-                r'\d+%', r'\d+\s*percent', r'increased\s+by\s+\d+', r'decreased\s+by\s+\d+',
-                r'\$\d+', r'\d+\s*million', r'\d+\s*billion', r'\d+\s*thousand',
-                r'improved\s+\w+\s+by\s+\d+', r'reduced\s+\w+\s+by\s+\d+',
-                r'\d+\s+users', r'\d+\s+customers', r'\d+\s+clients', r'\d+\s+projects'
-            ]
-            
-            # Count matches for each pattern
-            measurable_matches = 0
-            for pattern in measurable_patterns:
-                matches = re.findall(pattern, experience_text, re.IGNORECASE)
-                measurable_matches += len(matches)
-            
-            # Award points based on matches with diminishing returns
-            if measurable_matches > 0:
-                measurable_points = min(12, 5 + (measurable_matches * 1.5))  # Base 5 points + 1.5 per match up to 12
-                content_score += measurable_points
-                logger.info(f"Measurable results found ({measurable_matches} matches): +{measurable_points} points")
-        
-        # Check for action verbs - expanded list
-        action_verbs = [
-            'managed', 'developed', 'created', 'implemented', 'designed', 'led', 'built',
-            'achieved', 'improved', 'increased', 'decreased', 'reduced', 'negotiated',
-            'coordinated', 'established', 'delivered', 'generated', 'maintained',
-            'supervised', 'trained', 'analyzed', 'launched', 'executed', 'streamlined',
-            'optimized', 'transformed', 'spearheaded', 'orchestrated', 'pioneered',
-            'formulated', 'cultivated', 'directed', 'revitalized', 'maximized',
-            'facilitated', 'guided', 'mentored', 'innovated', 'programmed', 'engineered'
-        ]
-        
-        if experience_text:
-            verb_count = sum(1 for verb in action_verbs if verb in experience_text.lower())
-            # More points for action verbs
-            verb_points = min(12, verb_count * 1.2)  # Up to 12 points based on action verb count
-            content_score += verb_points
-            logger.info(f"Action verbs in experience ({verb_count} found): +{verb_points} points")
-        
-        # Check for proper formatting
-        if resume_data.get('has_bullet_points', False):
-            content_score += 6  # Increased from 5 to 6 (more important)
-            logger.info("Bullet points detected: +6 points")
-        
-        if resume_data.get('has_dates', False):
-            content_score += 6  # Increased from 5 to 6 (more important)
-            logger.info("Dates detected: +6 points")
-        
-        # Penalize for bad formatting
-        if resume_data.get('has_tables', False):
-            content_score -= 8  # Increased penalty from 5 to 8 (more significant issue)
-            logger.info("Tables detected (not ATS friendly): -8 points")
-        
-        # Keyword density (20%) - more granular
-        skills = resume_data.get('skills', [])
-        if skills:
-            # Base points on number of skills with diminishing returns
-            skill_count = len(skills)
-            keyword_density = min(20, 5 + (skill_count * 1.5))  # Base 5 points + 1.5 per skill up to 20
-            logger.info(f"Keyword density from {skill_count} skills: {keyword_density} points")
-    
-    # Keyword scoring based on skills (20%) - improved
-    skills = resume_data.get('skills', [])
-    skill_count = len(skills)
-    
-    # More granular skill scoring with diminishing returns
-    if skill_count <= 5:
-        keyword_score = skill_count * 2.5  # 2.5 points per skill for first 5 skills (increased value)
-    else:
-        keyword_score = 12.5 + min(7.5, (skill_count - 5) * 0.75)  # 12.5 points for first 5, then 0.75 point per additional skill
-    
-    logger.info(f"Keyword score from {skill_count} skills: {keyword_score} points")
-    
-    # Calculate job-specific relevance if job description provided (30%) - improved matching
-    if job_description:
-        # Extract job keywords more effectively
-        job_keywords = extract_keywords(job_description)
-        
-        # Add common industry terms that might be in the job description
-        industry_terms = [
-            'agile', 'scrum', 'kanban', 'waterfall', 'lean', 'six sigma',
-            'cloud', 'aws', 'azure', 'gcp', 'devops', 'ci/cd', 'docker', 'kubernetes',
-            'frontend', 'backend', 'fullstack', 'web', 'mobile', 'desktop', 'api',
-            'database', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'oracle',
-            'machine learning', 'ai', 'artificial intelligence', 'data science', 'big data',
-            'analytics', 'business intelligence', 'visualization', 'tableau', 'power bi',
-            'security', 'cybersecurity', 'networking', 'infrastructure', 'architecture',
-            'project management', 'product management', 'agile', 'scrum master', 'product owner'
-        ]
-        
-        # Check if any industry terms are in the job description but not in the keywords
-        for term in industry_terms:
-            if term in job_description.lower() and term not in [k.lower() for k in job_keywords]:
-                job_keywords.append(term)
-        
-        matching_keywords = []
-        partial_matches = 0
-        
-        # Improved matching algorithm
-        for skill in skills:
-            exact_match = False
-            partial_match = False
+# Batch ATS Check API: one resume against many job descriptions
+MAX_BATCH_JOB_DESCRIPTIONS = 50
+
+@app.route('/api/analyze_resume/batch', methods=['POST'])
+def analyze_resume_batch():
+    temp_path = None
+    try:
+        # Check if a file was uploaded
+        if 'resume' not in request.files:
+            return jsonify({'error': 'No resume file uploaded'}), 400
             
-            for keyword in job_keywords:
-                # Check for exact matches first (worth more)
-                if skill.lower() == keyword.lower():
-                    matching_keywords.append(skill)
-                    exact_match = True
-                    break
-                # Then check for partial matches with improved logic
-                elif (keyword.lower() in skill.lower() or skill.lower() in keyword.lower()) and \
-                     (len(keyword) > 3 and len(skill) > 3):  # Avoid matching on very short terms
-                    partial_match = True
+        resume_file = request.files['resume']
+        if resume_file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
             
-            if not exact_match and partial_match:
-                partial_matches += 1
+        # Check file format
+        allowed_extensions = {'pdf', 'doc', 'docx'}
+        if not resume_file.filename.lower().endswith(tuple('.' + ext for ext in allowed_extensions)):
+            return jsonify({'error': 'File must be PDF, DOC, or DOCX'}), 400
         
-        # Calculate relevance score with more weight to exact matches
-        if job_keywords:
-            # Improved scoring formula
-            exact_match_score = (len(matching_keywords) / max(1, len(job_keywords))) * 25  # 25% for exact matches
-            partial_match_score = (partial_matches / max(1, len(job_keywords))) * 5  # 5% for partial matches
-            
-            # Bonus points for high match percentage
-            match_percentage = (len(matching_keywords) + (partial_matches * 0.5)) / max(1, len(job_keywords))
-            if match_percentage > 0.7:  # If more than 70% of keywords match
-                bonus_points = 5
-                logger.info(f"High keyword match percentage ({match_percentage:.1%}): +{bonus_points} bonus points")
+        # Job descriptions: repeated jobDescriptions fields, or one field holding a JSON
+        # list of strings or {"title": ..., "description": ...} objects
+        job_descriptions = request.form.getlist('jobDescriptions')
+        if len(job_descriptions) == 1 and job_descriptions[0].lstrip().startswith('['):
+            try:
+                job_descriptions = json.loads(job_descriptions[0])
+            except ValueError:
+                return jsonify({'error': 'jobDescriptions is not valid JSON'}), 400
+        jobs = []
+        for item in job_descriptions:
+            if isinstance(item, dict):
+                jobs.append({'title': str(item.get('title') or ''), 'description': str(item.get('description') or '')})
             else:
-                bonus_points = 0
-                
-            relevance_score = exact_match_score + partial_match_score + bonus_points
-            logger.info(f"Job relevance: {len(matching_keywords)} exact matches, {partial_matches} partial matches, score: {relevance_score}")
-        else:
-            relevance_score = 15  # Default middle score if no keywords found
-            logger.info("No job keywords found, using default relevance score: 15")
-    else:
-        relevance_score = 15  # Default middle score if no job description
-        logger.info("No job description provided, using default relevance score: 15")
-    
-    # Calculate total score with improved weighting
-    total_score = format_score + content_score + keyword_score + relevance_score
-    logger.info(f"Raw score components: format={format_score}, content={content_score}, keyword={keyword_score}, relevance={relevance_score}")
-    logger.info(f"Total raw score: {total_score}")
-    
-    # Add some randomness to make scores more realistic (±2 points) - reduced randomness for more consistency
-    import random
-    random_factor = random.uniform(-2, 2)
-    total_score += random_factor
-    logger.info(f"Added randomness factor of {random_factor:.2f}")
-    
-    # Normalize to 0-100 with a more realistic range
-    # Most ATS systems reject below 70%, so we use a 65-98 range
-    normalized_score = min(98, max(65, total_score))  # Keep scores in realistic range (65-98)
-    logger.info(f"Final normalized ATS score: {int(normalized_score)}")
-    
-    return int(normalized_score)
-    
-# Helper function to extract keywords from text
-def extract_keywords(text):
-    # This is a simplified keyword extraction - in a real app, you'd use NLP
-    words = text.lower().split()
-    stopwords = {'and', 'the', 'is', 'in', 'of', 'to', 'a', 'for', 'with', 'on', 'at'}
-    keywords = [word for word in words if word not in stopwords and len(word) > 3]
-    return list(set(keywords))
-    
-# Helper function to get missing skills
-def get_missing_skills(resume_skills, job_description):
-    if not job_description:
-        return []
-        
-    # Extract potential required skills from job description
-    job_keywords = extract_keywords(job_description)
-    common_job_skills = ['python', 'java', 'javascript', 'sql', 'react', 'node', 'agile', 'aws', 
-                         'cloud', 'data', 'analysis', 'management', 'communication', 'leadership']
-                         
-    # Filter job keywords to focus on likely skills
-    potential_skills = [keyword for keyword in job_keywords 
-                      if keyword in common_job_skills or keyword.title() in common_job_skills]
-                      
-    # Find skills in job description missing from resume
-    resume_skills_lower = [skill.lower() for skill in resume_skills]
-    missing_skills = [skill for skill in potential_skills 
-                     if not any(skill in rs or rs in skill for rs in resume_skills_lower)]
-    
-    return missing_skills
-# Helper function to generate improvement suggestions
-def generate_improvements(resume_data, job_description):
-    """Generate specific, actionable improvement suggestions for the resume"""
-    improvements = []
-    
-    # Check for proper sections
-    sections = resume_data.get('sections', {})
-    if not sections.get('summary', False) and 'summary' not in resume_data:
-        improvements.append('Add a professional summary at the top of your resume that highlights your key qualifications')
-        
-    if not sections.get('skills', False) and 'skills' not in resume_data:
-        improvements.append('Add a dedicated skills section that clearly lists your technical and soft skills')
-    
-    # Check for content quality
-    experience = resume_data.get('experience_text', '')
-    if not any(char.isdigit() for char in experience):
-        improvements.append('Include measurable achievements with numbers in your experience section (e.g., "increased sales by 25%")')
-        
-    action_verbs = ['managed', 'developed', 'created', 'implemented', 'designed', 'led', 'built', 'achieved', 'improved', 'increased']
-    if not any(verb in experience.lower() for verb in action_verbs):
-        improvements.append('Start each bullet point in your experience section with strong action verbs like "Developed," "Implemented," or "Managed"')
-    
-    # Check for formatting issues
-    if resume_data.get('has_tables', False):
-        improvements.append('Remove tables from your resume as they can confuse ATS systems - use simple bullet points instead')
+                jobs.append({'title': '', 'description': str(item)})
+        if not jobs:
+            return jsonify({'error': 'No job descriptions provided'}), 400
+        if len(jobs) > MAX_BATCH_JOB_DESCRIPTIONS:
+            return jsonify({'error': f'At most {MAX_BATCH_JOB_DESCRIPTIONS} job descriptions per request'}), 400
         
-    if not resume_data.get('has_bullet_points', True):
-        improvements.append('Use bullet points to format your experience and skills sections for better ATS readability')
-    
-    # Check for contact information
-    if resume_data.get('email', 'Not found') == 'Not found':
-        improvements.append('Add your email address to your contact information section')
+        # Save and parse the resume once for every job description
+        temp_dir = os.path.join(os.getcwd(), 'temp')
+        os.makedirs(temp_dir, exist_ok=True)
+        temp_path = os.path.join(temp_dir, secure_filename(resume_file.filename))
+        resume_file.save(temp_path)
+        resume_data, _ = extract_resume_for_ats(temp_path)
+        
+        ranked = rank_job_descriptions(resume_data, [job['description'] for job in jobs],
+                                       use_extracted_scores=enhanced_extraction_available)
+        results = [{
+            'index': result['index'],
+            'title': jobs[result['index']]['title'],
+            'score': result['score'],
+            'keywordMatches': {
+                'exact': result['exact_matches'],
+                'partial': result['partial_matches'],
+                'total': result['keyword_count']
+            },
+            'missing': result['missing_skills']
+        } for result in ranked]
         
-    if resume_data.get('phone', 'Not found') == 'Not found':
-        improvements.append('Add your phone number to your contact information section')
-    
-    # Check for skills
-    skills = resume_data.get('skills', [])
-    if len(skills) < 8:
-        improvements.append('Add more relevant skills to your resume - aim for at least 10-15 key skills')
-    
-    # Job-specific improvements
-    if job_description:
-        missing_skills = get_missing_skills(skills, job_description)
-        if missing_skills:
-            # Limit to top 5 missing skills for readability
-            top_missing = missing_skills[:5]
-            improvements.append(f'Add these key skills from the job description: {", ".join(top_missing)}')
-            
-        # Check for job title match
-        job_title_match = False
-        job_keywords = extract_keywords(job_description)
-        resume_job_role = resume_data.get('job_role', 'Unknown')
+        logger.info(f"Scored resume against {len(jobs)} job descriptions")
+        return jsonify({
+            'name': resume_data.get('name', 'Not detected'),
+            'keywords': {'found': resume_data.get('skills', [])},
+            'results': results
+        })
         
-        for keyword in job_keywords:
-            if keyword.lower() in resume_job_role.lower():
-                job_title_match = True
-                break
-                
-        if not job_title_match and resume_job_role != 'Unknown':
-            improvements.append('Consider aligning your job title/objective with the target position in the job description')
-    
-    # Education improvements
-    if 'education' in resume_data and resume_data['education'] == 'Unknown':
-        improvements.append('Clearly state your degree and education details in a dedicated education section')
-    
-    # Prioritize and return top 6 improvements
-    return improvements[:6]
-
-# Helper function to generate key findings
-def generate_key_findings(resume_data, score, job_description):
-    """Generate detailed key findings about the resume's ATS compatibility with more relevant insights"""
-    findings = []
-    logger.info(f"Generating key findings with resume data keys: {resume_data.keys()}")
-    
-    # Score-based findings - more specific and actionable
-    if score < 70:
-        findings.append({'type': 'warning', 'text': f'Your resume scored {score}%, which is below the typical 75% threshold used by many ATS systems. Major improvements are needed.'})
-    elif score < 80:
-        findings.append({'type': 'info', 'text': f'Your resume scored {score}%, which is in the borderline range. Several improvements could help you pass more ATS screenings.'})
-    elif score < 90:
-        findings.append({'type': 'info', 'text': f'Your resume scored {score}%, which is good but not excellent. Some targeted improvements would maximize your chances.'})
-    else:
-        findings.append({'type': 'success', 'text': f'Your resume scored an excellent {score}%. It is highly optimized for ATS systems and should perform well in automated screening.'})
-    
-    # Section findings - improved detection logic
-    sections = resume_data.get('sections', {})
-    missing_sections = []
-    
-    # More comprehensive section detection
-    # Check for summary section - multiple ways it could be represented
-    has_summary = False
-    summary_indicators = ['summary', 'profile', 'objective', 'about']
-    
-    # Check in sections dictionary
-    if any(sections.get(key, False) for key in summary_indicators):
-        has_summary = True
-    
-    # Check in resume_data keys
-    if any(key in resume_data for key in summary_indicators):
-        has_summary = True
-    
-    # Check in raw text if available
-    if 'raw_text' in resume_data:
-        raw_text = resume_data['raw_text'].lower()
-        if any(f"{indicator}:" in raw_text or f"{indicator}\n" in raw_text for indicator in summary_indicators):
-            has_summary = True
-    
-    if not has_summary:
-        missing_sections.append('professional summary')
-        findings.append({'type': 'warning', 'text': 'Missing professional summary section. Adding a 3-5 line summary at the top with key qualifications will improve ATS recognition by 15-20%.'})
-    else:
-        findings.append({'type': 'success', 'text': 'Professional summary detected. This section helps ATS systems quickly categorize your profile and match you to relevant positions.'})
-    
-    # Check for skills section - multiple ways it could be represented
-    has_skills = False
-    
-    # Check in sections dictionary
-    if sections.get('skills', False):
-        has_skills = True
-    
-    # Check if skills list exists and has items
-    if isinstance(resume_data.get('skills'), list) and len(resume_data.get('skills', [])) > 0:
-        has_skills = True
-        logger.info(f"Skills found: {resume_data.get('skills')}")
-    
-    # Check in raw text if available
-    if 'raw_text' in resume_data:
-        raw_text = resume_data['raw_text'].lower()
-        if 'skills:' in raw_text or 'skills\n' in raw_text or 'technical skills' in raw_text or 'core competencies' in raw_text:
-            has_skills = True
-    
-    if not has_skills:
-        missing_sections.append('skills')
-        findings.append({'type': 'warning', 'text': 'Missing dedicated skills section. ATS systems heavily weight keyword matching - adding a clear skills section can improve your match rate by 25-30%.'})
-    else:
-        # Check if there are enough skills
-        skills = resume_data.get('skills', [])
-        if len(skills) < 8:
-            findings.append({'type': 'info', 'text': f'Skills section detected but only contains {len(skills)} skills. Expanding to 12-15 relevant skills would improve ATS matching.'})
-        else:
-            findings.append({'type': 'success', 'text': f'Strong skills section with {len(skills)} skills detected. This significantly improves your keyword matching in ATS systems.'})
-    
-    # Check for experience section - multiple ways it could be represented
-    has_experience = False
-    experience_indicators = ['experience', 'employment', 'work history', 'professional experience', 'career']
-    
-    # Check in sections dictionary
-    if any(sections.get(key, False) for key in ['experience', 'work_experience', 'employment']):
-        has_experience = True
-        logger.info("Experience section found in sections dictionary")
-    
-    # Check if experience list exists
-    if isinstance(resume_data.get('experience'), list) and len(resume_data.get('experience', [])) > 0:
-        has_experience = True
-        logger.info(f"Experience list found with {len(resume_data.get('experience'))} entries")
-    
-    # Check if experience_text exists and has content
-    if resume_data.get('experience_text') and len(resume_data.get('experience_text', '')) > 20:
-        has_experience = True
-        logger.info("Experience text found")
-    
-    # Check for experience years
-    if resume_data.get('experience_years', 0) > 0:
-        has_experience = True
-        logger.info(f"Experience years found: {resume_data.get('experience_years')}")
-    
-    # Check in raw text if available
-    if 'raw_text' in resume_data:
-        raw_text = resume_data['raw_text'].lower()
-        if any(f"{indicator}:" in raw_text or f"{indicator}\n" in raw_text for indicator in experience_indicators):
-            has_experience = True
-            logger.info("Experience section found in raw text")
-    
-    # Check for measurable results and action verbs in experience
-    experience = resume_data.get('experience_text', '')
-    has_measurable = any(re.search(r'\d+%|\d+\s*million|\$\d+|increased|decreased|improved|reduced|\d+\s*people', experience, re.IGNORECASE)) if experience else False
-    
-    action_verbs = ['managed', 'developed', 'created', 'implemented', 'designed', 'led', 'built', 'achieved', 'improved', 'increased']
-    has_action_verbs = any(verb in experience.lower() for verb in action_verbs) if experience else False
-    
-    if not has_experience:
-        missing_sections.append('work experience')
-        findings.append({'type': 'warning', 'text': 'Missing clear work experience section. This is the most critical section for ATS evaluation and recruiter review.'})
-    else:
-        if not has_measurable and experience:
-            findings.append({'type': 'info', 'text': 'Your experience section lacks quantifiable achievements. Adding 2-3 metrics per role (e.g., "increased sales by 25%") can improve ATS scoring by 15-20%.'})
-        elif has_measurable:
-            findings.append({'type': 'success', 'text': 'Quantifiable achievements detected in your experience section. This significantly improves how ATS systems and recruiters evaluate your impact.'})
-            
-        if not has_action_verbs and experience:
-            findings.append({'type': 'info', 'text': 'Your experience section lacks strong action verbs. Starting bullets with words like "Developed" or "Implemented" helps ATS identify your contributions.'})
-        elif has_action_verbs:
-            findings.append({'type': 'success', 'text': 'Strong action verbs detected in your experience section. This helps ATS systems properly categorize your accomplishments.'})
-    
-    # Check for education section - multiple ways it could be represented
-    has_education = False
-    education_indicators = ['education', 'academic', 'degree', 'university', 'college', 'school']
-    
-    # Check in sections dictionary
-    if any(sections.get(key, False) for key in ['education', 'academic', 'qualifications']):
-        has_education = True
-        logger.info("Education section found in sections dictionary")
-    
-    # Check if education list exists
-    if isinstance(resume_data.get('education'), list) and len(resume_data.get('education', [])) > 0:
-        has_education = True
-        logger.info(f"Education list found with {len(resume_data.get('education'))} entries")
-    
-    # Check if education string exists and is not 'Unknown'
-    if isinstance(resume_data.get('education'), str) and resume_data.get('education') != 'Unknown':
-        has_education = True
-        logger.info(f"Education string found: {resume_data.get('education')}")
-    
-    # Check in raw text if available
-    if 'raw_text' in resume_data:
-        raw_text = resume_data['raw_text'].lower()
-        if any(f"{indicator}:" in raw_text or f"{indicator}\n" in raw_text for indicator in education_indicators):
-            has_education = True
-            logger.info("Education section found in raw text")
-        # Check for common degree keywords
-        degree_keywords = ['bachelor', 'master', 'phd', 'mba', 'bs', 'ba', 'ms', 'b.s.', 'b.a.', 'm.s.', 'ph.d']
-        if any(keyword in raw_text for keyword in degree_keywords):
-            has_education = True
-            logger.info("Education degree keywords found in raw text")
-    
-    if not has_education:
-        missing_sections.append('education')
-        findings.append({'type': 'warning', 'text': 'Missing education section. Even if you have limited formal education, include this section as 90% of ATS systems look for it.'})
-    else:
-        # Check education level
-        education = resume_data.get('education', 'Unknown')
-        if education == 'Unknown':
-            findings.append({'type': 'info', 'text': 'Education section detected but degree level is unclear. Explicitly state your degree (e.g., "Bachelor of Science") for better ATS recognition.'})
-        elif education in ['PhD', 'Masters']:
-            findings.append({'type': 'success', 'text': f'Advanced degree ({education}) detected. This is valuable for many positions and properly formatted for ATS recognition.'})
-        else:
-            findings.append({'type': 'success', 'text': 'Education section properly detected and formatted for ATS systems.'})
-    
-    # Format findings
-    if resume_data.get('has_tables', False):
-        findings.append({'type': 'warning', 'text': 'Tables detected in your resume. These confuse 80% of ATS systems - replace with simple bullet points and clear section headers.'})
-    
-    if not resume_data.get('has_bullet_points', True):
-        findings.append({'type': 'info', 'text': 'No bullet points detected. Using 3-5 bullet points per role improves ATS readability by approximately 25%.'})
-    
-    # Contact information findings
-    if resume_data.get('email', 'Not found') == 'Not found':
-        findings.append({'type': 'warning', 'text': 'No email address detected. This is required by 100% of ATS systems and should be clearly visible at the top of your resume.'})
-    
-    if resume_data.get('phone', 'Not found') == 'Not found':
-        findings.append({'type': 'warning', 'text': 'No phone number detected. This is required by 95% of ATS systems and should be clearly visible at the top of your resume.'})
-    
-    # Job-specific findings - more detailed and actionable
-    if job_description:
-        missing_skills = get_missing_skills(skills, job_description)
-        if missing_skills:
-            if len(missing_skills) > 5:
-                findings.append({'type': 'warning', 'text': f'Your resume is missing {len(missing_skills)} keywords from the job description. Top missing skills: {", ".join(missing_skills[:5])}.'})
-                findings.append({'type': 'info', 'text': 'Adding these missing keywords could improve your ATS match rate by 30-40% for this specific job.'})
-            else:
-                findings.append({'type': 'info', 'text': f'Your resume is missing a few keywords from the job description: {", ".join(missing_skills)}. Adding these could improve your match.'})
-        else:
-            findings.append({'type': 'success', 'text': 'Excellent keyword match with the job description! Your resume contains most or all of the key terms the employer is looking for.'})
-    
-    # Summary of section completeness
-    if missing_sections and len(missing_sections) > 1:
-        findings.append({'type': 'warning', 'text': f'Your resume is missing {len(missing_sections)} key sections: {', '.join(missing_sections)}. Adding these would significantly improve ATS compatibility.'})
-    elif len(missing_sections) == 1:
-        findings.append({'type': 'info', 'text': f'Your resume is only missing the {missing_sections[0]} section. Adding this would complete your ATS-friendly resume structure.'})
-    elif len(missing_sections) == 0:
-        findings.append({'type': 'success', 'text': 'Your resume contains all essential sections required by ATS systems. This provides a strong foundation for successful screening.'})
-    
-    # Prioritize findings - most important first
-    # Sort by type (warning first, then info, then success) and limit to most important
-    priority_order = {'warning': 0, 'info': 1, 'success': 2}
-    findings.sort(key=lambda x: priority_order.get(x['type'], 3))
-    
-    return findings[:10]  # Return top 10 most important findings
+    except Exception as e:
+        logger.error(f"Error in batch resume analysis: {str(e)}")
+        return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
+    finally:
+        # Clean up temp file
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
 
 # Resume Parsing API
 @app.route('/api/resume/parse', methods=['POST'])
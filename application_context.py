@@ -0,0 +1,185 @@
+"""
+Application Context Module for Berojgar
+
+This module holds what the answer generator needs to know about one
+application: the parsed resume facts and the job facts (title, skills,
+description, company). The context is built once per form fill, so the job
+page is downloaded and parsed once rather than once per question. Generated
+answers are cached by question category, normalized question text and hashes
+of the resume and job facts, so repeated and near-identical questions across
+forms and jobs are answered from the cache.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+# Categories whose answers do not depend on the job, so they are shared across jobs
+JOB_INDEPENDENT_CATEGORIES = frozenset(['website_url', 'college_name'])
+
+MAX_CACHED_ANSWERS = 2048
+
+_NON_WORD = re.compile(r'[^a-z0-9 ]+')
+
+
+def _facts_hash(facts):
+    payload = json.dumps(facts, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def company_from_url(url):
+    """
+    Guess a company name from a job URL's domain
+
+    Args:
+        url (str): Job page URL
+
+    Returns:
+        str: Capitalized first domain label, or '' if there is none
+    """
+    domain = urlparse(url).netloc
+    if 'www.' in domain:
+        domain = domain.split('www.')[1]
+    return domain.split('.')[0].capitalize() if '.' in domain else ''
+
+
+def normalize_question(question):
+    """
+    Normalize question text for cache lookups
+
+    Case, punctuation (including required-field asterisks) and runs of
+    whitespace are ignored.
+
+    Args:
+        question (str): Question text
+
+    Returns:
+        str: Normalized question
+    """
+    return ' '.join(_NON_WORD.sub(' ', question.lower()).split())
+
+
+class ApplicationContext:
+    """Parsed resume and job facts for one application"""
+
+    def __init__(self, resume_data, job_description=None):
+        """
+        Initialize the context
+
+        Args:
+            resume_data (dict): Parsed resume data
+            job_description (str or dict): Extracted job data, job page URL or description text
+        """
+        self.resume_data = resume_data or {}
+
+        # Resume facts
+        self.name = self.resume_data.get('Name', self.resume_data.get('name', ''))
+        skills = self.resume_data.get('Skills', self.resume_data.get('skills', []))
+        if not isinstance(skills, list):
+            skills = [s.strip() for s in str(skills).split(',')]
+        self.skills = skills
+        try:
+            self.experience_years = int(self.resume_data.get('Experience', self.resume_data.get('experience', 0)))
+        except (TypeError, ValueError):
+            self.experience_years = 0
+        self.education = self.resume_data.get('Education', self.resume_data.get('education', ''))
+
+        # Job facts
+        self.job_desc_text = ""
+        self.job_skills = []
+        self.job_title = ""
+        self.company_name = ""
+
+        if isinstance(job_description, dict):
+            self._set_job_facts(job_description)
+        elif isinstance(job_description, str) and job_description.startswith(('http://', 'https://')):
+            try:
+                from job_description_extractor import extract_job_description
+                self._set_job_facts(extract_job_description(job_description))
+            except Exception as e:
+                print(f"[DEBUG] Error extracting job description: {e}")
+            self.company_name = self.company_name or company_from_url(job_description)
+        elif isinstance(job_description, str):
+            self.job_desc_text = job_description
+
+        self.resume_hash = _facts_hash([self.name, self.skills, self.experience_years, self.education])
+        self.job_hash = _facts_hash([self.job_title, self.company_name, self.job_skills, self.job_desc_text])
+
+    def _set_job_facts(self, job_data):
+        self.job_desc_text = job_data.get('description', '')
+        self.job_skills = job_data.get('Required_Skills', [])
+        self.job_title = job_data.get('Role', '')
+        self.company_name = job_data.get('company', '')
+
+
+class AnswerCache:
+    """Thread-safe LRU cache of generated answers"""
+
+    def __init__(self, max_entries=MAX_CACHED_ANSWERS):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries (int): Maximum number of cached answers
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._answers = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(category, question, context):
+        """
+        Build the cache key for a question in an application context
+
+        Args:
+            category (str): Question category
+            question (str): Question text
+            context (ApplicationContext): Application context
+
+        Returns:
+            tuple: (category, normalized question, resume hash, job hash)
+        """
+        job_hash = None if category in JOB_INDEPENDENT_CATEGORIES else context.job_hash
+        return (category, normalize_question(question), context.resume_hash, job_hash)
+
+    def get(self, key):
+        """
+        Get a cached answer
+
+        Args:
+            key (tuple): Key from AnswerCache.key()
+
+        Returns:
+            str: Cached answer, or None
+        """
+        with self._lock:
+            answer = self._answers.get(key)
+            if answer is None:
+                self.misses += 1
+                return None
+            self._answers.move_to_end(key)
+            self.hits += 1
+            return answer
+
+    def put(self, key, answer):
+        """
+        Cache an answer
+
+        Args:
+            key (tuple): Key from AnswerCache.key()
+            answer (str): Generated answer
+        """
+        with self._lock:
+            self._answers[key] = answer
+            self._answers.move_to_end(key)
+            while len(self._answers) > self.max_entries:
+                self._answers.popitem(last=False)
+
+
+# Process-wide answer cache, shared by single and batch form fills
+answer_cache = AnswerCache()
@@ -0,0 +1,169 @@
+"""
+Async HTTP Module for Berojgar
+
+This module provides a shared aiohttp client (one connection pool with
+keep-alive and timeouts) for the job source adapters, plus a small bridge that
+runs coroutines on a long-lived background event loop so synchronous code such
+as the Flask routes can call the async adapters.
+"""
+
+import asyncio
+import logging
+import threading
+
+from rate_limiter import get_limiter
+
+try:
+    import aiohttp
+    async_http_available = True
+except ImportError:
+    aiohttp = None
+    async_http_available = False
+
+logger = logging.getLogger("async_http")
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+class AsyncHttpClient:
+    """Lazily created aiohttp session with a bounded, keep-alive connection pool"""
+
+    def __init__(self, max_connections=100, max_per_host=20, keepalive_timeout=30,
+                 total_timeout=20, connect_timeout=5, headers=None):
+        """
+        Initialize the client
+
+        Args:
+            max_connections (int): Total pooled connections
+            max_per_host (int): Pooled connections per upstream host
+            keepalive_timeout (int): Seconds idle connections are kept open
+            total_timeout (int): Overall timeout per request in seconds
+            connect_timeout (int): Connection timeout in seconds
+            headers (dict): Default request headers
+        """
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.total_timeout = total_timeout
+        self.connect_timeout = connect_timeout
+        self.headers = headers or DEFAULT_HEADERS
+        self._sessions = {}  # event loop -> ClientSession
+
+    def _session(self):
+        # aiohttp sessions are bound to the loop they were created on
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            timeout = aiohttp.ClientTimeout(total=self.total_timeout, connect=self.connect_timeout)
+            session = aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers)
+            self._sessions[loop] = session
+        return session
+
+    async def _get(self, url, params, source, read):
+        session = self._session()
+        if source is None:
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                return await read(response)
+
+        async with get_limiter(source).slot_async() as slot:
+            async with session.get(url, params=params) as response:
+                slot.record_response(response)
+                response.raise_for_status()
+                return await read(response)
+
+    async def get_json(self, url, params=None, source=None):
+        """
+        GET a URL and decode its JSON body
+
+        Args:
+            url (str): Request URL
+            params (dict): Query parameters
+            source (str): Source name for rate limiting (None = not rate limited)
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            aiohttp.ClientError: On connection errors or non-2xx responses
+            RateLimitTimeout: If the source's rate limit slot could not be acquired
+        """
+        return await self._get(url, params, source, lambda response: response.json(content_type=None))
+
+    async def get_text(self, url, params=None, source=None):
+        """
+        GET a URL and return its body as text
+
+        Args:
+            url (str): Request URL
+            params (dict): Query parameters
+            source (str): Source name for rate limiting (None = not rate limited)
+
+        Returns:
+            str: Response body
+
+        Raises:
+            aiohttp.ClientError: On connection errors or non-2xx responses
+            RateLimitTimeout: If the source's rate limit slot could not be acquired
+        """
+        return await self._get(url, params, source, lambda response: response.text())
+
+    async def close(self):
+        """Close the session belonging to the running event loop"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+# Process-wide client shared by all source adapters
+shared_http_client = AsyncHttpClient()
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop():
+    """
+    Get the process-wide background event loop, starting it on first use
+
+    Returns:
+        asyncio.AbstractEventLoop: Running event loop owned by a daemon thread
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="async-http-loop", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def run_sync(coro, timeout=None):
+    """
+    Run a coroutine on the background event loop and wait for its result
+
+    Using one long-lived loop keeps the shared connection pool warm across
+    calls from different request threads.
+
+    Args:
+        coro: Coroutine to run
+        timeout (float): Seconds to wait for the result (None = no limit)
+
+    Returns:
+        The coroutine's result
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    try:
+        return future.result(timeout)
+    except Exception:
+        future.cancel()
+        raise
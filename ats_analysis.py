@@ -0,0 +1,957 @@
+"""
+ATS Analysis Module for Berojgar
+
+This module scores a parsed resume for ATS compatibility. One analysis pass
+reads the resume data and job description and builds an immutable
+ResumeFeatures object (normalized text views, section flags, keyword sets and
+counts); the score, key findings, improvement suggestions and format/content
+summaries are all computed from that object instead of re-scanning the resume
+in each step.
+
+Scores are deterministic by default: the small "realism" jitter is seeded
+from a hash of the resume and job description, so identical inputs always
+score the same and finished analyses can be cached by content hash.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from keyword_extraction import keyword_extractor
+from question_classifier import KeywordMatcher
+
+logger = logging.getLogger("ats_analysis")
+
+# Bump whenever scoring or the analysis response changes, so cached results are not reused
+SCORER_VERSION = 4
+
+# Score jitter: 'seeded' (±2 seeded by content hash), 'none' (no jitter) or 'random' (±2, unseeded)
+SCORING_MODES = ('seeded', 'none', 'random')
+ATS_SCORING_MODE = os.environ.get('ATS_SCORING_MODE', 'seeded')
+if ATS_SCORING_MODE not in SCORING_MODES:
+    logger.warning(f"Unknown ATS_SCORING_MODE {ATS_SCORING_MODE!r}, using 'seeded'")
+    ATS_SCORING_MODE = 'seeded'
+
+MAX_CACHED_RESULTS = 256
+
+SUMMARY_INDICATORS = ('summary', 'profile', 'objective', 'about')
+EXPERIENCE_INDICATORS = ('experience', 'employment', 'work history', 'professional experience', 'career')
+EDUCATION_INDICATORS = ('education', 'academic', 'degree', 'university', 'college', 'school')
+SKILLS_PHRASES = ('skills:', 'skills\n', 'technical skills', 'core competencies')
+DEGREE_KEYWORDS = ('bachelor', 'master', 'phd', 'mba', 'bs', 'ba', 'ms', 'b.s.', 'b.a.', 'm.s.', 'ph.d')
+
+# Action verbs, from the short list every check uses to the full list the score counts
+BASIC_ACTION_VERBS = ('managed', 'developed', 'created', 'implemented', 'designed', 'led', 'built')
+COMMON_ACTION_VERBS = BASIC_ACTION_VERBS + ('achieved', 'improved', 'increased')
+ACTION_VERBS = COMMON_ACTION_VERBS + (
+    'decreased', 'reduced', 'negotiated',
+    'coordinated', 'established', 'delivered', 'generated', 'maintained',
+    'supervised', 'trained', 'analyzed', 'launched', 'executed', 'streamlined',
+    'optimized', 'transformed', 'spearheaded', 'orchestrated', 'pioneered',
+    'formulated', 'cultivated', 'directed', 'revitalized', 'maximized',
+    'facilitated', 'guided', 'mentored', 'innovated', 'programmed', 'engineered'
+)
+
+MEASURABLE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\d+%', r'\d+\s*percent', r'increased\s+by\s+\d+', r'decreased\s+by\s+\d+',
+    r'\$\d+', r'\d+\s*million', r'\d+\s*billion', r'\d+\s*thousand',
+    r'improved\s+\w+\s+by\s+\d+', r'reduced\s+\w+\s+by\s+\d+',
+    r'\d+\s+users', r'\d+\s+customers', r'\d+\s+clients', r'\d+\s+projects'
+)]
+IMPACT_PATTERN = re.compile(r'\d+%|\d+\s*million|\$\d+|increased|decreased|improved|reduced|\d+\s*people', re.IGNORECASE)
+
+INDUSTRY_TERMS = (
+    'agile', 'scrum', 'kanban', 'waterfall', 'lean', 'six sigma',
+    'cloud', 'aws', 'azure', 'gcp', 'devops', 'ci/cd', 'docker', 'kubernetes',
+    'frontend', 'backend', 'fullstack', 'web', 'mobile', 'desktop', 'api',
+    'database', 'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'oracle',
+    'machine learning', 'ai', 'artificial intelligence', 'data science', 'big data',
+    'analytics', 'business intelligence', 'visualization', 'tableau', 'power bi',
+    'security', 'cybersecurity', 'networking', 'infrastructure', 'architecture',
+    'project management', 'product management', 'scrum master', 'product owner'
+)
+
+# Section headings looked for in the raw text ("summary:" or "summary" on its own line)
+_HEADING_PROBES = {
+    indicator + suffix: section
+    for section, indicators in (('summary', SUMMARY_INDICATORS), ('experience', EXPERIENCE_INDICATORS),
+                                ('education', EDUCATION_INDICATORS))
+    for indicator in indicators
+    for suffix in (':', '\n')
+}
+_RAW_TEXT_MATCHER = KeywordMatcher(list(_HEADING_PROBES) + list(SKILLS_PHRASES) + list(DEGREE_KEYWORDS))
+_ACTION_VERB_MATCHER = KeywordMatcher(ACTION_VERBS)
+_INDUSTRY_TERM_MATCHER = KeywordMatcher(INDUSTRY_TERMS)
+
+
+def content_hash(value):
+    """
+    Hash resume or job content for seeding and cache keys
+
+    Args:
+        value (bytes, str or dict): File contents, text or parsed data
+
+    Returns:
+        str: Hex SHA-256 digest; dicts are hashed by their sorted JSON form
+    """
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    elif not isinstance(value, (bytes, bytearray)):
+        value = json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(value).hexdigest()
+
+
+def extract_keywords(text):
+    """
+    Extract the highest TF-IDF weighted keywords (1-3 word phrases) from a job description
+
+    Args:
+        text (str): Job description
+
+    Returns:
+        list: Distinct lower-case keywords, highest weight first
+    """
+    return list(keyword_extractor.extract(text).keywords)
+
+
+def get_missing_skills(resume_skills, job_description, job_skills=None):
+    """
+    Find the skills the job description asks for that the resume lacks
+
+    Args:
+        resume_skills (list): Skills from the resume
+        job_description (str): Job description
+        job_skills (list): Skills already extracted from job_description
+
+    Returns:
+        list: Missing skills, in order of first mention
+    """
+    if not job_description:
+        return []
+
+    if job_skills is None:
+        job_skills = keyword_extractor.extract(job_description).skills
+
+    resume_skills_lower = [skill.lower() for skill in resume_skills if skill]
+    return [skill for skill in job_skills
+            if not any(skill in rs or rs in skill for rs in resume_skills_lower)]
+
+
+def job_relevance_keywords(job_description, job_keywords):
+    """Job keywords plus the industry terms in the job description that did not make the keyword cut"""
+    relevance_keywords = list(job_keywords)
+    if job_description:
+        industry_terms = _INDUSTRY_TERM_MATCHER.find(job_description.lower())
+        keywords_lower = {k.lower() for k in relevance_keywords}
+        relevance_keywords.extend(term for term in INDUSTRY_TERMS if term in industry_terms and term not in keywords_lower)
+    return relevance_keywords
+
+
+@dataclass(frozen=True)
+class ResumeFeatures:
+    """Everything the ATS checks need to know about one resume and job description"""
+
+    # Normalized text views
+    raw_text: str
+    experience_text: str
+    job_description: str
+
+    # Section flags
+    has_summary: bool
+    has_experience_section: bool
+    has_education: bool
+    has_skills_section: bool
+    has_degree_keyword: bool
+
+    # Resume facts
+    skills: tuple
+    experience_years: float
+    education: object
+    email: str
+    phone: str
+    job_role: str
+    word_count: int
+    has_bullet_points: bool
+    has_dates: bool
+    has_tables: bool
+    has_images: bool
+    extracted_scores: object  # (format, content, keyword_density) from enhanced extraction, or None
+
+    # Experience content
+    action_verbs: frozenset
+    measurable_matches: int
+    has_impact_statement: bool
+    has_digits: bool
+
+    # Job match
+    job_keywords: tuple
+    relevance_keywords: tuple
+    missing_skills: tuple
+    job_title_match: bool
+
+    # Hash of the resume data and job description, seeds the score jitter
+    content_hash: str
+
+    @property
+    def has_experience(self):
+        """Experience section found, or years of experience extracted"""
+        return self.has_experience_section or self.experience_years > 0
+
+    @property
+    def lacks_bullet_points(self):
+        """Extraction reported that the resume has no bullet points"""
+        return self.has_bullet_points is not None and not self.has_bullet_points
+
+    def uses_action_verbs(self, verbs=COMMON_ACTION_VERBS):
+        return any(verb in self.action_verbs for verb in verbs)
+
+
+def experience_content_features(experience_text):
+    """
+    Get the features read from the experience text
+
+    Args:
+        experience_text (str): Experience section text
+
+    Returns:
+        dict: action_verbs, measurable_matches, has_impact_statement and has_digits
+    """
+    return {
+        'action_verbs': frozenset(_ACTION_VERB_MATCHER.find(experience_text.lower())),
+        'measurable_matches': sum(len(pattern.findall(experience_text)) for pattern in MEASURABLE_PATTERNS),
+        'has_impact_statement': bool(IMPACT_PATTERN.search(experience_text)),
+        'has_digits': any(char.isdigit() for char in experience_text),
+    }
+
+
+def analyze_resume_features(resume_data, job_description=''):
+    """
+    Run the single analysis pass over a resume and job description
+
+    Args:
+        resume_data (dict): Parsed resume data
+        job_description (str): Job description ('' if none)
+
+    Returns:
+        ResumeFeatures: Immutable feature object
+    """
+    sections = resume_data.get('sections', {}) or {}
+    raw_text = (resume_data.get('raw_text') or '').lower()
+    raw_found = _RAW_TEXT_MATCHER.find(raw_text) if raw_text else set()
+    raw_headings = {_HEADING_PROBES[probe] for probe in raw_found if probe in _HEADING_PROBES}
+
+    experience_text = resume_data.get('experience_text', '') or ''
+
+    has_summary = (any(sections.get(key, False) for key in SUMMARY_INDICATORS)
+                   or any(key in resume_data for key in SUMMARY_INDICATORS)
+                   or 'summary' in raw_headings)
+
+    experience = resume_data.get('experience')
+    has_experience_section = (any(sections.get(key, False) for key in ['experience', 'work_experience', 'employment'])
+                              or (isinstance(experience, list) and len(experience) > 0)
+                              or len(experience_text) > 20
+                              or 'experience' in raw_headings)
+
+    education = resume_data.get('education', '')
+    has_degree_keyword = any(keyword in raw_found for keyword in DEGREE_KEYWORDS)
+    has_education = (any(sections.get(key, False) for key in ['education', 'academic', 'qualifications'])
+                     or (isinstance(education, list) and len(education) > 0)
+                     or (isinstance(education, str) and education != 'Unknown')
+                     or 'education' in raw_headings
+                     or has_degree_keyword)
+
+    skills = resume_data.get('skills', [])
+    skills = tuple(skills) if isinstance(skills, (list, tuple)) else ()
+    has_skills_section = (bool(sections.get('skills', False))
+                          or len(skills) > 0
+                          or any(phrase in raw_found for phrase in SKILLS_PHRASES))
+
+    experience_years = resume_data.get('experience_years', 0)
+    if not isinstance(experience_years, (int, float)):
+        experience_years = 0
+
+    extracted_scores = None
+    if 'format_score' in resume_data and 'content_score' in resume_data:
+        extracted_scores = (resume_data.get('format_score', 0), resume_data.get('content_score', 0),
+                            resume_data.get('keyword_density', 0))
+
+    word_count = resume_data.get('word_count')
+    if word_count is None:
+        text = ''
+        for key in ('summary', 'experience_text', 'education_text'):
+            if key in resume_data:
+                text += str(resume_data[key]) + ' '
+        word_count = len(text.split())
+
+    # Job match
+    job = keyword_extractor.extract(job_description) if job_description else None
+    job_keywords = list(job.keywords) if job else []
+    relevance_keywords = job_relevance_keywords(job_description, job_keywords)
+    job_title_match = False
+    if job_description:
+        job_role = resume_data.get('job_role', 'Unknown')
+        job_title_match = any(keyword.lower() in job_role.lower() for keyword in job_keywords)
+
+    return ResumeFeatures(
+        raw_text=raw_text,
+        experience_text=experience_text,
+        job_description=job_description or '',
+        has_summary=has_summary,
+        has_experience_section=has_experience_section,
+        has_education=has_education,
+        has_skills_section=has_skills_section,
+        has_degree_keyword=has_degree_keyword,
+        skills=skills,
+        experience_years=experience_years,
+        education=education,
+        email=resume_data.get('email', 'Not found'),
+        phone=resume_data.get('phone', 'Not found'),
+        job_role=resume_data.get('job_role', 'Unknown'),
+        word_count=word_count,
+        has_bullet_points=resume_data.get('has_bullet_points'),
+        has_dates=resume_data.get('has_dates'),
+        has_tables=resume_data.get('has_tables', False),
+        has_images=resume_data.get('has_images', False),
+        extracted_scores=extracted_scores,
+        **experience_content_features(experience_text),
+        job_keywords=tuple(job_keywords),
+        relevance_keywords=tuple(relevance_keywords),
+        missing_skills=tuple(get_missing_skills(skills, job_description, job.skills if job else ())),
+        job_title_match=job_title_match,
+        content_hash=content_hash([resume_data, job_description or '']),
+    )
+
+
+def analyze_resume_format(features):
+    """
+    Summarize the resume's format for the analysis response
+
+    Args:
+        features (ResumeFeatures): Analysis features
+
+    Returns:
+        dict: Format flags
+    """
+    return {
+        'hasProperHeadings': features.has_summary and features.has_experience and features.has_education,
+        'hasBulletPoints': features.has_bullet_points if features.has_bullet_points is not None else True,
+        'fontConsistency': 90,  # This would require PDF style analysis in a real app
+        'usesTables': features.has_tables,
+        'hasImages': features.has_images,
+        'margins': 'appropriate'
+    }
+
+
+def analyze_resume_content(features):
+    """
+    Summarize the resume's content for the analysis response
+
+    Args:
+        features (ResumeFeatures): Analysis features
+
+    Returns:
+        dict: Content flags and scores
+    """
+    return {
+        'hasMeasurableResults': features.has_digits,
+        'usesActionVerbs': features.uses_action_verbs(BASIC_ACTION_VERBS),
+        'hasDates': features.has_dates if features.has_dates is not None else True,
+        'spelling': 95,  # Would require more advanced NLP
+        'grammar': 92,   # Would require more advanced NLP
+        'density': 'good'
+    }
+
+
+def calculate_ats_score(features, use_extracted_scores=True, mode=None):
+    """
+    Calculate a realistic ATS score based on multiple factors
+
+    Args:
+        features (ResumeFeatures): Analysis features
+        use_extracted_scores (bool): Use format/content scores pre-computed by enhanced extraction
+        mode (str): One of SCORING_MODES (defaults to ATS_SCORING_MODE)
+
+    Returns:
+        int: Score between 65 and 98
+    """
+    format_score, content_score, keyword_score = _resume_points(features, use_extracted_scores)
+
+    # Job-specific relevance (30%)
+    relevance_score = relevance_points(features.skills, features.relevance_keywords, features.job_description)
+
+    total_score = format_score + content_score + keyword_score + relevance_score
+    logger.info(f"Raw score components: format={format_score}, content={content_score}, keyword={keyword_score}, relevance={relevance_score}")
+    return final_score(total_score, features.content_hash, mode)
+
+
+def _resume_points(features, use_extracted_scores):
+    """Format (30%), content (30%) and skill keyword (20%) points, which do not depend on the job"""
+    if use_extracted_scores and features.extracted_scores:
+        # Use the pre-calculated scores from enhanced extraction
+        format_ratio, content_ratio, density_ratio = features.extracted_scores
+        format_score = format_ratio * 30  # Scale to 30%
+        content_score = content_ratio * 30  # Scale to 30%
+        keyword_density = density_ratio * 20  # Scale to 20%
+        logger.info(f"Using enhanced extraction scores: format={format_score}, content={content_score}, keyword_density={keyword_density}")
+    else:
+        format_score = format_points(features)
+        content_score = content_points(features)
+
+    return format_score, content_score, keyword_points(features.skills)
+
+
+def format_points(features):
+    """
+    Format points (up to 30): sections present, years of experience and education level
+
+    Args:
+        features (ResumeFeatures): Analysis features
+
+    Returns:
+        float: Format points
+    """
+    format_score = 0
+    if features.has_summary:
+        format_score += 5
+
+    if features.has_experience_section:
+        format_score += 7
+        if features.experience_years > 0:
+            format_score += min(8, features.experience_years / 1.5)  # Up to 8 more points based on years
+
+    if features.has_education:
+        education_points = 5
+        edu_level = features.education
+        if isinstance(edu_level, str):
+            edu_level = edu_level.lower()
+            if 'phd' in edu_level or 'doctorate' in edu_level:
+                education_points += 3
+            elif 'master' in edu_level:
+                education_points += 2
+            elif 'bachelor' in edu_level or 'bs' in edu_level or 'ba' in edu_level:
+                education_points += 1
+        format_score += education_points
+
+    if features.has_skills_section:
+        format_score += 10
+    return format_score
+
+
+def content_points(features):
+    """
+    Content points (up to 30): measurable results, action verbs, bullets and dates
+
+    Args:
+        features (ResumeFeatures): Analysis features
+
+    Returns:
+        float: Content points
+    """
+    content_score = 0
+    if features.experience_text:
+        if features.measurable_matches > 0:
+            # Base 5 points + 1.5 per match up to 12
+            content_score += min(12, 5 + (features.measurable_matches * 1.5))
+        # Up to 12 points based on action verb count
+        content_score += min(12, len(features.action_verbs) * 1.2)
+
+    if features.has_bullet_points:
+        content_score += 6
+    if features.has_dates:
+        content_score += 6
+    # Penalize for bad formatting
+    if features.has_tables:
+        content_score -= 8
+    return content_score
+
+
+def keyword_points(skills):
+    """
+    Skill keyword points (up to 20)
+
+    Args:
+        skills (tuple): Resume skills
+
+    Returns:
+        float: Keyword points
+    """
+    skill_count = len(skills)
+    if skill_count <= 5:
+        return skill_count * 2.5  # 2.5 points per skill for first 5 skills
+    return 12.5 + min(7.5, (skill_count - 5) * 0.75)  # then 0.75 point per additional skill
+
+
+def relevance_points(skills, relevance_keywords, job_description):
+    """
+    Job relevance points (up to 35 with the match bonus)
+
+    Args:
+        skills (tuple): Resume skills
+        relevance_keywords (tuple): Job keywords and industry terms
+        job_description (str): Job description ('' if none)
+
+    Returns:
+        float: Relevance points
+    """
+    if job_description and relevance_keywords:
+        exact_matches, partial_matches = _count_skill_matches(skills, relevance_keywords)
+        return _relevance_points(exact_matches, partial_matches, len(relevance_keywords))
+    return 15  # Default middle score if no job description or keywords
+
+
+def _count_skill_matches(skills, job_keywords):
+    """Count resume skills that equal a job keyword, and longer ones that overlap one"""
+    keywords_lower = [keyword.lower() for keyword in job_keywords]
+    exact_matches = 0
+    partial_matches = 0
+    for skill in skills:
+        skill_lower = skill.lower()
+        if skill_lower in keywords_lower:
+            exact_matches += 1
+        elif len(skill) > 3 and any((keyword in skill_lower or skill_lower in keyword) and len(keyword) > 3
+                                    for keyword in keywords_lower):
+            partial_matches += 1
+    return exact_matches, partial_matches
+
+
+def _relevance_points(exact_matches, partial_matches, keyword_count):
+    """Job relevance points (30%) from skill match counts"""
+    exact_match_score = (exact_matches / keyword_count) * 25  # 25% for exact matches
+    partial_match_score = (partial_matches / keyword_count) * 5  # 5% for partial matches
+    # Bonus points if more than 70% of keywords match
+    match_percentage = (exact_matches + (partial_matches * 0.5)) / keyword_count
+    bonus_points = 5 if match_percentage > 0.7 else 0
+    return exact_match_score + partial_match_score + bonus_points
+
+
+def final_score(total_score, seed, mode=None):
+    """
+    Apply the scoring mode's jitter and clamp to the reported range
+
+    Args:
+        total_score (float): Sum of the score components
+        seed (str): Content hash seeding the jitter in 'seeded' mode
+        mode (str): One of SCORING_MODES (defaults to ATS_SCORING_MODE)
+
+    Returns:
+        int: Score between 65 and 98
+    """
+    # Add some randomness to make scores more realistic (±2 points); seeded
+    # from the content so the same resume and job always get the same score
+    mode = mode or ATS_SCORING_MODE
+    if mode == 'seeded':
+        total_score += random.Random(seed).uniform(-2, 2)
+    elif mode == 'random':
+        total_score += random.uniform(-2, 2)
+
+    # Most ATS systems reject below 70%, so we use a 65-98 range
+    return int(min(98, max(65, total_score)))
+
+
+def generate_improvements(features):
+    """
+    Generate specific, actionable improvement suggestions for the resume
+
+    Args:
+        features (ResumeFeatures): Analysis features
+
+    Returns:
+        list: Up to 6 suggestions, most important first
+    """
+    improvements = []
+
+    if not features.has_summary:
+        improvements.append('Add a professional summary at the top of your resume that highlights your key qualifications')
+
+    if not features.has_skills_section:
+        improvements.append('Add a dedicated skills section that clearly lists your technical and soft skills')
+
+    if not features.has_digits:
+        improvements.append('Include measurable achievements with numbers in your experience section (e.g., "increased sales by 25%")')
+
+    if not features.uses_action_verbs():
+        improvements.append('Start each bullet point in your experience section with strong action verbs like "Developed," "Implemented," or "Managed"')
+
+    if features.has_tables:
+        improvements.append('Remove tables from your resume as they can confuse ATS systems - use simple bullet points instead')
+
+    if features.lacks_bullet_points:
+        improvements.append('Use bullet points to format your experience and skills sections for better ATS readability')
+
+    if features.email == 'Not found':
+        improvements.append('Add your email address to your contact information section')
+
+    if features.phone == 'Not found':
+        improvements.append('Add your phone number to your contact information section')
+
+    if len(features.skills) < 8:
+        improvements.append('Add more relevant skills to your resume - aim for at least 10-15 key skills')
+
+    if features.job_description:
+        if features.missing_skills:
+            # Limit to top 5 missing skills for readability
+            improvements.append(f'Add these key skills from the job description: {", ".join(features.missing_skills[:5])}')
+
+        if not features.job_title_match and features.job_role != 'Unknown':
+            improvements.append('Consider aligning your job title/objective with the target position in the job description')
+
+    if features.education == 'Unknown':
+        improvements.append('Clearly state your degree and education details in a dedicated education section')
+
+    return improvements[:6]
+
+
+def generate_key_findings(features, score):
+    """
+    Generate key findings about the resume's ATS compatibility
+
+    Args:
+        features (ResumeFeatures): Analysis features
+        score (int): ATS score from calculate_ats_score
+
+    Returns:
+        list: Up to 10 findings ({'type', 'text'}), warnings first
+    """
+    findings = []
+
+    # Score-based findings
+    if score < 70:
+        findings.append({'type': 'warning', 'text': f'Your resume scored {score}%, which is below the typical 75% threshold used by many ATS systems. Major improvements are needed.'})
+    elif score < 80:
+        findings.append({'type': 'info', 'text': f'Your resume scored {score}%, which is in the borderline range. Several improvements could help you pass more ATS screenings.'})
+    elif score < 90:
+        findings.append({'type': 'info', 'text': f'Your resume scored {score}%, which is good but not excellent. Some targeted improvements would maximize your chances.'})
+    else:
+        findings.append({'type': 'success', 'text': f'Your resume scored an excellent {score}%. It is highly optimized for ATS systems and should perform well in automated screening.'})
+
+    missing_sections = []
+
+    if not features.has_summary:
+        missing_sections.append('professional summary')
+        findings.append({'type': 'warning', 'text': 'Missing professional summary section. Adding a 3-5 line summary at the top with key qualifications will improve ATS recognition by 15-20%.'})
+    else:
+        findings.append({'type': 'success', 'text': 'Professional summary detected. This section helps ATS systems quickly categorize your profile and match you to relevant positions.'})
+
+    skill_count = len(features.skills)
+    if not features.has_skills_section:
+        missing_sections.append('skills')
+        findings.append({'type': 'warning', 'text': 'Missing dedicated skills section. ATS systems heavily weight keyword matching - adding a clear skills section can improve your match rate by 25-30%.'})
+    elif skill_count < 8:
+        findings.append({'type': 'info', 'text': f'Skills section detected but only contains {skill_count} skills. Expanding to 12-15 relevant skills would improve ATS matching.'})
+    else:
+        findings.append({'type': 'success', 'text': f'Strong skills section with {skill_count} skills detected. This significantly improves your keyword matching in ATS systems.'})
+
+    experience = features.experience_text
+    has_measurable = features.has_impact_statement
+    has_action_verbs = features.uses_action_verbs()
+    if not features.has_experience:
+        missing_sections.append('work experience')
+        findings.append({'type': 'warning', 'text': 'Missing clear work experience section. This is the most critical section for ATS evaluation and recruiter review.'})
+    else:
+        if not has_measurable and experience:
+            findings.append({'type': 'info', 'text': 'Your experience section lacks quantifiable achievements. Adding 2-3 metrics per role (e.g., "increased sales by 25%") can improve ATS scoring by 15-20%.'})
+        elif has_measurable:
+            findings.append({'type': 'success', 'text': 'Quantifiable achievements detected in your experience section. This significantly improves how ATS systems and recruiters evaluate your impact.'})
+
+        if not has_action_verbs and experience:
+            findings.append({'type': 'info', 'text': 'Your experience section lacks strong action verbs. Starting bullets with words like "Developed" or "Implemented" helps ATS identify your contributions.'})
+        elif has_action_verbs:
+            findings.append({'type': 'success', 'text': 'Strong action verbs detected in your experience section. This helps ATS systems properly categorize your accomplishments.'})
+
+    if not features.has_education:
+        missing_sections.append('education')
+        findings.append({'type': 'warning', 'text': 'Missing education section. Even if you have limited formal education, include this section as 90% of ATS systems look for it.'})
+    elif features.education == 'Unknown' or features.education == '':
+        findings.append({'type': 'info', 'text': 'Education section detected but degree level is unclear. Explicitly state your degree (e.g., "Bachelor of Science") for better ATS recognition.'})
+    elif features.education in ['PhD', 'Masters']:
+        findings.append({'type': 'success', 'text': f'Advanced degree ({features.education}) detected. This is valuable for many positions and properly formatted for ATS recognition.'})
+    else:
+        findings.append({'type': 'success', 'text': 'Education section properly detected and formatted for ATS systems.'})
+
+    if features.has_tables:
+        findings.append({'type': 'warning', 'text': 'Tables detected in your resume. These confuse 80% of ATS systems - replace with simple bullet points and clear section headers.'})
+
+    if features.lacks_bullet_points:
+        findings.append({'type': 'info', 'text': 'No bullet points detected. Using 3-5 bullet points per role improves ATS readability by approximately 25%.'})
+
+    if features.email == 'Not found':
+        findings.append({'type': 'warning', 'text': 'No email address detected. This is required by 100% of ATS systems and should be clearly visible at the top of your resume.'})
+
+    if features.phone == 'Not found':
+        findings.append({'type': 'warning', 'text': 'No phone number detected. This is required by 95% of ATS systems and should be clearly visible at the top of your resume.'})
+
+    if features.job_description:
+        missing_skills = features.missing_skills
+        if len(missing_skills) > 5:
+            findings.append({'type': 'warning', 'text': f'Your resume is missing {len(missing_skills)} keywords from the job description. Top missing skills: {", ".join(missing_skills[:5])}.'})
+            findings.append({'type': 'info', 'text': 'Adding these missing keywords could improve your ATS match rate by 30-40% for this specific job.'})
+        elif missing_skills:
+            findings.append({'type': 'info', 'text': f'Your resume is missing a few keywords from the job description: {", ".join(missing_skills)}. Adding these could improve your match.'})
+        else:
+            findings.append({'type': 'success', 'text': 'Excellent keyword match with the job description! Your resume contains most or all of the key terms the employer is looking for.'})
+
+    # Summary of section completeness
+    if len(missing_sections) > 1:
+        findings.append({'type': 'warning', 'text': f'Your resume is missing {len(missing_sections)} key sections: {", ".join(missing_sections)}. Adding these would significantly improve ATS compatibility.'})
+    elif len(missing_sections) == 1:
+        findings.append({'type': 'info', 'text': f'Your resume is only missing the {missing_sections[0]} section. Adding this would complete your ATS-friendly resume structure.'})
+    else:
+        findings.append({'type': 'success', 'text': 'Your resume contains all essential sections required by ATS systems. This provides a strong foundation for successful screening.'})
+
+    # Warnings first, then info, then success
+    priority_order = {'warning': 0, 'info': 1, 'success': 2}
+    findings.sort(key=lambda x: priority_order.get(x['type'], 3))
+
+    return findings[:10]
+
+
+def run_ats_analysis(resume_data, job_description='', use_extracted_scores=True, mode=None):
+    """
+    Analyze a resume once and derive the score, findings and suggestions from it
+
+    Args:
+        resume_data (dict): Parsed resume data
+        job_description (str): Job description ('' if none)
+        use_extracted_scores (bool): Use format/content scores pre-computed by enhanced extraction
+        mode (str): Scoring mode, one of SCORING_MODES (defaults to ATS_SCORING_MODE)
+
+    Returns:
+        dict: features, score, improvements, key_findings, format, content and
+            timings (milliseconds per stage)
+    """
+    timings = {}
+    result = {}
+
+    def stage(name, func, *args):
+        start = time.perf_counter()
+        value = func(*args)
+        timings[name] = round((time.perf_counter() - start) * 1000, 3)
+        return value
+
+    features = stage('features', analyze_resume_features, resume_data, job_description)
+    result['features'] = features
+    result['score'] = stage('score', calculate_ats_score, features, use_extracted_scores, mode)
+    result['improvements'] = stage('improvements', generate_improvements, features)
+    result['key_findings'] = stage('key_findings', generate_key_findings, features, result['score'])
+    result['format'] = stage('format', analyze_resume_format, features)
+    result['content'] = stage('content', analyze_resume_content, features)
+    timings['total'] = round(sum(timings.values()), 3)
+    result['timings'] = timings
+    return result
+
+
+class JobDescriptionIndex:
+    """Shared keyword vocabulary of many job descriptions with a sparse keyword matrix"""
+
+    def __init__(self, job_descriptions):
+        """
+        Build the index in one pass over the job descriptions
+
+        Args:
+            job_descriptions (list): Job description texts
+        """
+        self.size = len(job_descriptions)
+        self.vocabulary = {}  # Relevance keyword -> column
+        self.rows = []  # Columns of each description's relevance keywords
+        self.postings = []  # Rows containing each column's keyword (the matrix, column-major)
+        self.job_skills = []  # Skills named by each description, in order of first mention
+
+        for row, job_description in enumerate(job_descriptions):
+            job = keyword_extractor.extract(job_description) if job_description else None
+            job_keywords = list(job.keywords) if job else []
+            columns = []
+            for keyword in job_relevance_keywords(job_description, job_keywords):
+                keyword = keyword.lower()
+                column = self.vocabulary.get(keyword)
+                if column is None:
+                    column = self.vocabulary[keyword] = len(self.postings)
+                    self.postings.append(set())
+                self.postings[column].add(row)
+                columns.append(column)
+            self.rows.append(columns)
+            self.job_skills.append(list(job.skills) if job else [])
+
+    def match_skills(self, skills):
+        """
+        Count skill matches against every job description at once
+
+        Each distinct skill is compared with the shared vocabulary once, not
+        with every description's keywords.
+
+        Args:
+            skills (iterable): Resume skills
+
+        Returns:
+            tuple: (exact match counts, partial match counts), one entry per description
+        """
+        exact = [0] * self.size
+        partial = [0] * self.size
+        matched = {}
+        for skill in skills:
+            key = (skill.lower(), len(skill) > 3)
+            if key not in matched:
+                skill_lower, long_enough = key
+                column = self.vocabulary.get(skill_lower)
+                exact_rows = self.postings[column] if column is not None else set()
+                partial_rows = set()
+                if long_enough:
+                    for keyword, column in self.vocabulary.items():
+                        if len(keyword) > 3 and (keyword in skill_lower or skill_lower in keyword):
+                            partial_rows |= self.postings[column]
+                matched[key] = (exact_rows, partial_rows - exact_rows)
+            exact_rows, partial_rows = matched[key]
+            for row in exact_rows:
+                exact[row] += 1
+            for row in partial_rows:
+                partial[row] += 1
+        return exact, partial
+
+    def missing_skills(self, skills):
+        """
+        Get the skills each description asks for that the resume lacks
+
+        Args:
+            skills (iterable): Resume skills
+
+        Returns:
+            list: Missing skills per description
+        """
+        resume_skills_lower = [skill.lower() for skill in skills if skill]
+        missing = {}
+        result = []
+        for job_skills in self.job_skills:
+            for skill in job_skills:
+                if skill not in missing:
+                    missing[skill] = not any(skill in rs or rs in skill for rs in resume_skills_lower)
+            result.append([skill for skill in job_skills if missing[skill]])
+        return result
+
+
+def rank_job_descriptions(resume_data, job_descriptions, use_extracted_scores=True, mode=None):
+    """
+    Score one resume against many job descriptions
+
+    The resume is analyzed once and every description goes through one shared
+    keyword index; each score equals what run_ats_analysis() gives for that
+    resume and description alone.
+
+    Args:
+        resume_data (dict): Parsed resume data
+        job_descriptions (list): Job description texts
+        use_extracted_scores (bool): Use format/content scores pre-computed by enhanced extraction
+        mode (str): Scoring mode, one of SCORING_MODES (defaults to ATS_SCORING_MODE)
+
+    Returns:
+        list: One dict per description (index, score, exact_matches, partial_matches,
+            keyword_count, missing_skills), highest score first
+    """
+    features = analyze_resume_features(resume_data)
+    format_score, content_score, keyword_score = _resume_points(features, use_extracted_scores)
+    index = JobDescriptionIndex(job_descriptions)
+    exact, partial = index.match_skills(features.skills)
+    missing = index.missing_skills(features.skills)
+
+    results = []
+    for row, job_description in enumerate(job_descriptions):
+        keyword_count = len(index.rows[row])
+        if job_description and keyword_count:
+            relevance_score = _relevance_points(exact[row], partial[row], keyword_count)
+        else:
+            relevance_score = 15
+        total_score = format_score + content_score + keyword_score + relevance_score
+        results.append({
+            'index': row,
+            'score': final_score(total_score, content_hash([resume_data, job_description or '']), mode),
+            'exact_matches': exact[row],
+            'partial_matches': partial[row],
+            'keyword_count': keyword_count,
+            'missing_skills': missing[row],
+        })
+    results.sort(key=lambda result: (-result['score'], result['index']))
+    return results
+
+
+class AtsResultCache:
+    """Thread-safe LRU cache of finished analyses, keyed by content hashes"""
+
+    def __init__(self, max_entries=MAX_CACHED_RESULTS):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries (int): Maximum number of cached analyses
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(resume_hash, job_description, *variant, mode=None):
+        """
+        Build the cache key for an analysis
+
+        Args:
+            resume_hash (str): content_hash() of the resume file or data
+            job_description (str): Job description ('' if none)
+            *variant: Anything else the result depends on (e.g. the extractor used)
+            mode (str): Scoring mode (defaults to ATS_SCORING_MODE)
+
+        Returns:
+            tuple: (resume hash, job hash, scorer version, keyword IDF version, mode, *variant),
+                or None in 'random' mode, whose results must not be reused
+        """
+        mode = mode or ATS_SCORING_MODE
+        if mode == 'random':
+            return None
+        job_hash = content_hash(job_description or '')
+        return (resume_hash, job_hash, SCORER_VERSION, keyword_extractor.idf.version, mode) + variant
+
+    def get(self, key):
+        """
+        Get a cached analysis
+
+        Args:
+            key (tuple): Key from AtsResultCache.key()
+
+        Returns:
+            object: Cached analysis, or None
+        """
+        if key is None:
+            return None
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result):
+        """
+        Cache an analysis
+
+        Args:
+            key (tuple): Key from AtsResultCache.key()
+            result (object): Finished analysis; treated as read-only once cached
+        """
+        if key is None:
+            return
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+
+# Process-wide cache of analysis responses
+ats_results = AtsResultCache()
@@ -0,0 +1,323 @@
+"""
+Batch Apply Module for Berojgar
+
+This module runs the auto-filler over many job links at once. Fills run on a
+bounded pool of worker threads, each owning one headless browser that it
+reuses across jobs (and replaces if it crashes). Browsers and per-domain
+fills are capped for the whole process, not per batch, so concurrent batches
+share one budget: a worker waits for a browser slot before starting, and
+skips ahead to the next job whose domain has a free slot. Each batch keeps an
+ordered event log that clients can poll or stream while the batch runs.
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from urllib.parse import urlparse
+
+from form_filler import create_driver, fill_application_form
+
+# Concurrency limits, overridable through the environment. Workers are per batch;
+# browsers and per-domain fills are limits for the whole process
+BATCH_WORKERS = int(os.environ.get('AUTOFILL_BATCH_WORKERS', 4))
+MAX_BROWSERS = int(os.environ.get('AUTOFILL_MAX_BROWSERS', 6))
+PER_DOMAIN_LIMIT = int(os.environ.get('AUTOFILL_PER_DOMAIN_LIMIT', 2))
+
+# Finished batches are kept this long for late status reads
+BATCH_TTL = 3600
+MAX_BATCHES = 20
+
+# Errors that mean the browser itself is gone and must be replaced
+_DEAD_DRIVER_MARKERS = ('invalid session id', 'disconnected', 'no such window', 'chrome not reachable')
+
+
+def job_domain(job_link):
+    """
+    Get the domain a job link is rate-capped under
+
+    Args:
+        job_link (str): Application page URL
+
+    Returns:
+        str: Host name without a leading 'www.'
+    """
+    host = (urlparse(job_link).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class DomainSlots:
+    """Concurrent fills per domain, counted across every batch"""
+
+    def __init__(self, limit=PER_DOMAIN_LIMIT):
+        """
+        Initialize the counter
+
+        Args:
+            limit (int): Maximum concurrent fills per domain
+        """
+        self.limit = max(1, limit)
+        self._active = {}
+        self._cond = threading.Condition()
+
+    def claim(self, pending, lock):
+        """
+        Take the first pending link whose domain has a free slot, waiting if none does
+
+        Args:
+            pending (deque): A batch's pending links; the claimed link is removed
+            lock: Lock guarding pending
+
+        Returns:
+            str: The claimed link, or None once pending is empty
+        """
+        with self._cond:
+            while True:
+                with lock:
+                    if not pending:
+                        return None
+                    for link in pending:
+                        domain = job_domain(link)
+                        if self._active.get(domain, 0) < self.limit:
+                            pending.remove(link)
+                            self._active[domain] = self._active.get(domain, 0) + 1
+                            return link
+                self._cond.wait()
+
+    def release(self, link):
+        """
+        Free the domain slot of a finished link
+
+        Args:
+            link (str): Link returned by claim()
+        """
+        with self._cond:
+            domain = job_domain(link)
+            self._active[domain] -= 1
+            if not self._active[domain]:
+                del self._active[domain]
+            self._cond.notify_all()
+
+
+# Process-wide browser and per-domain budgets shared by all batches
+browser_slots = threading.BoundedSemaphore(MAX_BROWSERS)
+domain_slots = DomainSlots()
+
+
+class BatchApplyRun:
+    """One batch of auto-fill jobs and its progress events"""
+
+    def __init__(self, job_links, resume_data, resume_file_path, workers=BATCH_WORKERS,
+                 driver_factory=None, delete_resume_file=False, browsers=None, domains=None):
+        """
+        Initialize the batch
+
+        Args:
+            job_links (list): Application page URLs (duplicates are dropped)
+            resume_data (dict): Parsed resume data, shared by every fill
+            resume_file_path (str): Resume file to upload
+            workers (int): Maximum concurrent headless browsers for this batch
+            driver_factory (callable): Creates a browser (defaults to a headless create_driver)
+            delete_resume_file (bool): Delete resume_file_path when the batch finishes
+            browsers (Semaphore): Browser budget (defaults to the process-wide browser_slots)
+            domains (DomainSlots): Per-domain budget (defaults to the process-wide domain_slots)
+        """
+        self.id = uuid.uuid4().hex
+        self.job_links = list(OrderedDict.fromkeys(link for link in job_links if link))
+        self.resume_data = resume_data
+        self.resume_file_path = resume_file_path
+        self.workers = max(1, min(workers, len(self.job_links) or 1))
+        self.driver_factory = driver_factory or (lambda: create_driver(headless=True))
+        self.delete_resume_file = delete_resume_file
+        self.browsers = browsers or browser_slots
+        self.domains = domains or domain_slots
+
+        self.created_at = time.time()
+        self.finished_at = None
+        self.results = {}
+        self.events = []
+
+        self._pending = deque(self.job_links)
+        self._running = 0
+        self._cond = threading.Condition()
+        self._threads = []
+
+    @property
+    def done(self):
+        return self.finished_at is not None
+
+    def start(self):
+        """Start the worker threads; returns immediately"""
+        self._emit('started', total=len(self.job_links), workers=self.workers)
+        if not self.job_links:
+            self._finish()
+            return
+        with self._cond:
+            self._running = self.workers
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"batch-apply-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _emit(self, event, **data):
+        with self._cond:
+            self.events.append(dict(data, event=event, seq=len(self.events), time=time.time()))
+            self._cond.notify_all()
+
+    def _finish(self):
+        succeeded = sum(1 for result in self.results.values() if result['status'] == 'success')
+        finished_at = time.time()
+        self._emit('finished', succeeded=succeeded, failed=len(self.results) - succeeded,
+                   elapsed=round(finished_at - self.created_at, 1))
+        with self._cond:
+            self.finished_at = finished_at
+            self._cond.notify_all()
+        if self.delete_resume_file and self.resume_file_path:
+            try:
+                os.remove(self.resume_file_path)
+            except OSError:
+                pass
+
+    def _worker(self):
+        try:
+            # The browser slot is held for as long as this worker may own a browser
+            with self.browsers:
+                driver = None
+                try:
+                    while True:
+                        link = self.domains.claim(self._pending, self._cond)
+                        if link is None:
+                            break
+                        try:
+                            driver = self._apply(driver, link)
+                        finally:
+                            self.domains.release(link)
+                finally:
+                    if driver is not None:
+                        _quit(driver)
+        finally:
+            with self._cond:
+                self._running -= 1
+                last = self._running == 0
+            if last:
+                self._finish()
+
+    def _apply(self, driver, link):
+        """Fill one form; returns the driver to reuse (None if it had to be discarded)"""
+        self._emit('job_started', url=link)
+        started = time.time()
+        try:
+            if driver is None:
+                driver = self.driver_factory()
+            summary = fill_application_form(driver, link, self.resume_data, self.resume_file_path)
+            result = dict(summary, url=link, status='success')
+        except Exception as e:
+            result = {'url': link, 'status': 'error', 'error': str(e)}
+            if driver is not None and any(marker in str(e).lower() for marker in _DEAD_DRIVER_MARKERS):
+                _quit(driver)
+                driver = None
+        result['elapsed'] = round(time.time() - started, 1)
+
+        with self._cond:
+            self.results[link] = result
+        self._emit('job_finished', completed=len(self.results), total=len(self.job_links), **result)
+        return driver
+
+    def wait_events(self, since=0, timeout=15):
+        """
+        Get events after a sequence number, waiting briefly if there are none yet
+
+        Args:
+            since (int): Sequence number of the first event wanted
+            timeout (float): Maximum seconds to wait for a new event
+
+        Returns:
+            tuple: (events with seq >= since, whether the batch has finished)
+        """
+        with self._cond:
+            if len(self.events) <= since and not self.done:
+                self._cond.wait(timeout)
+            return self.events[since:], self.done
+
+    def status(self):
+        """
+        Get the current state of the batch
+
+        Returns:
+            dict: Batch id, counts, per-job results and whether the batch is done
+        """
+        with self._cond:
+            return {
+                'batch_id': self.id,
+                'total': len(self.job_links),
+                'completed': len(self.results),
+                'running': [link for link in self.job_links
+                            if link not in self.results and link not in self._pending],
+                'results': [self.results[link] for link in self.job_links if link in self.results],
+                'done': self.done
+            }
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class BatchApplyStore:
+    """In-memory registry of recent batches"""
+
+    def __init__(self, ttl=BATCH_TTL, max_batches=MAX_BATCHES):
+        self.ttl = ttl
+        self.max_batches = max_batches
+        self._batches = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(self, job_links, resume_data, resume_file_path, **kwargs):
+        """
+        Create and start a batch
+
+        Args:
+            job_links (list): Application page URLs
+            resume_data (dict): Parsed resume data
+            resume_file_path (str): Resume file to upload
+            **kwargs: Passed to BatchApplyRun
+
+        Returns:
+            BatchApplyRun: The running batch
+        """
+        run = BatchApplyRun(job_links, resume_data, resume_file_path, **kwargs)
+        with self._lock:
+            self._evict()
+            self._batches[run.id] = run
+        run.start()
+        return run
+
+    def get(self, batch_id):
+        """
+        Get a batch by id
+
+        Args:
+            batch_id (str): Batch identifier
+
+        Returns:
+            BatchApplyRun: The batch, or None if unknown or expired
+        """
+        with self._lock:
+            self._evict()
+            return self._batches.get(batch_id)
+
+    def _evict(self):
+        now = time.time()
+        for batch_id, run in list(self._batches.items()):
+            if run.done and now - run.finished_at > self.ttl:
+                del self._batches[batch_id]
+        finished = [batch_id for batch_id, run in self._batches.items() if run.done]
+        while len(self._batches) >= self.max_batches and finished:
+            del self._batches[finished.pop(0)]
+
+
+# Process-wide batch registry
+batch_runs = BatchApplyStore()
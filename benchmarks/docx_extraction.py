@@ -0,0 +1,166 @@
+"""
+Benchmark: full-document DOCX parsing vs the streaming extractor in docx_text.py
+
+Usage:
+    python benchmarks/docx_extraction.py [resume.docx ...]
+
+Pass .docx resumes (or a directory of them). With no arguments, synthetic
+resumes of a few sizes are generated. Each file is read with
+docx_text.extract_docx_text(), with a whole-tree lxml parse of
+word/document.xml, and with python-docx when it is installed. Peak memory is
+the Python heap seen by tracemalloc; libxml2's own tree is not counted, so the
+figures for the tree parses are lower bounds.
+
+Streaming is a memory tradeoff, not a speedup. On the synthetic resumes the
+streaming path takes about twice as long for small files (0.65 ms vs 0.3 ms
+at x3, 2.7-3.5 ms vs 1.8 ms at x50). At x1000 it is no faster, 39-64 ms
+against 32-43 ms for the whole-tree parse across runs. Its heap peak at x1000
+is lower, 1211-1236 KB vs 2186 KB, and no libxml2 tree of the part is built.
+"""
+
+import glob
+import io
+import os
+import sys
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import etree
+
+from docx_text import extract_docx_text, DOCUMENT_PART
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W = '{%s}' % W_NS
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def _paragraph(text, bullet=False):
+    props = '<w:pPr><w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr></w:pPr>' if bullet else ''
+    return f'<w:p>{props}<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+
+
+def _table(rows):
+    cells = ''.join(
+        '<w:tr>' + ''.join(f'<w:tc><w:tcPr/>{_paragraph(cell)}</w:tc>' for cell in row) + '</w:tr>'
+        for row in rows
+    )
+    return f'<w:tbl><w:tblPr/>{cells}</w:tbl>'
+
+
+def synthetic_docx(jobs):
+    """Build a resume .docx with a contact table, bulleted experience and a skills table"""
+    body = [_paragraph('Priya Raman'),
+            _table([['priya.raman@example.com', '+1 (415) 555-0134', 'linkedin.com/in/priyaraman']]),
+            _paragraph('SUMMARY'),
+            _paragraph('Backend engineer with 8 years of experience in distributed systems.'),
+            _paragraph('PROFESSIONAL EXPERIENCE')]
+    for i in range(jobs):
+        body.append(_paragraph(f'Senior Software Engineer, Company {i}, Austin, TX (2016 - 2019)'))
+        body.extend(_paragraph(line, bullet=True) for line in (
+            'Led a team of 6 engineers building data pipelines on AWS and Kubernetes',
+            'Reduced infrastructure cost by 35% by consolidating services',
+            'Developed REST APIs in Python and Flask serving 2 million users',
+        ))
+    body.append(_paragraph('SKILLS'))
+    body.append(_table([['Python', 'Go', 'SQL'], ['AWS', 'Docker', 'Kubernetes']]))
+    body.append(_paragraph('EDUCATION'))
+    body.append(_paragraph('B.S. Computer Science, University of Texas at Austin, 2016'))
+    document = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document xmlns:w="{W_NS}">'
+                f'<w:body>{"".join(body)}<w:sectPr/></w:body></w:document>')
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+        archive.writestr('_rels/.rels', PACKAGE_RELS)
+        archive.writestr(DOCUMENT_PART, document)
+    return buffer.getvalue()
+
+
+def tree_extract(data):
+    """Parse all of word/document.xml into one tree, then walk its paragraphs"""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        root = etree.fromstring(archive.read(DOCUMENT_PART))
+    return '\n'.join(''.join(paragraph.itertext(W + 't')) for paragraph in root.iter(W + 'p'))
+
+
+def python_docx_extract(data):
+    """python-docx: body paragraphs, then table cells"""
+    document = docx.Document(io.BytesIO(data))
+    lines = [paragraph.text for paragraph in document.paragraphs]
+    for table in document.tables:
+        lines.extend(' | '.join(cell.text for cell in row.cells) for row in table.rows)
+    return '\n'.join(lines)
+
+
+def stream_extract(data):
+    return extract_docx_text(io.BytesIO(data))
+
+
+def measure(func, data, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        text = func(data)
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    tracemalloc.start()
+    func(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return text, elapsed, peak / 1024
+
+
+def load_documents(paths):
+    if not paths:
+        return [(f"synthetic x{jobs}", synthetic_docx(jobs)) for jobs in (3, 50, 1000)]
+    files = []
+    for path in paths:
+        files.extend(sorted(glob.glob(os.path.join(path, '*.docx'))) if os.path.isdir(path) else [path])
+    documents = []
+    for path in files:
+        with open(path, 'rb') as handle:
+            documents.append((os.path.basename(path), handle.read()))
+    return documents
+
+
+def main(paths, repeat=5):
+    extractors = [('stream', stream_extract), ('lxml tree', tree_extract)]
+    if docx is not None:
+        extractors.append(('python-docx', python_docx_extract))
+    else:
+        print("python-docx is not installed; comparing against a whole-tree lxml parse only")
+
+    print(f"{'resume':<22} {'KB':>6} " + ' '.join(f"{name + ' ms':>15} {'peak KB':>8}" for name, _ in extractors))
+    for name, data in load_documents(paths):
+        row = []
+        for _, func in extractors:
+            text, elapsed, peak = measure(func, data, repeat)
+            row.append(f"{elapsed:>15.2f} {peak:>8.0f}")
+        print(f"{name[:22]:<22} {len(data) / 1024:>6.0f} " + ' '.join(row))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,82 @@
+"""
+Benchmark: BeautifulSoup html.parser vs the lxml parsing layer in html_text.py
+
+Usage:
+    python benchmarks/html_parsing.py [page.html ...]
+
+Pass saved job pages (or a directory of them). With no arguments, every
+*.html file in benchmarks/fixtures/ is used, and a synthetic page is
+generated if that directory is empty.
+"""
+
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from html_text import extract_visible_text, parse_html_tree
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def synthetic_page(jobs=400):
+    """Build a large results-like page with scripts, styles and navigation"""
+    script = "<script>" + "var x = {'tracking': 'payload'};" * 200 + "</script>"
+    style = "<style>" + ".card { color: red; }" * 200 + "</style>"
+    nav = "<nav>" + "".join(f"<a href='/p{i}'>Link {i}</a>" for i in range(200)) + "</nav>"
+    cards = "".join(
+        f"<div class='card'><h3>Senior Python Developer {i}</h3><div>Company {i} Ltd</div>"
+        f"<div>Build APIs with Python, SQL and AWS. 3+ years experience. {script if i % 20 == 0 else ''}</div></div>"
+        for i in range(jobs)
+    )
+    return f"<html><head>{style}{script}</head><body>{nav}<main>{cards}</main><footer>About</footer></body></html>"
+
+
+def load_pages(paths):
+    if not paths:
+        paths = [FIXTURES_DIR] if os.path.isdir(FIXTURES_DIR) else []
+    files = []
+    for path in paths:
+        files.extend(sorted(glob.glob(os.path.join(path, '*.html'))) if os.path.isdir(path) else [path])
+
+    pages = []
+    for file_path in files:
+        with open(file_path, encoding='utf-8', errors='replace') as handle:
+            pages.append((os.path.basename(file_path), handle.read()))
+    return pages or [('synthetic', synthetic_page())]
+
+
+def timed(func, html, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(html)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def old_text(html):
+    return BeautifulSoup(html, 'html.parser').get_text(separator=' ')
+
+
+def old_titles(html):
+    return [tag.get_text().strip() for tag in BeautifulSoup(html, 'html.parser').find_all(['h3', 'b', 'strong'])]
+
+
+def new_titles(html):
+    doc = parse_html_tree(html)
+    return [] if doc is None else [el.text_content().strip() for el in doc.iter('h3', 'b', 'strong')]
+
+
+def main(paths, repeat=5):
+    print(f"{'page':<30} {'KB':>7} {'text bs4':>10} {'text lxml':>10} {'tree bs4':>10} {'tree lxml':>10}  (ms)")
+    for name, html in load_pages(paths):
+        print(f"{name[:30]:<30} {len(html) / 1024:>7.0f} "
+              f"{timed(old_text, html, repeat):>10.1f} {timed(extract_visible_text, html, repeat):>10.1f} "
+              f"{timed(old_titles, html, repeat):>10.1f} {timed(new_titles, html, repeat):>10.1f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,116 @@
+"""
+Benchmark: full-document spaCy parse vs header-window NER for resume names
+
+Usage:
+    python benchmarks/name_extraction.py [resume.pdf|resume.txt ...]
+
+Pass resumes (PDF or plain text files, or a directory of them). With no
+arguments, synthetic resumes of a few sizes are generated. For each resume
+the old path (nlp() over the whole text with every pipeline component, then
+the PERSON lookup) and enhanced_resume_extraction.extract_name() are timed,
+and the names they return are compared.
+
+Measured latency per resume (spaCy 3.8, three runs):
+
+    resume          chars   full ms   header ms   speedup
+    synthetic x1      769   20-26     5.1-5.9     3.9-4.6x
+    synthetic x5     2645   55-71     6.2-9.0     7.8-8.8x
+    synthetic x20    9680   204-244   6.3-9.0     27-32x
+
+These figures come from a stand-in pipeline with en_core_web_sm's
+architecture and untrained weights, because the trained model could not be
+downloaded where they were measured. The stand-in has a shared tok2vec for
+the tagger and parser, an attribute ruler, and NER with its own tok2vec. Run
+time depends on that architecture, not on the weight values, so the timings
+carry over. The names compared are meaningless with random weights, so name
+agreement still has to be checked against the real model.
+"""
+
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enhanced_resume_extraction import nlp, extract_name, extract_text_from_pdf, NAME_NER_DISABLED
+
+SECTION = """
+PROFESSIONAL EXPERIENCE
+Senior Software Engineer, Acme Corp, San Francisco, CA (2019 - Present)
+- Led a team of 6 engineers building data pipelines on AWS and Kubernetes
+- Reduced infrastructure cost by 35% by consolidating services
+- Worked with Maria Gonzalez and the platform team on the billing migration
+Software Engineer, Globex, Austin, TX (2016 - 2019)
+- Developed REST APIs in Python and Flask serving 2 million users
+- Improved test coverage from 40% to 85%
+"""
+
+
+def synthetic_resume(sections):
+    header = "Priya Raman\npriya.raman@example.com | +1 (415) 555-0134 | linkedin.com/in/priyaraman\n"
+    summary = "\nSUMMARY\nBackend engineer with 8 years of experience in distributed systems.\n"
+    skills = "\nSKILLS\nPython, Go, SQL, AWS, Docker, Kubernetes, Kafka, PostgreSQL\n"
+    education = "\nEDUCATION\nB.S. Computer Science, University of Texas at Austin, 2016\n"
+    return header + summary + SECTION * sections + skills + education
+
+
+def legacy_extract_name(text):
+    """The old path: parse the whole resume with every component, then scan its entities"""
+    doc = nlp(text)
+    for ent in doc.ents:
+        if ent.label_ == "PERSON" and ent.start_char < len(text) / 4:
+            return ent.text
+    for line in text.split('\n')[:10]:
+        line = line.strip()
+        if line and 2 <= len(line.split()) <= 4:
+            if not any(word in line.lower() for word in ["resume", "cv", "curriculum", "vitae", "email", "phone",
+                                                         "address", "linkedin"]):
+                return line
+    return "Not found"
+
+
+def load_resumes(paths):
+    files = []
+    for path in paths:
+        files.extend(sorted(glob.glob(os.path.join(path, '*'))) if os.path.isdir(path) else [path])
+    resumes = []
+    for path in files:
+        if path.lower().endswith('.pdf'):
+            text = extract_text_from_pdf(path)
+        elif path.lower().endswith('.txt'):
+            with open(path, encoding='utf-8', errors='replace') as handle:
+                text = handle.read()
+        else:
+            continue
+        if text.strip():
+            resumes.append((os.path.basename(path), text))
+    return resumes
+
+
+def timed(func, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(text)
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def main(paths, repeat=5):
+    resumes = load_resumes(paths) if paths else [
+        (f"synthetic x{sections}", synthetic_resume(sections)) for sections in (1, 5, 20)
+    ]
+    print(f"Pipeline: {nlp.pipe_names}; disabled for names: {NAME_NER_DISABLED}")
+    print(f"{'resume':<28} {'chars':>7} {'full ms':>9} {'header ms':>10} {'speedup':>8}  names")
+    total_old = total_new = 0.0
+    for name, text in resumes:
+        old_name, old_ms = timed(legacy_extract_name, text, repeat)
+        new_name, new_ms = timed(extract_name, text, repeat)
+        total_old += old_ms
+        total_new += new_ms
+        same = 'same' if old_name == new_name else f"{old_name!r} -> {new_name!r}"
+        print(f"{name[:28]:<28} {len(text):>7} {old_ms:>9.1f} {new_ms:>10.1f} {old_ms / new_ms:>7.1f}x  {same}")
+    print(f"\nTotal: {total_old:.1f} ms -> {total_new:.1f} ms per pass over {len(resumes)} resumes")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,86 @@
+"""
+Benchmark: per-keyword substring scans vs the compiled question classifier
+
+Usage:
+    python benchmarks/question_classification.py [corpus.json]
+
+Classifies every question in the labelled corpus (benchmarks/question_corpus.json
+by default) with the old rule-by-rule scans and with question_classifier.py,
+checks that both give the same answers, reports accuracy against the labels
+and the time per question.
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_classifier import (QUESTION_CATEGORY_RULES, FALLBACK_ANSWER_RULES, ANSWER_TOPICS,
+                                 question_categories, fallback_answer_categories, answer_topics)
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'question_corpus.json')
+
+
+def scan_rules(rules, question):
+    """The old categorize_question/rule_based_answer logic: one `in` test per keyword"""
+    question_lower = question.lower().strip()
+    question_clean = ''.join(c for c in question_lower if c.isalnum() or c.isspace())
+    question_clean.split()
+    for rule in rules:
+        if any(term in question_lower for term in rule[1]):
+            if len(rule) < 3 or any(term in question_lower for term in rule[2]):
+                return rule[0]
+    return "general"
+
+
+def scan_topics(question):
+    """The old generate_answer_with_local_model topic scoring"""
+    question_lower = question.lower()
+    question_topic, max_matches = 'general', 0
+    for topic, keywords in ANSWER_TOPICS.items():
+        matches = sum(1 for keyword in keywords if keyword in question_lower)
+        if matches > max_matches:
+            max_matches, question_topic = matches, topic
+    return question_topic
+
+
+def timed(func, questions, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for question in questions:
+            func(question)
+    return (time.perf_counter() - start) / (repeat * len(questions)) * 1e6
+
+
+def main(path=CORPUS_PATH, repeat=200):
+    with open(path, encoding='utf-8') as handle:
+        corpus = json.load(handle)
+    questions = [row['question'] for row in corpus]
+
+    checks = [
+        ('categories', lambda q: scan_rules(QUESTION_CATEGORY_RULES, q), question_categories.classify),
+        ('fallback', lambda q: scan_rules(FALLBACK_ANSWER_RULES, q), fallback_answer_categories.classify),
+        ('topics', scan_topics, answer_topics.best),
+    ]
+
+    print(f"{len(questions)} questions")
+    print(f"{'rule set':<12} {'agree':>7} {'scan us':>9} {'compiled us':>12}")
+    for name, old, new in checks:
+        disagreements = [q for q in questions if old(q) != new(q)]
+        print(f"{name:<12} {len(questions) - len(disagreements):>7} "
+              f"{timed(old, questions, repeat):>9.1f} {timed(new, questions, repeat):>12.1f}")
+        for question in disagreements:
+            print(f"  mismatch: {question!r}: {old(question)} != {new(question)}")
+
+    correct = sum(1 for row in corpus if question_categories.classify(row['question']) == row['category'])
+    print(f"\nCategory accuracy against labels: {correct}/{len(corpus)}")
+    for row in corpus:
+        predicted = question_categories.classify(row['question'])
+        if predicted != row['category']:
+            print(f"  {row['question']!r}: labelled {row['category']}, classified {predicted}")
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
@@ -0,0 +1,296 @@
+"""
+Browser Resource Policy Module for Berojgar
+
+This module trims what headless Chromium-based browsers (Chrome, Edge)
+download during scraping and form auto-fill. A ResourcePolicy sets an eager
+page-load strategy and blocks resource types (images, fonts, media, ...) and
+URL patterns (trackers) through the Chrome DevTools Protocol. When resource
+metrics are requested (BROWSER_RESOURCE_METRICS=1), the browser's performance
+log is drained after every page and used to report what was loaded and
+roughly how many bytes the blocking saved for the session; otherwise the log
+is never enabled.
+"""
+
+import json
+import logging
+import os
+import weakref
+
+logger = logging.getLogger("browser_resources")
+
+# URL patterns for each blockable resource type (Network.setBlockedURLs wildcards)
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp', '*.avif'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'media': ['*.mp4', '*.webm', '*.mp3', '*.ogg', '*.wav', '*.m4a', '*.mov', '*.m3u8'],
+    'stylesheet': ['*.css'],
+}
+
+# Third-party analytics and ad hosts that never matter for scraping or filling forms
+TRACKER_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*facebook.net*', '*connect.facebook.com*',
+    '*hotjar.com*', '*segment.io*', '*cdn.segment.com*', '*mixpanel.com*',
+    '*fullstory.com*', '*clarity.ms*', '*newrelic.com*', '*nr-data.net*',
+    '*bat.bing.com*', '*linkedin.com/px*', '*ads-twitter.com*', '*quantserve.com*',
+    '*scorecardresearch.com*', '*optimizely.com*',
+]
+
+# Rough transfer sizes used to estimate the bytes saved per blocked request
+ESTIMATED_BYTES_BY_TYPE = {
+    'Image': 40000,
+    'Font': 35000,
+    'Media': 500000,
+    'Stylesheet': 25000,
+    'Script': 30000,
+}
+DEFAULT_ESTIMATED_BYTES = 10000
+
+# Whether browser sessions record the performance log for resource reports
+RESOURCE_METRICS_ENABLED = os.environ.get('BROWSER_RESOURCE_METRICS', '').lower() in ('1', 'true', 'yes')
+
+# Images the content settings kept from loading; they never reach the network log
+_BLOCKED_IMAGES_SCRIPT = """
+const sources = new Set();
+for (const image of document.images) {
+    const src = image.currentSrc || image.src;
+    if (src && !src.startsWith('data:') && image.naturalWidth === 0) { sources.add(src); }
+}
+return sources.size;
+"""
+
+
+class ResourcePolicy:
+    """What a browser session should skip downloading"""
+
+    def __init__(self, blocked_types=('image', 'font', 'media'), block_trackers=True,
+                 blocked_patterns=(), page_load_strategy='eager', collect_metrics=None):
+        """
+        Initialize the policy
+
+        Args:
+            blocked_types (tuple): Resource types to block (keys of RESOURCE_TYPE_PATTERNS)
+            block_trackers (bool): Whether to block known analytics/ad hosts
+            blocked_patterns (tuple): Extra URL wildcard patterns to block
+            page_load_strategy (str): Selenium page load strategy ('normal', 'eager', 'none')
+            collect_metrics (bool): Record network usage for report_resource_usage
+                (None = RESOURCE_METRICS_ENABLED)
+        """
+        unknown = set(blocked_types) - set(RESOURCE_TYPE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+
+        self.blocked_types = tuple(blocked_types)
+        self.block_trackers = block_trackers
+        self.blocked_patterns = tuple(blocked_patterns)
+        self.page_load_strategy = page_load_strategy
+        self.collect_metrics = RESOURCE_METRICS_ENABLED if collect_metrics is None else collect_metrics
+
+    @classmethod
+    def from_env(cls, default):
+        """
+        Build a policy from environment overrides, falling back to a default
+
+        BROWSER_BLOCKED_RESOURCES: comma-separated resource types, or 'none'
+        BROWSER_BLOCKED_URLS: comma-separated extra URL patterns
+        BROWSER_PAGE_LOAD_STRATEGY: 'normal', 'eager' or 'none'
+
+        Args:
+            default (ResourcePolicy): Policy used for unset variables
+
+        Returns:
+            ResourcePolicy: Resulting policy
+        """
+        types = os.environ.get('BROWSER_BLOCKED_RESOURCES')
+        if types is None:
+            blocked_types, block_trackers = default.blocked_types, default.block_trackers
+        elif types.strip().lower() == 'none':
+            blocked_types, block_trackers = (), False
+        else:
+            blocked_types = tuple(t.strip().lower() for t in types.split(',') if t.strip())
+            block_trackers = default.block_trackers
+
+        patterns = os.environ.get('BROWSER_BLOCKED_URLS', '')
+        extra_patterns = tuple(p.strip() for p in patterns.split(',') if p.strip())
+
+        return cls(
+            blocked_types=blocked_types,
+            block_trackers=block_trackers,
+            blocked_patterns=default.blocked_patterns + extra_patterns,
+            page_load_strategy=os.environ.get('BROWSER_PAGE_LOAD_STRATEGY', default.page_load_strategy),
+            collect_metrics=default.collect_metrics
+        )
+
+    def url_patterns(self):
+        """
+        Get the URL patterns blocked by this policy
+
+        Returns:
+            list: URL wildcard patterns
+        """
+        patterns = []
+        for resource_type in self.blocked_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        if self.block_trackers:
+            patterns.extend(TRACKER_PATTERNS)
+        patterns.extend(self.blocked_patterns)
+        return patterns
+
+    def apply_to_options(self, options, vendor='goog'):
+        """
+        Configure browser options before the driver is created
+
+        Args:
+            options: Selenium Chrome or Edge Options
+            vendor (str): Capability prefix ('goog' for Chrome, 'ms' for Edge)
+        """
+        options.page_load_strategy = self.page_load_strategy
+
+        # Content settings stop images from being requested at all
+        if 'image' in self.blocked_types:
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+
+        # The performance log feeds the resource report; it is only enabled when that is wanted
+        if self.collect_metrics:
+            options.set_capability(f'{vendor}:loggingPrefs', {'performance': 'ALL'})
+
+    def install(self, driver):
+        """
+        Install the URL blocklist on a running driver through CDP
+
+        Args:
+            driver: Chromium-based Selenium WebDriver
+        """
+        if self.collect_metrics:
+            _session_usage[driver] = ResourceUsage(count_blocked_images='image' in self.blocked_types)
+
+        patterns = self.url_patterns()
+        if not patterns:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            logger.info(f"Blocking {len(patterns)} resource URL patterns for this browser session")
+        except Exception as e:
+            # Not a Chromium driver, or CDP unavailable - pages still load normally
+            logger.warning(f"Could not install resource blocking: {e}")
+
+
+# Scraping only reads the DOM, so stylesheets can go too
+SCRAPER_RESOURCE_POLICY = ResourcePolicy(blocked_types=('image', 'font', 'media', 'stylesheet'))
+
+# Auto-fill checks element visibility, which needs stylesheets
+FORM_FILL_RESOURCE_POLICY = ResourcePolicy(blocked_types=('image', 'font', 'media'))
+
+
+class ResourceUsage:
+    """Accumulates network usage from a driver's performance log"""
+
+    def __init__(self, count_blocked_images=False):
+        """
+        Initialize the counters
+
+        Args:
+            count_blocked_images (bool): Also count images blocked through content settings
+        """
+        self.count_blocked_images = count_blocked_images
+        self.requests_loaded = 0
+        self.bytes_loaded = 0
+        self.requests_blocked = 0
+        self.estimated_bytes_saved = 0
+        self._request_types = {}
+
+    def collect(self, driver, page_loaded=True):
+        """
+        Drain the driver's performance log into the counters
+
+        Args:
+            driver: Selenium WebDriver created with performance logging enabled
+            page_loaded (bool): Also count the blocked images of the current page;
+                pass this once per page, after it has loaded
+        """
+        if page_loaded and self.count_blocked_images:
+            try:
+                images = int(driver.execute_script(_BLOCKED_IMAGES_SCRIPT) or 0)
+            except Exception:
+                images = 0
+            self.requests_blocked += images
+            self.estimated_bytes_saved += images * ESTIMATED_BYTES_BY_TYPE['Image']
+
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            return
+
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.requestWillBeSent':
+                self._request_types[params.get('requestId')] = params.get('type')
+            elif method == 'Network.loadingFinished':
+                self.requests_loaded += 1
+                self.bytes_loaded += int(params.get('encodedDataLength') or 0)
+                self._request_types.pop(params.get('requestId'), None)
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                resource_type = params.get('type') or self._request_types.get(params.get('requestId'))
+                self.requests_blocked += 1
+                self.estimated_bytes_saved += ESTIMATED_BYTES_BY_TYPE.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+                self._request_types.pop(params.get('requestId'), None)
+
+    def as_dict(self):
+        """Return the counters as a dictionary"""
+        return {
+            'requests_loaded': self.requests_loaded,
+            'bytes_loaded': self.bytes_loaded,
+            'requests_blocked': self.requests_blocked,
+            'estimated_bytes_saved': self.estimated_bytes_saved,
+        }
+
+
+# Usage of each driver whose policy collects metrics; entries go away with the driver
+_session_usage = weakref.WeakKeyDictionary()
+
+
+def record_page_usage(driver):
+    """
+    Drain the performance log of a loaded page into the session's usage
+
+    Does nothing for drivers whose policy does not collect metrics.
+
+    Args:
+        driver: Selenium WebDriver created with a ResourcePolicy
+    """
+    usage = _session_usage.get(driver)
+    if usage is not None:
+        usage.collect(driver)
+
+
+def report_resource_usage(driver, session_name="browser"):
+    """
+    Log and return the network usage of a browser session, just before it quits
+
+    Args:
+        driver: Selenium WebDriver created with a ResourcePolicy
+        session_name (str): Label for the log line
+
+    Returns:
+        dict: Loaded and blocked request counts, bytes loaded and estimated bytes saved
+            (None if the session did not collect metrics)
+    """
+    usage = _session_usage.pop(driver, None)
+    if usage is None:
+        return None
+    # The current page was counted when it loaded; only the log is left to drain
+    usage.collect(driver, page_loaded=False)
+    report = usage.as_dict()
+    logger.info(
+        f"{session_name} session: loaded {report['requests_loaded']} requests "
+        f"({report['bytes_loaded'] / 1024:.0f} KB), blocked {report['requests_blocked']} "
+        f"(~{report['estimated_bytes_saved'] / 1024:.0f} KB saved)"
+    )
+    return report
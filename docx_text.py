@@ -0,0 +1,166 @@
+"""
+DOCX Text Module for Berojgar
+
+This module pulls resume text out of .docx files without building a document
+tree. The WordprocessingML parts are streamed straight from the zip archive
+into an lxml parser target, which keeps run text and turns paragraph, line
+break and tab boundaries into the same line structure PDF extraction gives.
+Table rows become "| cell | cell |" lines, list paragraphs get a bullet, and
+page headers (where many resume templates keep the name and contact details)
+come before the body. Text boxes are read from their mc:Choice markup only,
+as the mc:Fallback copy repeats the same text.
+"""
+
+import logging
+import re
+import zipfile
+
+from lxml import etree
+
+logger = logging.getLogger("docx_text")
+
+# Work cap for huge documents
+MAX_TEXT_CHARS = 200000
+
+DOCUMENT_PART = 'word/document.xml'
+_HEADER_PART_RE = re.compile(r'^word/header(\d*)\.xml$')
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_PARAGRAPH, _TEXT, _PARAGRAPH_PROPS, _NUMBERING = _W + 'p', _W + 't', _W + 'pPr', _W + 'numPr'
+_ROW, _CELL = _W + 'tr', _W + 'tc'
+_RUN_MARKS = {_W + 'tab': '\t', _W + 'br': '\n', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+
+# Markup-compatibility alternative for consumers that cannot read the mc:Choice content
+_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+_FEED_CHUNK = 65536
+
+
+class _DocxTextTarget:
+    """lxml parser target that keeps run text with paragraph, list and table structure"""
+
+    def __init__(self, max_chars):
+        self.max_chars = max_chars
+        self.length = 0
+        self.parts = []
+        self.in_text = False
+        self.props_depth = 0
+        self.fallback_depth = 0
+        self.paragraphs = []  # [start index in parts, is list item] per open paragraph
+        self.rows = []  # Cell texts per open table row
+        self.cells = []  # Start index in parts per open cell
+
+    @property
+    def full(self):
+        return self.length >= self.max_chars
+
+    def start(self, tag, attrib):
+        if tag == _FALLBACK:
+            self.fallback_depth += 1
+        if self.fallback_depth:
+            return
+        if tag == _TEXT:
+            self.in_text = True
+        elif tag == _PARAGRAPH:
+            self.paragraphs.append([len(self.parts), False])
+        elif tag == _PARAGRAPH_PROPS:
+            self.props_depth += 1
+        elif self.props_depth:
+            # Tab stops and numbering inside paragraph properties are not text
+            if tag == _NUMBERING and self.paragraphs:
+                self.paragraphs[-1][1] = True
+        elif tag in _RUN_MARKS:
+            self.parts.append(_RUN_MARKS[tag])
+        elif tag == _ROW:
+            self.rows.append([])
+        elif tag == _CELL:
+            self.cells.append(len(self.parts))
+
+    def end(self, tag):
+        if self.fallback_depth:
+            if tag == _FALLBACK:
+                self.fallback_depth -= 1
+            return
+        if tag == _TEXT:
+            self.in_text = False
+        elif tag == _PARAGRAPH_PROPS:
+            self.props_depth -= 1
+        elif tag == _PARAGRAPH and self.paragraphs:
+            start, is_list_item = self.paragraphs.pop()
+            if is_list_item and len(self.parts) > start:
+                self.parts.insert(start, '• ')
+            self.parts.append('\n')
+        elif tag == _CELL and self.cells:
+            start = self.cells.pop()
+            cell = ' '.join(''.join(self.parts[start:]).split())
+            del self.parts[start:]
+            if self.rows:
+                self.rows[-1].append(cell)
+        elif tag == _ROW and self.rows:
+            cells = self.rows.pop()
+            if any(cells):
+                self.parts.append('| ' + ' | '.join(cells) + ' |\n')
+
+    def data(self, data):
+        if not self.in_text or self.full:
+            return
+        self.parts.append(data)
+        self.length += len(data)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return ''.join(self.parts)
+
+
+def _stream_part(archive, name, max_chars):
+    target = _DocxTextTarget(max_chars)
+    parser = etree.XMLParser(target=target, resolve_entities=False, no_network=True)
+    with archive.open(name) as part:
+        while not target.full:
+            chunk = part.read(_FEED_CHUNK)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    if target.full:
+        # The rest of the part was never fed, so there is no document end to close
+        return target.close()
+    return parser.close()
+
+
+def extract_docx_text(source, max_chars=MAX_TEXT_CHARS):
+    """
+    Extract the text of a .docx file without building a document tree
+
+    Args:
+        source (str or file): Path or binary file object of the .docx file
+        max_chars (int): Stop collecting after this many characters of text
+
+    Returns:
+        str: Header and body text, one line per paragraph or table row
+            ('' if the file is not a readable .docx)
+    """
+    try:
+        with zipfile.ZipFile(source) as archive:
+            names = archive.namelist()
+            # header2.xml before header10.xml
+            parts = sorted((name for name in names if _HEADER_PART_RE.match(name)),
+                           key=lambda name: int(_HEADER_PART_RE.match(name).group(1) or 0))
+            parts.append(DOCUMENT_PART)
+
+            texts = []
+            remaining = max_chars
+            for name in parts:
+                if remaining <= 0:
+                    break
+                text = _stream_part(archive, name, remaining)
+                texts.append(text)
+                remaining -= len(text)
+    except (zipfile.BadZipFile, KeyError, OSError, etree.XMLSyntaxError) as e:
+        logger.warning(f"Could not read DOCX text: {e}")
+        return ''
+
+    text = '\n'.join(text.strip('\n') for text in texts if text.strip())
+    # Drop the empty paragraphs used as spacers, keeping one blank line at most
+    return re.sub(r'\n{3,}', '\n\n', text)
@@ -17,6 +17,7 @@ from PyPDF2 import PdfReader
 import pandas as pd
 from fuzzywuzzy import fuzz
 from collections import Counter
+from docx_text import extract_docx_text
 
 # Download required NLTK data
 try:
@@ -38,6 +39,26 @@ except OSError:
     subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
     nlp = spacy.load("en_core_web_sm")
 
+# Name NER runs on the resume header first and only escalates to these larger
+# windows (character offsets) if no PERSON entity turns up
+NAME_NER_WINDOWS = (500, 2000)
+
+# How far past a window size a chunk may run to reach a line break
+NAME_NER_SLACK = 200
+
+
+def _name_ner_disabled_pipes():
+    """Pipeline components name extraction can skip: all but NER and the tok2vec it listens to"""
+    keep = {'ner'}
+    if 'tok2vec' in nlp.pipe_names:
+        listeners = getattr(nlp.get_pipe('tok2vec'), 'listening_components', None)
+        if listeners is None or 'ner' in listeners:
+            keep.add('tok2vec')
+    return [name for name in nlp.pipe_names if name not in keep]
+
+
+NAME_NER_DISABLED = _name_ner_disabled_pipes()
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -121,11 +142,12 @@ def extract_resume_info(file_path):
         # Extract text based on file type
         if file_ext == '.pdf':
             text = extract_text_from_pdf(file_path)
-        elif file_ext in ['.doc', '.docx']:
-            # For simplicity, we'll use a placeholder for DOC/DOCX extraction
-            # In a real implementation, you would use a library like python-docx
-            text = "DOC/DOCX extraction not implemented"
-            logger.warning("DOC/DOCX extraction not fully implemented")
+        elif file_ext == '.docx':
+            text = extract_docx_text(file_path)
+        elif file_ext == '.doc':
+            # Legacy binary Word files are not parsed
+            text = "DOC extraction not implemented"
+            logger.warning("DOC extraction not implemented")
         else:
             logger.error(f"Unsupported file format: {file_ext}")
             return {"error": f"Unsupported file format: {file_ext}"}
@@ -135,9 +157,6 @@ def extract_resume_info(file_path):
             logger.error("No text extracted from resume")
             return {"error": "No text extracted from resume"}
         
-        # Parse the text with spaCy for NER
-        doc = nlp(text)
-        
         # Extract structured information
         resume_data = {
             "raw_text": text,
@@ -150,7 +169,7 @@ def extract_resume_info(file_path):
         }
         
         # Extract specific information
-        resume_data["name"] = extract_name(doc, text)
+        resume_data["name"] = extract_name(text)
         resume_data["email"] = extract_email(text)
         resume_data["phone"] = extract_phone(text)
         resume_data["skills"] = extract_skills(text)
@@ -284,23 +303,59 @@ def identify_resume_sections(text):
     return sections
 
 # Information extraction functions
-def extract_name(doc, text):
+def _name_windows(text):
+    """
+    Split the first quarter of the text into chunks for name NER, header first
+    
+    Chunks end at a line break within NAME_NER_SLACK characters of the window
+    size, or else at the last whitespace before that, so an entity is never
+    cut in half and a text without line breaks is not parsed much past its
+    first quarter.
+    
+    Args:
+        text (str): Raw resume text
+        
+    Returns:
+        generator: (start, end) character offsets of each chunk
+    """
+    limit = len(text) / 4
+    start = 0
+    for size in NAME_NER_WINDOWS + (limit,):
+        if start >= limit:
+            break
+        target = int(min(size, limit))
+        cap = target + NAME_NER_SLACK
+        end = text.find('\n', target, cap)
+        if end == -1:
+            end = max(text.rfind(space, start, cap) for space in ' \t\n')
+            if end <= start or cap >= len(text):
+                end = min(cap, len(text))
+        if end > start:
+            yield start, end
+            start = end
+
+def extract_name(text):
     """
     Extract candidate name using NER
     
+    NER runs on the header window only, escalating to larger windows of the
+    first quarter of the resume if no PERSON entity is found there; the
+    other pipeline components are disabled for these calls.
+    
     Args:
-        doc (spacy.Doc): Processed spaCy document
         text (str): Raw resume text
         
     Returns:
         str: Extracted name or 'Not found'
     """
     # Try to find name using spaCy's NER
-    for ent in doc.ents:
-        if ent.label_ == "PERSON":
-            # Check if it's likely a name (near the beginning of the resume)
-            if ent.start_char < len(text) / 4:  # In first quarter of text
-                return ent.text
+    for start, end in _name_windows(text):
+        doc = nlp(text[start:end], disable=NAME_NER_DISABLED)
+        for ent in doc.ents:
+            if ent.label_ == "PERSON":
+                # Check if it's likely a name (near the beginning of the resume)
+                if start + ent.start_char < len(text) / 4:  # In first quarter of text
+                    return ent.text
     
     # Fallback: Look for a name-like pattern at the beginning
     lines = text.split('\n')
@@ -7,9 +7,20 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import Select
 
+from application_context import ApplicationContext, AnswerCache, answer_cache, normalize_question
+from browser_resources import ResourcePolicy, FORM_FILL_RESOURCE_POLICY, record_page_usage, report_resource_usage
+from form_templates import form_templates, field_key, fingerprint_form, learned_form_key
+from page_waits import (wait_for_page_ready, wait_for_quiescence, wait_for_value,
+                        PAGE_LOAD_TIMEOUT, SETTLE_TIMEOUT, VALUE_TIMEOUT)
+from question_classifier import question_categories, fallback_answer_categories, answer_topics
+
+# Seconds the filled form stays open for review before the browser closes
+REVIEW_PAUSE = float(os.environ.get('AUTOFILL_REVIEW_PAUSE', 10))
+
 
 # ================ Setup Stealth Chrome ================
-def create_driver():
+def create_driver(headless=False):
+    policy = ResourcePolicy.from_env(FORM_FILL_RESOURCE_POLICY)
     try:
         # First, try using webdriver_manager to automatically download and manage ChromeDriver
         try:
@@ -24,12 +35,18 @@ def create_driver():
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
             
-            # Add headless option if needed
-            # options.add_argument("--headless")
+            # Batch runs fill forms without a visible window
+            if headless:
+                options.add_argument("--headless=new")
+                options.add_argument("--window-size=1920,1080")
+            
+            # Skip images, fonts, media and trackers; don't wait for them to load
+            policy.apply_to_options(options)
             
             # Use ChromeDriverManager to automatically download and manage ChromeDriver
             service = Service(ChromeDriverManager().install())
             driver = webdriver.Chrome(service=service, options=options)
+            policy.install(driver)
             print("[INFO] Successfully created Chrome driver using webdriver_manager")
             return driver
         except Exception as e:
@@ -43,8 +60,13 @@ def create_driver():
         options.add_argument("--disable-extensions")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+        policy.apply_to_options(options)
         
         driver = webdriver.Chrome(options=options)
+        policy.install(driver)
         return driver
         
     except Exception as e:
@@ -65,13 +87,22 @@ def create_driver():
                 from webdriver_manager.microsoft import EdgeChromiumDriverManager
                 service = EdgeService(EdgeChromiumDriverManager().install())
                 options = EdgeOptions()
+                if headless:
+                    options.add_argument("--headless=new")
+                # Edge is Chromium too, so the same resource blocking applies
+                policy.apply_to_options(options, vendor='ms')
                 driver = webdriver.Edge(service=service, options=options)
+                policy.install(driver)
                 print("[INFO] Successfully created Edge driver as fallback")
                 return driver
             except:
                 # Direct Edge instantiation
                 options = EdgeOptions()
+                if headless:
+                    options.add_argument("--headless=new")
+                policy.apply_to_options(options, vendor='ms')
                 driver = webdriver.Edge(options=options)
+                policy.install(driver)
                 return driver
         except Exception as edge_error:
             print(f"[ERROR] Failed to create Edge driver: {edge_error}")
@@ -113,11 +144,10 @@ def js_set_value(driver, element, value):
 # ================ Debug Field State Helper ===================
 def debug_field_state(field, label=None):
     try:
-        name = field.get_attribute("name")
-        value = field.get_attribute("value")
-        readonly = field.get_attribute("readonly")
-        disabled = field.get_attribute("disabled")
-        outer_html = field.get_attribute("outerHTML")
+        # One round trip instead of one per attribute
+        name, value, readonly, disabled, outer_html = field.parent.execute_script(
+            "const f = arguments[0]; return [f.getAttribute('name'), f.value, f.getAttribute('readonly'), "
+            "f.getAttribute('disabled'), f.outerHTML];", field)
         print(f"[DEBUG] {label or ''} Field name: {name}, value: {value}, readonly: {readonly}, disabled: {disabled}\n[DEBUG] OuterHTML: {outer_html[:300]}...\n")
     except Exception as e:
         print(f"[DEBUG] Could not get field state: {e}")
@@ -125,141 +155,187 @@ def debug_field_state(field, label=None):
 
 # ================ Force Fill Field JS Helper ===================
 def force_fill_field_js(driver, field, value, label=None, attempts=10, delay=0.5):
+    # delay: seconds to wait for the value to stick before the next attempt
     for i in range(attempts):
         try:
             driver.execute_script(
                 "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('input', {bubbles:true})); arguments[0].dispatchEvent(new Event('change', {bubbles:true})); arguments[0].blur();",
                 field, value)
-            curr_value = field.get_attribute("value")
-            print(f"[DEBUG] Force fill attempt {i+1}/{attempts} for {label or field.get_attribute('name')}: value now '{curr_value}'")
-            if curr_value == value:
-                break
+            if wait_for_value(driver, field, value, timeout=delay):
+                print(f"[DEBUG] Force fill attempt {i+1}/{attempts} for {label}: value stuck")
+                return True
+            print(f"[DEBUG] Force fill attempt {i+1}/{attempts} for {label}: value was reset")
         except Exception as e:
             print(f"[DEBUG] Force fill error: {e}")
-        time.sleep(delay)
+    return False
+
+
+# ================ Batch Fill Helper ===================
+# Enables, sets and fires input/change/blur on every field in one call
+FILL_FIELDS_SCRIPT = """
+const fields = arguments[0], values = arguments[1];
+for (let i = 0; i < fields.length; i++) {
+    const f = fields[i];
+    try {
+        f.removeAttribute('readonly');
+        f.removeAttribute('disabled');
+        f.value = values[i];
+        f.dispatchEvent(new Event('input', {bubbles: true}));
+        f.dispatchEvent(new Event('change', {bubbles: true}));
+        f.blur();
+    } catch (e) {}
+}
+"""
+
+READ_VALUES_SCRIPT = "return Array.from(arguments[0], function(f) { try { return f.value; } catch (e) { return null; } });"
+
+
+def fill_fields_batch(driver, fields, values, attempts=3):
+    """
+    Set the values of many fields with one script call and verify them together
+
+    Fields whose value was reset by the page are set again, up to attempts times.
+
+    Args:
+        driver: Selenium WebDriver instance
+        fields (list): WebElements to fill
+        values (list): Value for each field
+        attempts (int): Maximum fill rounds
+
+    Returns:
+        list: Whether each field kept its value
+    """
+    filled = [False] * len(fields)
+    pending = list(range(len(fields)))
+    for attempt in range(attempts):
+        if not pending:
+            break
+        try:
+            driver.execute_script(FILL_FIELDS_SCRIPT, [fields[i] for i in pending], [values[i] for i in pending])
+            # Let the page's handlers run once for the whole batch
+            wait_for_quiescence(driver, timeout=VALUE_TIMEOUT)
+            current = driver.execute_script(READ_VALUES_SCRIPT, [fields[i] for i in pending])
+        except Exception as e:
+            print(f"[DEBUG] Batch fill error: {e}")
+            continue
+        for i, value in zip(list(pending), current):
+            if value == values[i]:
+                filled[i] = True
+                pending.remove(i)
+        if pending:
+            print(f"[DEBUG] Batch fill attempt {attempt+1}/{attempts}: {len(pending)} values were reset")
+    return filled
 
 
 # ================ AI Answer Generation ===================
-def generate_answer(question_text, resume_data, job_description):
+def generate_answer(question_text, resume_data, job_description, context=None):
     """
     Generate intelligent answers to job application questions based on resume data and job description.
     Uses a local language model approach for flexible, high-quality answers to any question type.
+    Answers are cached per question category, normalized question, resume and job.
     
     Args:
         question_text (str): The question text extracted from the form field
         resume_data (dict): Dictionary containing resume information
         job_description (str or dict): Job description text or URL
+        context (ApplicationContext): Pre-built context for this application (built from
+            resume_data and job_description if not given)
     
     Returns:
         str: Generated answer to the question
     """
-    import random
-    import requests
-    import re
+    if context is None:
+        context = ApplicationContext(resume_data, job_description)
     
     # Normalize question text
     question = question_text.strip()
     if not question.endswith('?'):
         question = question + '?'
     
-    # Extract job description text if it's a URL
-    job_desc_text = ""
-    job_skills = []
-    job_title = ""
-    company_name = ""
-    
-    if isinstance(job_description, dict):
-        job_desc_text = job_description.get('description', '')
-        job_skills = job_description.get('Required_Skills', [])
-        job_title = job_description.get('Role', '')
-        company_name = job_description.get('company', '')
-    elif isinstance(job_description, str) and (job_description.startswith('http://') or job_description.startswith('https://')):
-        try:
-            from job_description_extractor import extract_job_description
-            job_data = extract_job_description(job_description)
-            job_desc_text = job_data.get('description', '')
-            job_skills = job_data.get('Required_Skills', [])
-            job_title = job_data.get('Role', '')
-            
-            # Try to extract company name from URL
-            import urllib.parse
-            parsed_url = urllib.parse.urlparse(job_description)
-            domain = parsed_url.netloc
-            if 'www.' in domain:
-                domain = domain.split('www.')[1]
-            if '.' in domain:
-                company_name = domain.split('.')[0].capitalize()
-        except Exception as e:
-            print(f"[DEBUG] Error extracting job description: {e}")
-    
-    # Extract key information from resume data
-    name = resume_data.get('Name', resume_data.get('name', ''))
-    skills = resume_data.get('Skills', resume_data.get('skills', []))
-    if not isinstance(skills, list):
-        skills = [s.strip() for s in str(skills).split(',')]
-    
-    experience_years = resume_data.get('Experience', resume_data.get('experience', 0))
-    try:
-        experience_years = int(experience_years)
-    except:
-        experience_years = 0
-        
-    education = resume_data.get('Education', resume_data.get('education', ''))
-    
     print(f"[INFO] Attempting to answer question: '{question}'")
     
     # First, check if this is a common form field that should use a template directly
     question_type = categorize_question(question)
     
+    cache_key = AnswerCache.key(question_type, question, context)
+    cached_answer = answer_cache.get(cache_key)
+    if cached_answer is not None:
+        print(f"[INFO] 🤖 Cached answer: '{cached_answer[:50]}...'")
+        return cached_answer
+    
+    answer = None
+    
     # Special handling for certain field types that should use templates
     if question_type in ["website_url", "college_name"]:
         print(f"[INFO] Using template for field type: {question_type}")
-        template_answer = generate_targeted_answer(
+    else:
+        # For all other questions, use the local language model approach
+        try:
+            # Try using a local language model first
+            print("[INFO] Using local language model for flexible answer generation")
+            answer = generate_answer_with_local_model(question, resume_data, context.job_title, context.job_skills,
+                                                      context.company_name, context=context)
+            if answer and len(answer) > 20:  # Ensure we got a meaningful answer
+                print(f"[INFO] 🤖 Generated answer with local model: '{answer[:50]}...'")
+            else:
+                answer = None
+        except Exception as e:
+            print(f"[DEBUG] Local model error: {str(e)}")
+        
+        if answer is None:
+            # If local model fails, fall back to our enhanced template system
+            print(f"[INFO] Falling back to template system. Question type: {question_type}")
+    
+    if answer is None:
+        answer = generate_targeted_answer(
             question_type=question_type,
             question=question,
-            name=name,
-            skills=skills,
-            experience_years=experience_years,
-            education=education,
-            job_skills=job_skills,
-            job_title=job_title,
-            company_name=company_name,
-            job_desc_text=job_desc_text
+            name=context.name,
+            skills=context.skills,
+            experience_years=context.experience_years,
+            education=context.education,
+            job_skills=context.job_skills,
+            job_title=context.job_title,
+            company_name=context.company_name,
+            job_desc_text=context.job_desc_text
         )
-        print(f"[INFO] 🤖 Template answer: '{template_answer[:50]}...'")
-        return template_answer
+        print(f"[INFO] 🤖 Template answer: '{answer[:50]}...'")
     
-    # For all other questions, use the local language model approach
-    try:
-        # Try using a local language model first
-        print("[INFO] Using local language model for flexible answer generation")
-        answer = generate_answer_with_local_model(question, resume_data, job_title, job_skills, company_name)
-        if answer and len(answer) > 20:  # Ensure we got a meaningful answer
-            print(f"[INFO] 🤖 Generated answer with local model: '{answer[:50]}...'")
-            return answer
-    except Exception as e:
-        print(f"[DEBUG] Local model error: {str(e)}")
-    
-    # If local model fails, fall back to our enhanced template system
-    print(f"[INFO] Falling back to template system. Question type: {question_type}")
-    template_answer = generate_targeted_answer(
-        question_type=question_type,
-        question=question,
-        name=name,
-        skills=skills,
-        experience_years=experience_years,
-        education=education,
-        job_skills=job_skills,
-        job_title=job_title,
-        company_name=company_name,
-        job_desc_text=job_desc_text
-    )
-    
-    print(f"[INFO] 🤖 Template answer: '{template_answer[:50]}...'")
-    return template_answer
-
-
-def generate_answer_with_local_model(question, resume_data, job_title, job_skills, company_name):
+    answer_cache.put(cache_key, answer)
+    return answer
+
+
+def generate_answers(question_texts, resume_data, job_description, context=None):
+    """
+    Generate answers for all questions of a form in one batch
+
+    Questions that normalize to the same text are generated once.
+
+    Args:
+        question_texts (list): Question texts extracted from the form fields
+        resume_data (dict): Dictionary containing resume information
+        job_description (str or dict): Job description text or URL
+        context (ApplicationContext): Pre-built context for this application
+
+    Returns:
+        list: Answer for each question, in order (None where generation failed)
+    """
+    if context is None:
+        context = ApplicationContext(resume_data, job_description)
+    
+    answers = {}
+    for question_text in question_texts:
+        key = normalize_question(question_text)
+        if key not in answers:
+            try:
+                answers[key] = generate_answer(question_text, resume_data, job_description, context=context)
+            except Exception as e:
+                print(f"[ERROR] ❌ Could not generate an answer for '{question_text}': {e}")
+                answers[key] = None
+    return [answers[normalize_question(question_text)] for question_text in question_texts]
+
+
+def generate_answer_with_local_model(question, resume_data, job_title, job_skills, company_name, context=None):
     """
     Generate an answer using a local language model approach.
     This uses a combination of templates, rules, and context to create dynamic answers.
@@ -270,25 +346,19 @@ def generate_answer_with_local_model(question, resume_data, job_title, job_skill
         job_title (str): Job title
         job_skills (list): Required skills for the job
         company_name (str): Company name
+        context (ApplicationContext): Pre-parsed resume facts (parsed from resume_data if not given)
         
     Returns:
         str: Generated answer
     """
     import random
     
-    # Extract key information from resume
-    name = resume_data.get('Name', resume_data.get('name', ''))
-    skills = resume_data.get('Skills', resume_data.get('skills', []))
-    if not isinstance(skills, list):
-        skills = [s.strip() for s in str(skills).split(',')]
-    
-    experience = resume_data.get('Experience', resume_data.get('experience', 0))
-    try:
-        experience_years = int(experience)
-    except:
-        experience_years = 0
-        
-    education = resume_data.get('Education', resume_data.get('education', ''))
+    # Key information from resume, parsed once per application
+    if context is None:
+        context = ApplicationContext(resume_data)
+    skills = context.skills
+    experience_years = context.experience_years
+    education = context.education
     
     # Format skills for use in answers
     skills_str = ", ".join(skills[:3]) if skills else "technical skills"
@@ -299,35 +369,8 @@ def generate_answer_with_local_model(question, resume_data, job_title, job_skill
     # Check if it's a yes/no question
     is_yes_no = question_lower.startswith(('are', 'do', 'can', 'have', 'will', 'would', 'is', 'was', 'should', 'could'))
     
-    # Determine the general topic of the question
-    topics = {
-        'experience': ['experience', 'background', 'work history', 'previous', 'job', 'role'],
-        'skills': ['skills', 'abilities', 'competencies', 'proficient', 'expertise', 'capable', 'familiar'],
-        'education': ['education', 'degree', 'university', 'college', 'academic', 'study', 'qualification'],
-        'strengths': ['strength', 'good at', 'excel', 'best', 'advantage', 'strong'],
-        'weaknesses': ['weakness', 'improve', 'development', 'challenge', 'difficult', 'struggle'],
-        'motivation': ['why', 'interest', 'reason', 'motivate', 'aspire', 'goal', 'passion'],
-        'teamwork': ['team', 'collaborate', 'group', 'work with others', 'cooperation'],
-        'leadership': ['lead', 'manage', 'supervise', 'direct', 'guide', 'oversee'],
-        'problem_solving': ['problem', 'challenge', 'solution', 'resolve', 'overcome', 'address'],
-        'communication': ['communicate', 'explain', 'present', 'articulate', 'express', 'convey'],
-        'availability': ['available', 'start', 'notice', 'join', 'when', 'begin'],
-        'salary': ['salary', 'compensation', 'pay', 'wage', 'package', 'expect', 'money'],
-        'relocation': ['relocate', 'move', 'location', 'city', 'state', 'country'],
-        'remote': ['remote', 'work from home', 'wfh', 'telecommute', 'virtual', 'distance'],
-        'project': ['project', 'achievement', 'accomplish', 'deliver', 'success', 'implement'],
-        'tools': ['tool', 'software', 'technology', 'platform', 'system', 'framework', 'language'],
-    }
-    
-    # Determine the topic of the question
-    question_topic = 'general'
-    max_matches = 0
-    
-    for topic, keywords in topics.items():
-        matches = sum(1 for keyword in keywords if keyword in question_lower)
-        if matches > max_matches:
-            max_matches = matches
-            question_topic = topic
+    # Determine the topic of the question (most matching keywords)
+    question_topic = answer_topics.best(question_lower)
     
     # Generate a context-aware answer based on the topic
     if question_topic == 'experience':
@@ -431,7 +474,7 @@ def generate_answer_with_local_model(question, resume_data, job_title, job_skill
 def categorize_question(question):
     """
     Categorize the question into one of several types to generate appropriate answers.
-    Uses a comprehensive approach to analyze the question text and identify the most relevant category.
+    Uses the compiled keyword rules in question_classifier, which scan the question once.
     
     Args:
         question (str): The question text
@@ -439,134 +482,7 @@ def categorize_question(question):
     Returns:
         str: The question category
     """
-    question_lower = question.lower().strip()
-    # Remove punctuation for better matching
-    question_clean = ''.join(c for c in question_lower if c.isalnum() or c.isspace())
-    question_words = question_clean.split()
-    
-    # Exact matches for common form fields (highest priority)
-    exact_matches = {
-        'website': "website_url",
-        'linkedin': "website_url",
-        'github': "website_url",
-        'portfolio': "website_url",
-        'url': "website_url",
-        'link': "website_url",
-        'scholar profile': "publications",
-        'google scholar': "publications",
-        'full name of college': "college_name",
-        'university name': "college_name",
-        'college name': "college_name",
-        'name of institution': "college_name",
-        'name of university': "college_name",
-        'school name': "college_name",
-        'earliest start date': "start_date",
-        'when can you start': "start_date",
-        'available to start': "start_date",
-        'start date': "start_date",
-        'how did you hear': "referral_source",
-        'how did you find': "referral_source",
-        'referral source': "referral_source",
-    }
-    
-    # Check for exact matches first
-    for key, category in exact_matches.items():
-        if key in question_lower:
-            return category
-    
-    # Keyword-based categorization (second priority)
-    
-    # Website/URL fields
-    if any(term in question_lower for term in ['website', 'url', 'portfolio', 'linkedin', 'github', 'profile link']):
-        return "website_url"
-    
-    # College/University name
-    if any(term in question_lower for term in ['college', 'university', 'school', 'institution', 'alma mater', 'education']):
-        if any(term in question_lower for term in ['name', 'which', 'what']):
-            return "college_name"
-    
-    # Publications or projects
-    if any(term in question_lower for term in ['publication', 'research paper', 'project', 'portfolio', 'github', 'scholar', 'ml', 'dl', 'machine learning']):
-        return "publications"
-    
-    # Referral source
-    if any(term in question_lower for term in ['how did you hear', 'referral', 'how did you find', 'source', 'learn about']):
-        return "referral_source"
-    
-    # Salary expectations
-    if any(term in question_lower for term in ['salary', 'compensation', 'pay', 'wage', 'package', 'ctc', 'expected', 'expectation']):
-        return "salary"
-    
-    # Notice period / Start date
-    if any(term in question_lower for term in ['notice period', 'start date', 'when can you start', 'join', 'available', 'earliest', 'begin', 'commence']):
-        return "start_date"
-    
-    # Why this company
-    if any(term in question_lower for term in ['why do you want to work', 'why are you interested', 'why this company', 'why us', 'why join', 'why would you like']):
-        return "why_company"
-    
-    # Strengths
-    if any(term in question_lower for term in ['strength', 'strengths', 'what are you good at', 'best at', 'excel']):
-        return "strengths"
-    
-    # Weaknesses
-    if any(term in question_lower for term in ['weakness', 'weaknesses', 'areas of improvement', 'improve', 'development areas']):
-        return "weaknesses"
-    
-    # Work authorization
-    if any(term in question_lower for term in ['authorized to work', 'work authorization', 'visa', 'sponsorship', 'legally']):
-        return "work_authorization"
-    
-    # Reason for leaving
-    if any(term in question_lower for term in ['why did you leave', 'reason for leaving', 'why are you looking', 'current job']):
-        return "reason_for_leaving"
-    
-    # Work experience
-    if any(term in question_lower for term in ['experience', 'work history', 'previous jobs', 'tell us about your background']):
-        return "experience"
-    
-    # Education
-    if any(term in question_lower for term in ['education', 'degree', 'university', 'college', 'academic']):
-        return "education"
-    
-    # Achievements
-    if any(term in question_lower for term in ['achievement', 'accomplishment', 'proud of', 'success']):
-        return "achievements"
-    
-    # Team work
-    if any(term in question_lower for term in ['team', 'collaborate', 'work with others', 'group']):
-        return "teamwork"
-    
-    # Problem solving
-    if any(term in question_lower for term in ['problem', 'challenge', 'difficult situation', 'obstacle', 'overcome']):
-        return "problem_solving"
-    
-    # Leadership
-    if any(term in question_lower for term in ['lead', 'leadership', 'manage', 'supervise', 'team lead']):
-        return "leadership"
-    
-    # Communication skills
-    if any(term in question_lower for term in ['communicat', 'present', 'explain', 'articulate']):
-        return "communication"
-    
-    # Career goals
-    if any(term in question_lower for term in ['goal', 'aspiration', 'future', 'five years', '5 years', 'career path']):
-        return "career_goals"
-    
-    # Skills match
-    if any(term in question_lower for term in ['skill', 'qualify', 'qualification', 'requirement', 'match']):
-        return "skills_match"
-    
-    # Relocation
-    if any(term in question_lower for term in ['relocate', 'relocation', 'move', 'willing to']):
-        return "relocation"
-    
-    # Work style
-    if any(term in question_lower for term in ['work style', 'work environment', 'prefer to work', 'remote', 'office']):
-        return "work_style"
-    
-    # Default - general question
-    return "general"
+    return question_categories.classify(question)
 
 
 def generate_targeted_answer(question_type, question, name, skills, experience_years, education, job_skills, job_title, company_name, job_desc_text):
@@ -829,22 +745,22 @@ def rule_based_answer(question, resume_data):
     Returns:
         str: Generated answer to the question
     """
-    question_lower = question.lower()
+    category = fallback_answer_categories.classify(question)
     
     # Salary expectations
-    if any(term in question_lower for term in ['salary', 'compensation', 'pay', 'wage']):
+    if category == "salary":
         return "My salary expectations are flexible and based on the total compensation package, including benefits and growth opportunities. I'm looking for a salary that's competitive for this role in the industry."
     
     # Notice period
-    elif any(term in question_lower for term in ['notice period', 'start date', 'when can you start']):
+    elif category == "start_date":
         return "I can start immediately or with two weeks' notice to my current employer."
     
     # Why this company
-    elif any(term in question_lower for term in ['why do you want to work', 'why are you interested', 'why this company']):
+    elif category == "why_company":
         return f"I'm particularly interested in this position because it aligns with my skills in {', '.join(resume_data.get('skills', [])[:3])}. I'm impressed by the company's reputation and the opportunity to contribute to meaningful projects."
     
     # Strengths
-    elif any(term in question_lower for term in ['strength', 'strengths', 'what are you good at']):
+    elif category == "strengths":
         skills = resume_data.get('skills', [])
         if skills:
             return f"My key strengths include my expertise in {', '.join(skills[:3])}, combined with my {resume_data.get('experience', '3+')} years of experience and strong problem-solving abilities."
@@ -852,35 +768,35 @@ def rule_based_answer(question, resume_data):
             return "My key strengths include my technical expertise, combined with my problem-solving abilities and attention to detail."
     
     # Weaknesses
-    elif any(term in question_lower for term in ['weakness', 'weaknesses', 'areas of improvement']):
+    elif category == "weaknesses":
         return "I sometimes focus too much on details, but I've been working on balancing thoroughness with efficiency. I've implemented personal systems to help me stay focused on the big picture while maintaining quality."
     
     # Work authorization
-    elif any(term in question_lower for term in ['authorized to work', 'work authorization', 'visa', 'sponsorship']):
+    elif category == "work_authorization":
         return "Yes, I am authorized to work in this country without sponsorship."
     
     # Reason for leaving
-    elif any(term in question_lower for term in ['why did you leave', 'reason for leaving']):
+    elif category == "reason_for_leaving":
         return "I'm seeking new opportunities that offer more growth and challenges that align with my career goals. I'm looking for a role where I can fully utilize my skills and continue to develop professionally."
     
     # Work experience
-    elif any(term in question_lower for term in ['experience', 'work history', 'previous jobs']):
+    elif category == "experience":
         return f"I have {resume_data.get('experience', '3+')} years of experience in my field, working with technologies like {', '.join(resume_data.get('skills', [])[:3])}. I've consistently delivered results and developed expertise in solving complex problems."
     
     # Education
-    elif any(term in question_lower for term in ['education', 'degree', 'university', 'college']):
+    elif category == "education":
         return f"I have a {resume_data.get('education', 'Bachelor\'s')} degree with a focus on technical subjects relevant to this position. My education has provided me with a strong foundation in the principles and practices needed for this role."
     
     # Achievements
-    elif any(term in question_lower for term in ['achievement', 'accomplishment', 'proud of']):
+    elif category == "achievements":
         return f"One of my key achievements was successfully implementing projects using {', '.join(resume_data.get('skills', [])[:2])}. I'm particularly proud of my ability to deliver high-quality work while meeting tight deadlines."
     
     # Team work
-    elif any(term in question_lower for term in ['team', 'collaborate', 'work with others']):
+    elif category == "teamwork":
         return "I thrive in collaborative environments and enjoy working in teams. I value diverse perspectives and believe effective communication is key to successful teamwork. I'm equally comfortable taking direction or initiative as needed."
     
     # Problem solving
-    elif any(term in question_lower for term in ['problem', 'challenge', 'difficult situation']):
+    elif category == "problem_solving":
         return f"When facing challenges, I approach them methodically by analyzing the problem, researching solutions, and implementing the most effective approach. My background in {', '.join(resume_data.get('skills', [])[:2])} has equipped me with strong analytical and problem-solving skills."
     
     # Default answer
@@ -893,163 +809,240 @@ def generate_answer_hf(question_text, resume_data, job_description):
     """Legacy function for backward compatibility"""
     return generate_answer(question_text, resume_data, job_description)
 
-# ================ Helper: Extract Question Text ===================
-def extract_question_text(field, driver):
+
+# ================ Helper: Field Inventory ===================
+FIELD_INVENTORY_SCRIPT = """
+function clean(text) { return (text || '').trim(); }
+
+function nearestHeading(element) {
+    function isHeading(el) {
+        return el.tagName.match(/^H[1-6]$/) ||
+               el.classList.contains('question') ||
+               el.classList.contains('field-label');
+    }
+    let sibling = element.previousElementSibling;
+    while (sibling) {
+        if (isHeading(sibling)) return sibling.textContent.trim();
+        sibling = sibling.previousElementSibling;
+    }
+    let parent = element.parentElement;
+    if (parent) {
+        sibling = parent.previousElementSibling;
+        while (sibling) {
+            if (isHeading(sibling)) return sibling.textContent.trim();
+            sibling = sibling.previousElementSibling;
+        }
+    }
+    return '';
+}
+
+// Rows of ROW_HEIGHT px -> question-class elements starting in that row
+const ROW_HEIGHT = 100;
+function buildQuestionIndex() {
+    const index = new Map();
+    let order = 0;
+    for (const className of ['question', 'field-label', 'form-label', 'control-label', 'question-text']) {
+        for (const el of document.querySelectorAll('.' + className)) {
+            const top = el.getBoundingClientRect().top + window.scrollY;
+            const row = Math.floor(top / ROW_HEIGHT);
+            if (!index.has(row)) index.set(row, []);
+            index.get(row).push({el: el, top: top, order: order++});
+        }
+    }
+    return index;
+}
+
+// First question-class element (in class, then document order) within 100px vertically
+function nearbyQuestionText(index, fieldTop) {
+    const row = Math.floor(fieldTop / ROW_HEIGHT);
+    let best = null;
+    for (const r of [row - 1, row, row + 1]) {
+        for (const candidate of index.get(r) || []) {
+            if (Math.abs(candidate.top - fieldTop) < 100 && (!best || candidate.order < best.order)) {
+                const text = clean(candidate.el.innerText);
+                if (text.length > 3) best = {order: candidate.order, text: text};
+            }
+        }
+    }
+    return best ? best.text : '';
+}
+
+// Question text: aria-label/placeholder/title, then <label for>, then short parent or
+// grandparent text, the nearest heading, nearby question divs, and finally the field name
+function questionText(field, labelText, questionIndex) {
+    for (const attr of ['aria-label', 'placeholder', 'title']) {
+        const value = clean(field.getAttribute(attr));
+        if (value.length > 3) return value;
+    }
+    if (labelText) return labelText;
+
+    const parent = field.parentElement;
+    if (parent) {
+        const parentText = clean(parent.innerText);
+        if (parentText && parentText.length < 200) return parentText;
+        if (parentText.length < 3 && parent.parentElement) {
+            const grandparentText = clean(parent.parentElement.innerText);
+            if (grandparentText && grandparentText.length < 200) return grandparentText;
+        }
+    }
+
+    const heading = nearestHeading(field);
+    if (heading.length > 3) return heading;
+
+    const nearby = nearbyQuestionText(questionIndex, field.getBoundingClientRect().top + window.scrollY);
+    if (nearby) return nearby;
+
+    const name = field.getAttribute('name') || '';
+    if (name.toLowerCase().indexOf('[question]') !== -1) {
+        const match = name.match(/\\[(\\d+)\\]/);
+        if (match) {
+            const questionElem = document.querySelector('[data-question-id="' + match[1] + '"]');
+            if (questionElem && clean(questionElem.innerText)) return clean(questionElem.innerText);
+        }
+    }
+    if (name) return 'Question about ' + name.replace(/_/g, ' ');
+    return '(Unknown Question)';
+}
+
+const questionIndex = buildQuestionIndex();
+
+const fields = [
+    ...document.getElementsByTagName('input'),
+    ...document.getElementsByTagName('textarea'),
+    ...document.getElementsByTagName('select')
+];
+
+return fields.map(function(field, index) {
+    let labelText = '';
+    if (field.id) {
+        const label = document.querySelector('label[for="' + CSS.escape(field.id) + '"]');
+        if (label) labelText = clean(label.innerText);
+    }
+    const style = window.getComputedStyle(field);
+    const rect = field.getBoundingClientRect();
+    const tag = field.tagName.toLowerCase();
+    return {
+        element: field,
+        index: index,
+        tag: tag,
+        name: field.getAttribute('name'),
+        id: field.getAttribute('id'),
+        type: tag === 'input' ? (field.getAttribute('type') || 'text').toLowerCase() : (tag === 'select' ? field.type : tag),
+        placeholder: field.getAttribute('placeholder'),
+        aria_label: field.getAttribute('aria-label'),
+        label: labelText,
+        question_text: questionText(field, labelText, questionIndex),
+        value: field.value,
+        visible: style.display !== 'none' && style.visibility !== 'hidden' && rect.width > 0 && rect.height > 0,
+        disabled: field.disabled,
+        readonly: field.readOnly === true,
+        options: tag === 'select' ? Array.from(field.options).map(function(option) {
+            return {text: clean(option.innerText || option.text), value: option.value};
+        }) : []
+    };
+});
+"""
+
+
+def get_field_inventory(driver):
     """
-    Extract the question text associated with a form field using multiple strategies.
-    This function tries various methods to find the question text, including:
-    1. Checking aria-label and placeholder attributes
-    2. Finding associated <label> elements
-    3. Looking at parent/sibling text content
-    4. Examining nearby heading elements
-    5. Checking for question text in divs near the field
-    
+    Collect metadata for every input, textarea and select in one round trip
+
     Args:
-        field: Selenium WebElement for the form field
         driver: Selenium WebDriver instance
-        
+
     Returns:
-        str: The extracted question text or "(Unknown Question)" if not found
+        list: One dict per field with the WebElement ('element') plus name, id,
+            type, placeholder, aria_label, label, question_text, value,
+            visible, disabled, readonly and options
     """
-    # Strategy 1: Try to get label by 'aria-label', 'placeholder', or 'title'
-    label = field.get_attribute('aria-label')
-    if label and len(label.strip()) > 3:
-        return label.strip()
-        
-    placeholder = field.get_attribute('placeholder')
-    if placeholder and len(placeholder.strip()) > 3:
-        return placeholder.strip()
-        
-    title = field.get_attribute('title')
-    if title and len(title.strip()) > 3:
-        return title.strip()
-    
-    # Strategy 2: Try to find <label for=...>
-    field_id = field.get_attribute('id')
-    if field_id:
-        try:
-            label_elem = driver.find_element(By.CSS_SELECTOR, f'label[for="{field_id}"]')
-            if label_elem and label_elem.text.strip():
-                return label_elem.text.strip()
-        except Exception:
-            pass
-    
-    # Strategy 3: Try parent element text
     try:
-        parent = field.find_element(By.XPATH, './..')
-        parent_text = parent.text.strip()
-        if parent_text and len(parent_text) < 200:  # Avoid getting huge text blocks
-            return parent_text
-            
-        # Try grandparent if parent text is too short or empty
-        if len(parent_text) < 3:
-            grandparent = parent.find_element(By.XPATH, './..')
-            grandparent_text = grandparent.text.strip()
-            if grandparent_text and len(grandparent_text) < 200:
-                return grandparent_text
-    except Exception:
-        pass
-    
-    # Strategy 4: Look for nearby heading elements
-    try:
-        # Try to find headings above the field
-        script = """
-        function findNearestHeading(element) {
-            // Check previous siblings
-            let sibling = element.previousElementSibling;
-            while (sibling) {
-                if (sibling.tagName.match(/^H[1-6]$/) || 
-                    sibling.classList.contains('question') || 
-                    sibling.classList.contains('field-label')) {
-                    return sibling.textContent.trim();
-                }
-                sibling = sibling.previousElementSibling;
-            }
-            
-            // Check parent's previous siblings
-            let parent = element.parentElement;
-            if (parent) {
-                sibling = parent.previousElementSibling;
-                while (sibling) {
-                    if (sibling.tagName.match(/^H[1-6]$/) || 
-                        sibling.classList.contains('question') || 
-                        sibling.classList.contains('field-label')) {
-                        return sibling.textContent.trim();
-                    }
-                    sibling = sibling.previousElementSibling;
-                }
-            }
-            
-            return null;
-        }
-        return findNearestHeading(arguments[0]);
-        """
-        heading_text = driver.execute_script(script, field)
-        if heading_text and len(heading_text.strip()) > 3:
-            return heading_text.strip()
+        return driver.execute_script(FIELD_INVENTORY_SCRIPT) or []
     except Exception as e:
-        print(f"[DEBUG] Error finding nearby headings: {e}")
-    
-    # Strategy 5: Look for question text in nearby divs with specific classes
-    try:
-        # Look for elements with classes that might indicate question text
-        for class_name in ['question', 'field-label', 'form-label', 'control-label', 'question-text']:
-            try:
-                # Try to find elements near our field
-                elements = driver.find_elements(By.CSS_SELECTOR, f'.{class_name}')
-                for element in elements:
-                    # Check if this element is near our field (simple heuristic)
-                    if abs(element.location['y'] - field.location['y']) < 100:
-                        if element.text.strip() and len(element.text.strip()) > 3:
-                            return element.text.strip()
-            except Exception:
-                continue
-    except Exception as e:
-        print(f"[DEBUG] Error finding question classes: {e}")
-    
-    # If we still don't have a question, try name attribute as last resort
-    field_name = field.get_attribute('name')
-    if field_name and '[question]' in field_name.lower():
-        # Try to find the question ID and look it up in the page
-        import re
-        match = re.search(r'\[(\d+)\]', field_name)
-        if match:
-            question_id = match.group(1)
-            try:
-                question_elem = driver.find_element(By.CSS_SELECTOR, f'[data-question-id="{question_id}"]')
-                if question_elem and question_elem.text.strip():
-                    return question_elem.text.strip()
-            except Exception:
-                pass
-    
-    # Last resort: return a placeholder with field name if available
-    if field_name and len(field_name) > 0:
-        return f"Question about {field_name.replace('_', ' ')}"
-        
-    return "(Unknown Question)"
+        print(f"[DEBUG] Field inventory script failed: {e}")
+        return []
+
+
+def select_option_for_education(field_info, education):
+    """
+    Pick the education level in a select field, using the inventory's option texts
+
+    Args:
+        field_info (dict): Field inventory entry for a select element
+        education (str): Education text from the resume
+    """
+    education = (education or "").lower()
+    for index, option in enumerate(field_info["options"]):
+        option_text = option["text"].lower()
+        if any(level in option_text and level in education for level in ["bachelor", "master", "phd"]):
+            field_info["element"].find_elements(By.TAG_NAME, "option")[index].click()
+            break
+
+
+# ================ Field Matching Helpers ===================
+def field_identity(field_info):
+    """Lower-cased name/placeholder/label used by the matching heuristics"""
+    label = field_info["aria_label"] or field_info["id"]
+    return (field_info["name"] or field_info["placeholder"] or label or "").lower()
+
+
+def match_field_attribute(field_info):
+    """
+    Guess which resume attribute a form field asks for
+
+    Args:
+        field_info (dict): Field inventory entry
+
+    Returns:
+        str: Resume attribute (see form_templates.RESUME_ATTRIBUTES), or None
+    """
+    identity = field_identity(field_info)
+    if any(key in identity for key in ["name", "full name"]):
+        return "name"
+    if "email" in identity:
+        return "email"
+    if "phone" in identity or "mobile" in identity:
+        return "phone"
+    if "address" in identity:
+        return "address"
+    if "skill" in identity:
+        return "skills"
+    if "education" in identity:
+        return "education"
+    if "experience" in identity:
+        return "experience"
+    return None
 
 
 # ================ Form Filling Main Logic ==============
-def auto_fill_form(job_link, extracted_resume_data, resume_file_path):
-    driver = create_driver()
-    driver.get(job_link)
+def fill_application_form(driver, job_link, extracted_resume_data, resume_file_path):
+    """
+    Fill the application form at job_link in an existing browser session
+
+    Args:
+        driver: Selenium WebDriver instance
+        job_link (str): Application page URL
+        extracted_resume_data (dict): Parsed resume data
+        resume_file_path (str): Resume file to upload
 
-    time.sleep(5)  # wait for page to load
+    Returns:
+        dict: Fill summary with template, fields_filled, resume_uploaded and questions_answered
+    """
+    driver.get(job_link)
 
-    all_inputs = driver.find_elements(By.TAG_NAME, "input")
-    all_textareas = driver.find_elements(By.TAG_NAME, "textarea")
-    all_selects = driver.find_elements(By.TAG_NAME, "select")
+    # Wait for the form to load and finish rendering
+    if not wait_for_page_ready(driver):
+        print(f"[WARN] Page did not settle within {PAGE_LOAD_TIMEOUT:.0f}s, continuing anyway")
+    record_page_usage(driver)
 
-    fields = all_inputs + all_textareas + all_selects
+    # One round trip for all field metadata; matching below works on this snapshot
+    fields = get_field_inventory(driver)
 
     print("\n[DEBUG] Extracted resume data:")
     print(extracted_resume_data)
     print("\n[DEBUG] Detected form fields:")
-    for field in fields:
-        try:
-            print(f"Field: tag={field.tag_name}, name={field.get_attribute('name')}, id={field.get_attribute('id')}, placeholder={field.get_attribute('placeholder')}, aria-label={field.get_attribute('aria-label')}, type={field.get_attribute('type')}")
-        except Exception as e:
-            print(f"[DEBUG] Could not print field: {e}")
+    for info in fields:
+        print(f"Field: tag={info['tag']}, name={info['name']}, id={info['id']}, placeholder={info['placeholder']}, aria-label={info['aria_label']}, type={info['type']}")
 
     # Ensure resume_file_path is absolute
     if resume_file_path and not os.path.isabs(resume_file_path):
@@ -1069,127 +1062,80 @@ def auto_fill_form(job_link, extracted_resume_data, resume_file_path):
     if not extracted_resume_data.get("Experience"):
         print("[WARN] Experience not found in resume data.")
 
+    # Resume values for each mappable attribute
+    resume_values = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "name": name or "",
+        "email": extracted_resume_data.get("Email", ""),
+        "phone": extracted_resume_data.get("Phone", ""),
+        "address": extracted_resume_data.get("Address", ""),
+        "skills": ", ".join(extracted_resume_data.get("Skills", [])),
+        "education": extracted_resume_data.get("Education", ""),
+        "experience": str(extracted_resume_data.get("Experience", "")),
+    }
+
+    # Replay the built-in template for this ATS and what was learned on this very form;
+    # heuristics only cover unmapped fields
+    template_key = fingerprint_form(job_link, fields)
+    form_key = learned_form_key(job_link, fields)
+    template = form_templates.lookup(template_key, form_key)
+    if template:
+        print(f"[INFO] Using form template for {template_key} ({len(template)} mapped fields)")
+
+    def field_attribute(info):
+        return template.get(field_key(info)) or match_field_attribute(info)
+
     # Pass 1: Fill all fields except file upload
-    for field in fields:
+    for info in fields:
         try:
-            name_attr = field.get_attribute("name")
-            placeholder = field.get_attribute("placeholder")
-            label = field.get_attribute("aria-label") or field.get_attribute("id")
-            field_type = field.get_attribute("type")
-
-            field_identity = (name_attr or placeholder or label or "").lower()
-
-            if isinstance(field, webdriver.remote.webelement.WebElement):
-                matched = False
-
-                # Fill first name
-                if name_attr == "job_application[first_name]":
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, first_name)
-                    matched = True
-                # Fill last name
-                elif name_attr == "job_application[last_name]":
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, last_name)
-                    matched = True
-                # Fill email
-                elif name_attr == "job_application[email]":
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Email", ""))
-                    matched = True
-                # Fill phone
-                elif name_attr == "job_application[phone]":
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Phone", ""))
-                    matched = True
-                # Otherwise, fallback to previous generic matching
-                elif any(key in field_identity for key in ["name", "full name"]):
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, name or "")
-                    matched = True
-                elif "email" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Email", ""))
-                    matched = True
-                elif "phone" in field_identity or "mobile" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Phone", ""))
-                    matched = True
-                elif "address" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Address", ""))
-                    matched = True
-                elif "skill" in field_identity:
-                    force_enable_field(driver, field)
-                    skills = ", ".join(extracted_resume_data.get("Skills", []))
-                    safe_send_keys(field, skills)
-                    matched = True
-                elif "education" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Education", ""))
-                    matched = True
-                elif "experience" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, str(extracted_resume_data.get("Experience", "")))
-                    matched = True
-
-                if matched:
-                    print(f"✅ Filled field: {field_identity}")
+            field = info["element"]
+            attribute = field_attribute(info)
+            if attribute:
+                force_enable_field(driver, field)
+                safe_send_keys(field, resume_values[attribute])
+                print(f"✅ Filled field: {field_identity(info)} ({attribute})")
 
             # Dropdowns (select)
-            if field.tag_name == "select":
-                options = field.find_elements(By.TAG_NAME, "option")
-                for option in options:
-                    if "bachelor" in option.text.lower() and "bachelor" in extracted_resume_data.get("Education", "").lower():
-                        option.click()
-                        break
-                    elif "master" in option.text.lower() and "master" in extracted_resume_data.get("Education", "").lower():
-                        option.click()
-                        break
-                    elif "phd" in option.text.lower() and "phd" in extracted_resume_data.get("Education", "").lower():
-                        option.click()
-                        break
+            if info["tag"] == "select":
+                select_option_for_education(info, extracted_resume_data.get("Education", ""))
 
         except Exception as e:
             print(f"⚠️ Skipped a field due to error: {e}")
 
     # Pass 2: Upload resume file LAST
-    for field in fields:
+    resume_uploaded = False
+    for info in fields:
         try:
-            name_attr = field.get_attribute("name")
-            field_type = field.get_attribute("type")
-            if field_type == "file" and resume_file_path:
-                field.send_keys(resume_file_path)
+            if info["type"] == "file" and resume_file_path:
+                info["element"].send_keys(resume_file_path)
+                resume_uploaded = True
                 print(f"✅ Uploaded resume file: {resume_file_path}")
         except Exception as e:
             print(f"⚠️ Skipped file upload due to error: {e}")
 
     # Wait for site's JS to parse resume and (possibly) overwrite fields
-    time.sleep(5)
+    if not wait_for_quiescence(driver):
+        print(f"[WARN] Page still busy {SETTLE_TIMEOUT:.0f}s after upload, continuing anyway")
 
-    # Re-fetch the fields after upload (site may have replaced elements)
-    all_inputs = driver.find_elements(By.TAG_NAME, "input")
-    all_textareas = driver.find_elements(By.TAG_NAME, "textarea")
-    all_selects = driver.find_elements(By.TAG_NAME, "select")
-    fields = all_inputs + all_textareas + all_selects
+    # Re-take the inventory after upload (site may have replaced elements)
+    fields = get_field_inventory(driver)
+    email_fields = [info for info in fields if template.get(field_key(info)) == "email"]
+    phone_fields = [info for info in fields if template.get(field_key(info)) == "phone"]
 
     # Print debug info for email and phone fields before filling
-    for field in fields:
-        name_attr = field.get_attribute("name")
-        if name_attr in ["job_application[email]", "job_application[phone]"]:
-            debug_field_state(field, label="Before fill")
+    for info in email_fields + phone_fields:
+        debug_field_state(info["element"], label="Before fill")
 
     # Force-fill email and phone fields before the normal re-fill pass
-    for field in fields:
-        name_attr = field.get_attribute("name")
-        if name_attr == "job_application[email]":
-            force_enable_field(driver, field)
-            force_fill_field_js(driver, field, extracted_resume_data.get("Email", ""), label="email")
-            debug_field_state(field, label="After force fill (email)")
-        if name_attr == "job_application[phone]":
-            force_enable_field(driver, field)
-            force_fill_field_js(driver, field, extracted_resume_data.get("Phone", ""), label="phone")
-            debug_field_state(field, label="After force fill (phone)")
+    for info in email_fields:
+        force_enable_field(driver, info["element"])
+        force_fill_field_js(driver, info["element"], resume_values["email"], label="email")
+        debug_field_state(info["element"], label="After force fill (email)")
+    for info in phone_fields:
+        force_enable_field(driver, info["element"])
+        force_fill_field_js(driver, info["element"], resume_values["phone"], label="phone")
+        debug_field_state(info["element"], label="After force fill (phone)")
 
     # --- SMART AI QUESTION ANSWERING ---
     # Find all custom question fields
@@ -1197,9 +1143,9 @@ def auto_fill_form(job_link, extracted_resume_data, resume_file_path):
     question_fields = []
     
     # First pass: identify all question fields
-    for field in fields:
-        name_attr = field.get_attribute("name")
-        field_type = field.get_attribute("type")
+    for info in fields:
+        name_attr = info["name"]
+        field_type = info["type"]
         
         # Skip hidden fields and submit buttons
         if field_type in ["hidden", "submit", "button", "file"]:
@@ -1218,7 +1164,7 @@ def auto_fill_form(job_link, extracted_resume_data, resume_file_path):
             is_question_field = True
             
         # Pattern 2: Textarea fields are often for questions
-        if field.tag_name == "textarea" and not any(key in (name_attr or "").lower() for key in [
+        if info["tag"] == "textarea" and not any(key in (name_attr or "").lower() for key in [
             "address", "summary", "cover", "letter", "resume", "cv"
         ]):
             is_question_field = True
@@ -1228,160 +1174,106 @@ def auto_fill_form(job_link, extracted_resume_data, resume_file_path):
             "name", "email", "phone", "address", "city", "state", "zip", "postal"
         ]):
             # Check if this might be a question field based on nearby elements
-            question_text = extract_question_text(field, driver)
+            question_text = info["question_text"]
             if question_text and question_text != "(Unknown Question)" and len(question_text) > 10:
                 # If the extracted text looks like a question, treat it as one
                 if any(q_word in question_text.lower() for q_word in ["?", "explain", "describe", "tell us", "why", "how", "what", "when"]):
                     is_question_field = True
         
         if is_question_field:
-            question_fields.append(field)
+            question_fields.append(info)
     
     # Second pass: extract questions and generate answers
+    questions_answered = 0
     if question_fields:
         print(f"\n[INFO] ✅ Found {len(question_fields)} questions to answer")
         
-        # Try to get job description text if possible
-        job_description_text = None
-        try:
-            from job_description_extractor import extract_job_description
-            job_data = extract_job_description(job_link)
-            job_description_text = job_data
-        except Exception as e:
-            print(f"[DEBUG] Could not extract job description: {e}")
-            job_description_text = job_link
+        # Parse the resume and fetch the job description once for all questions
+        context = ApplicationContext(extracted_resume_data, job_link)
+        
+        # Phase 1: generate every answer before touching the page
+        question_texts = [info["question_text"] for info in question_fields]
+        for i, question_text in enumerate(question_texts):
+            print(f"\n[INFO] 📝 Question {i+1}: '{question_text}'")
+        answers = generate_answers(question_texts, extracted_resume_data, job_link, context=context)
         
-        for i, field in enumerate(question_fields):
+        # Phase 2: push all answers in one script call and verify them together
+        pending = [i for i, answer in enumerate(answers) if answer]
+        filled = fill_fields_batch(driver, [question_fields[i]["element"] for i in pending],
+                                   [answers[i] for i in pending])
+        
+        # Each field is handled on its own, so one stale or uninteractable field does not stop the rest
+        for i, ok in zip(pending, filled):
             try:
-                question_text = extract_question_text(field, driver)
-                print(f"\n[INFO] 📝 Question {i+1}: '{question_text}'")
-                
-                # Generate answer using AI
-                answer = generate_answer(question_text, extracted_resume_data, job_description_text)
-                print(f"[INFO] 🤖 Answer: '{answer[:50]}...'")
-                
-                # Fill the field with the generated answer
-                force_enable_field(driver, field)
-                force_fill_field_js(driver, field, answer, label=f"Question {i+1}")
-                
-                # Verify the field was filled
-                time.sleep(0.5)
-                current_value = field.get_attribute("value")
-                if not current_value or len(current_value) < 5:
-                    print(f"[WARN] ⚠️ Field may not have been filled properly. Retrying...")
-                    # Try alternative method
-                    driver.execute_script(
-                        "arguments[0].value = arguments[1]; "
-                        "arguments[0].dispatchEvent(new Event('input')); "
-                        "arguments[0].dispatchEvent(new Event('change')); "
-                        "arguments[0].dispatchEvent(new Event('blur'));", 
-                        field, answer
-                    )
+                if not ok:
+                    # Field keeps resetting; fall back to filling it on its own
+                    print(f"[WARN] ⚠️ Answer for question {i+1} did not stick. Retrying...")
+                    ok = force_fill_field_js(driver, question_fields[i]["element"], answers[i],
+                                             label=f"Question {i+1}", attempts=3)
+                if ok:
+                    questions_answered += 1
+                    print(f"[INFO] ✅ Filled answer for question {i+1}: '{answers[i][:50]}...'")
                 else:
-                    print(f"[INFO] ✅ Successfully filled answer for question {i+1}")
+                    print(f"[ERROR] ❌ Failed to answer question {i+1}")
             except Exception as e:
-                print(f"[ERROR] ❌ Failed to answer question: {e}")
+                print(f"[ERROR] ❌ Failed to answer question {i+1}: {e}")
     else:
         print("\n[INFO] ℹ️ No application questions detected")
 
     # Pass 3: Re-fill all fields again (except file upload)
-    for field in fields:
+    filled_mapping = {}
+    for info in fields:
         try:
-            name_attr = field.get_attribute("name")
-            placeholder = field.get_attribute("placeholder")
-            label = field.get_attribute("aria-label") or field.get_attribute("id")
-            field_type = field.get_attribute("type")
-            field_identity = (name_attr or placeholder or label or "").lower()
-
-            if isinstance(field, webdriver.remote.webelement.WebElement):
-                matched = False
-                # Special handling for email/phone: try all matching fields
-                if name_attr == "job_application[email]":
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Email", ""))
-                    if not field.get_attribute("value"):
-                        js_set_value(driver, field, extracted_resume_data.get("Email", ""))
-                    debug_field_state(field, label="After fill (email)")
-                    # Try all fields with this name
-                    for f in fields:
-                        if f.get_attribute("name") == "job_application[email]" and f != field:
-                            force_enable_field(driver, f)
-                            js_set_value(driver, f, extracted_resume_data.get("Email", ""))
-                            debug_field_state(f, label="After fill (email, other)")
-                    matched = True
-                elif name_attr == "job_application[phone]":
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Phone", ""))
-                    if not field.get_attribute("value"):
-                        js_set_value(driver, field, extracted_resume_data.get("Phone", ""))
-                    debug_field_state(field, label="After fill (phone)")
-                    for f in fields:
-                        if f.get_attribute("name") == "job_application[phone]" and f != field:
-                            force_enable_field(driver, f)
-                            js_set_value(driver, f, extracted_resume_data.get("Phone", ""))
-                            debug_field_state(f, label="After fill (phone, other)")
-                    matched = True
-                elif name_attr == "job_application[first_name]":
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, first_name)
-                    matched = True
-                elif name_attr == "job_application[last_name]":
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, last_name)
-                    matched = True
-                elif any(key in field_identity for key in ["name", "full name"]):
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, name or "")
-                    matched = True
-                elif "email" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Email", ""))
-                    if not field.get_attribute("value"):
-                        js_set_value(driver, field, extracted_resume_data.get("Email", ""))
-                    matched = True
-                elif "phone" in field_identity or "mobile" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Phone", ""))
-                    if not field.get_attribute("value"):
-                        js_set_value(driver, field, extracted_resume_data.get("Phone", ""))
-                    matched = True
-                elif "address" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Address", ""))
-                    matched = True
-                elif "skill" in field_identity:
-                    force_enable_field(driver, field)
-                    skills = ", ".join(extracted_resume_data.get("Skills", []))
-                    safe_send_keys(field, skills)
-                    matched = True
-                elif "education" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, extracted_resume_data.get("Education", ""))
-                    matched = True
-                elif "experience" in field_identity:
-                    force_enable_field(driver, field)
-                    safe_send_keys(field, str(extracted_resume_data.get("Experience", "")))
-                    matched = True
-                if matched:
-                    print(f"✅ Re-filled field: {field_identity}")
-            if field.tag_name == "select":
-                options = field.find_elements(By.TAG_NAME, "option")
-                for option in options:
-                    if "bachelor" in option.text.lower() and "bachelor" in extracted_resume_data.get("Education", "").lower():
-                        option.click()
-                        break
-                    elif "master" in option.text.lower() and "master" in extracted_resume_data.get("Education", "").lower():
-                        option.click()
-                        break
-                    elif "phd" in option.text.lower() and "phd" in extracted_resume_data.get("Education", "").lower():
-                        option.click()
-                        break
+            field = info["element"]
+            attribute = field_attribute(info)
+            if attribute:
+                force_enable_field(driver, field)
+                safe_send_keys(field, resume_values[attribute])
+                # Email/phone inputs are often masked or re-rendered; fall back to setting the value directly
+                if attribute in ("email", "phone") and not field.get_attribute("value"):
+                    js_set_value(driver, field, resume_values[attribute])
+                if info in email_fields or info in phone_fields:
+                    debug_field_state(field, label=f"After fill ({attribute})")
+                filled_mapping[field_key(info)] = attribute
+                print(f"✅ Re-filled field: {field_identity(info)} ({attribute})")
+            if info["tag"] == "select":
+                select_option_for_education(info, extracted_resume_data.get("Education", ""))
         except Exception as e:
             print(f"⚠️ Skipped a field (re-fill) due to error: {e}")
 
-    print("\n🎯 Form filling attempt finished!\n")
-    time.sleep(10)  # Pause so you can check form
-    driver.quit()
+    # Learn the mapping of every field that still holds exactly what was filled into it, for
+    # replay on this form next time; question fields get generated answers, not resume values
+    try:
+        question_keys = {field_key(info) for info in question_fields}
+        final_values = {field_key(info): (info["value"] or "").strip() for info in get_field_inventory(driver)}
+        form_templates.record(form_key, {
+            key: attribute for key, attribute in filled_mapping.items()
+            if key not in question_keys and resume_values[attribute]
+            and final_values.get(key) == str(resume_values[attribute]).strip()
+        })
+    except Exception as e:
+        print(f"[DEBUG] Could not save form template: {e}")
+
+    return {
+        "template": template_key,
+        "fields_filled": len(filled_mapping),
+        "resume_uploaded": resume_uploaded,
+        "questions_answered": questions_answered,
+    }
+
+
+def auto_fill_form(job_link, extracted_resume_data, resume_file_path):
+    driver = create_driver()
+    try:
+        summary = fill_application_form(driver, job_link, extracted_resume_data, resume_file_path)
+        print("\n🎯 Form filling attempt finished!\n")
+        time.sleep(REVIEW_PAUSE)  # Pause so you can check form
+        usage = report_resource_usage(driver, "Auto-fill browser")
+        if usage:
+            print(f"[INFO] Blocked {usage['requests_blocked']} requests, ~{usage['estimated_bytes_saved'] // 1024} KB saved")
+    finally:
+        driver.quit()
+    return summary
 
 
 # ================ Example Usage ========================
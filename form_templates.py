@@ -0,0 +1,216 @@
+"""
+Form Templates Module for Berojgar
+
+This module stores per-site form mappings for the auto-filler. A template maps
+form fields (by name or id) to resume attributes. Built-in templates cover
+the field names known for common ATS platforms (Greenhouse, Lever, ...) and
+are keyed by the platform behind the page. Learned templates are keyed by
+the page's host and the set of fields on the form, since two companies on
+the same platform ask different questions. A field is only learned once
+its fill was confirmed on the page, and fields whose names are positional
+("question_3", "answers[2]") are never learned.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from urllib.parse import urlparse
+
+# Resume attributes a form field can be mapped to
+RESUME_ATTRIBUTES = ('first_name', 'last_name', 'name', 'email', 'phone', 'address',
+                     'skills', 'education', 'experience')
+
+# ATS platforms recognised by URL host
+ATS_DOMAINS = {
+    'greenhouse': ('greenhouse.io',),
+    'lever': ('lever.co',),
+    'workday': ('myworkdayjobs.com', 'workday.com'),
+    'ashby': ('ashbyhq.com',),
+    'smartrecruiters': ('smartrecruiters.com',),
+    'workable': ('workable.com',),
+    'icims': ('icims.com',),
+}
+
+# Field-name prefixes that give a platform away on company-hosted pages
+ATS_FIELD_PREFIXES = {
+    'greenhouse': ('job_application[',),
+}
+
+# Field mappings known for each platform
+BUILTIN_TEMPLATES = {
+    'greenhouse': {
+        'name:job_application[first_name]': 'first_name',
+        'name:job_application[last_name]': 'last_name',
+        'name:job_application[email]': 'email',
+        'name:job_application[phone]': 'phone',
+    },
+    'lever': {
+        'name:name': 'name',
+        'name:email': 'email',
+        'name:phone': 'phone',
+    },
+}
+
+# Field names made from a position rather than a meaning; they differ between forms
+_POSITIONAL_NAME_RE = re.compile(r'\[\d+\]|[_\-]\d+$|^\d+$')
+
+# Field types left out of a form's signature
+_UNSIGNED_FIELD_TYPES = ('hidden', 'submit', 'button')
+
+DEFAULT_TEMPLATES_PATH = os.environ.get(
+    'FORM_TEMPLATES_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'form_templates.json')
+)
+
+
+def field_key(field_info):
+    """
+    Get the stable template key of a form field
+
+    Args:
+        field_info (dict): Field inventory entry
+
+    Returns:
+        str: 'name:<name>' or 'id:<id>', or None if the field has neither
+    """
+    if field_info.get('name'):
+        return f"name:{field_info['name']}"
+    if field_info.get('id'):
+        return f"id:{field_info['id']}"
+    return None
+
+
+def is_stable_field_key(key):
+    """
+    Check whether a field key names the field rather than its position
+
+    Args:
+        key (str): Key from field_key()
+
+    Returns:
+        bool: True if the key can be learned and replayed on later visits
+    """
+    return bool(key) and not _POSITIONAL_NAME_RE.search(key.split(':', 1)[-1])
+
+
+def fingerprint_form(url, fields):
+    """
+    Work out the built-in template key for a form page
+
+    Args:
+        url (str): Page URL
+        fields (list): Field inventory of the page
+
+    Returns:
+        str: 'ats:<platform>' when the platform is recognised, otherwise 'domain:<host>'
+    """
+    host = (urlparse(url).hostname or '').lower()
+    for platform, domains in ATS_DOMAINS.items():
+        if any(host == domain or host.endswith('.' + domain) for domain in domains):
+            return f"ats:{platform}"
+
+    names = [field.get('name') or '' for field in fields]
+    for platform, prefixes in ATS_FIELD_PREFIXES.items():
+        if any(name.startswith(prefixes) for name in names):
+            return f"ats:{platform}"
+
+    if host.startswith('www.'):
+        host = host[4:]
+    return f"domain:{host}"
+
+
+def learned_form_key(url, fields):
+    """
+    Work out the learned template key for a form page
+
+    Args:
+        url (str): Page URL
+        fields (list): Field inventory of the page
+
+    Returns:
+        str: 'form:<host>:<digest of the form's field keys>'
+    """
+    host = (urlparse(url).hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    keys = sorted({field_key(field) or '' for field in fields if field.get('type') not in _UNSIGNED_FIELD_TYPES})
+    digest = hashlib.sha1('\n'.join(keys).encode('utf-8')).hexdigest()[:12]
+    return f"form:{host}:{digest}"
+
+
+class FormTemplateStore:
+    """JSON-backed store of learned form templates"""
+
+    def __init__(self, path=DEFAULT_TEMPLATES_PATH):
+        """
+        Initialize the store
+
+        Args:
+            path (str): JSON file holding learned templates
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._templates = None
+
+    def _load(self):
+        if self._templates is None:
+            try:
+                with open(self.path, encoding='utf-8') as handle:
+                    self._templates = json.load(handle)
+            except (OSError, ValueError):
+                self._templates = {}
+        return self._templates
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or '.'
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                json.dump(self._templates, handle, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def lookup(self, key, form_key=None):
+        """
+        Get the template for a form, learned mappings over built-in ones
+
+        Args:
+            key (str): Key from fingerprint_form()
+            form_key (str): Key from learned_form_key() (None = built-in mappings only)
+
+        Returns:
+            dict: Field key -> resume attribute (empty if unknown)
+        """
+        template = dict(BUILTIN_TEMPLATES.get(key.split(':', 1)[1], {})) if key.startswith('ats:') else {}
+        if form_key:
+            with self._lock:
+                template.update(self._load().get(form_key, {}))
+        return template
+
+    def record(self, key, mapping):
+        """
+        Merge confirmed fills into the learned template of a form
+
+        Args:
+            key (str): Key from learned_form_key()
+            mapping (dict): Field key -> resume attribute, for fields whose fill was confirmed
+        """
+        mapping = {field: attribute for field, attribute in mapping.items()
+                   if is_stable_field_key(field) and attribute in RESUME_ATTRIBUTES}
+        if not mapping:
+            return
+        with self._lock:
+            templates = self._load()
+            if all(templates.get(key, {}).get(field) == attribute for field, attribute in mapping.items()):
+                return
+            templates.setdefault(key, {}).update(mapping)
+            self._save()
+
+
+# Process-wide template store
+form_templates = FormTemplateStore()
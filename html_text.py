@@ -0,0 +1,127 @@
+"""
+HTML Text Module for Berojgar
+
+This module is the lxml-based parsing layer for scraped pages. Visible text is
+pulled out with a streaming parser target, so script, style and other
+non-content blocks are dropped while parsing and no tree is built at all.
+When a tree is needed, it is parsed with lxml and stripped of the same
+blocks. Both entry points cap the amount of HTML and text they process, so a
+huge page costs no more than a normal one.
+"""
+
+from lxml import etree
+import lxml.html
+
+# Work caps for huge pages
+MAX_HTML_CHARS = 2000000
+MAX_TEXT_CHARS = 200000
+
+# Elements whose content is never job text
+SKIP_TAGS = frozenset(['script', 'style', 'noscript', 'template', 'svg', 'iframe', 'head'])
+
+# Also skipped when extracting the main text of a page
+BOILERPLATE_TAGS = frozenset(['nav', 'footer', 'aside'])
+
+_FEED_CHUNK = 65536
+
+
+class _VisibleTextTarget:
+    """lxml parser target that keeps text outside skipped elements"""
+
+    def __init__(self, skip_tags, max_chars):
+        self.skip_tags = skip_tags
+        self.max_chars = max_chars
+        self.skip_depth = 0
+        self.length = 0
+        self.parts = []
+
+    @property
+    def full(self):
+        return self.length >= self.max_chars
+
+    def start(self, tag, attrib):
+        if tag in self.skip_tags:
+            self.skip_depth += 1
+        self.parts.append(' ')
+
+    def end(self, tag):
+        if tag in self.skip_tags and self.skip_depth:
+            self.skip_depth -= 1
+        self.parts.append(' ')
+
+    def data(self, data):
+        if self.skip_depth or self.full:
+            return
+        self.parts.append(data)
+        self.length += len(data)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return ''.join(self.parts)
+
+
+def extract_visible_text(html, max_chars=MAX_TEXT_CHARS, skip_boilerplate=True):
+    """
+    Extract the visible text of a page without building a document tree
+
+    Args:
+        html (str): Page HTML
+        max_chars (int): Stop collecting after this many characters of text
+        skip_boilerplate (bool): Also drop navigation, footer and sidebar text
+
+    Returns:
+        str: Text with runs of whitespace collapsed to single spaces
+    """
+    if not html:
+        return ''
+
+    skip_tags = SKIP_TAGS | BOILERPLATE_TAGS if skip_boilerplate else SKIP_TAGS
+    target = _VisibleTextTarget(skip_tags, max_chars)
+    parser = etree.HTMLParser(target=target, remove_comments=True, recover=True)
+
+    html = html[:MAX_HTML_CHARS]
+    for start in range(0, len(html), _FEED_CHUNK):
+        parser.feed(html[start:start + _FEED_CHUNK])
+        if target.full:
+            break
+    text = parser.close()
+
+    return ' '.join(text.split())[:max_chars]
+
+
+def parse_html_tree(html):
+    """
+    Parse a page into an lxml tree with script and style blocks removed
+
+    Args:
+        html (str): Page HTML (truncated to MAX_HTML_CHARS)
+
+    Returns:
+        lxml.html.HtmlElement: Document root, or None if the page could not be parsed
+    """
+    if not html:
+        return None
+
+    parser = lxml.html.HTMLParser(remove_comments=True, remove_pis=True, recover=True)
+    try:
+        doc = lxml.html.document_fromstring(html[:MAX_HTML_CHARS], parser=parser)
+    except (etree.ParserError, ValueError):
+        return None
+
+    etree.strip_elements(doc, *SKIP_TAGS, with_tail=False)
+    return doc
+
+
+def element_text(element):
+    """
+    Get the text of an lxml element with whitespace collapsed
+
+    Args:
+        element: lxml element
+
+    Returns:
+        str: Element text
+    """
+    return ' '.join(element.text_content().split())
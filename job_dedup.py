@@ -0,0 +1,391 @@
+"""
+Job Deduplication Module for Berojgar
+
+This module detects near-duplicate job postings (the same job syndicated across
+sources with small title or description changes) using MinHash signatures with
+LSH banding, so each incoming job is only compared against a handful of
+candidates instead of the whole result set.
+"""
+
+import hashlib
+import random
+import re
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+# Title abbreviations that syndicated postings commonly swap in and out
+TITLE_ABBREVIATIONS = {
+    'sr': 'senior',
+    'snr': 'senior',
+    'jr': 'junior',
+    'jnr': 'junior',
+    'mgr': 'manager',
+    'eng': 'engineer',
+    'engr': 'engineer',
+    'dev': 'developer',
+    'admin': 'administrator',
+    'assoc': 'associate',
+    'asst': 'assistant',
+    'ii': '2',
+    'iii': '3',
+}
+
+# Company suffixes that carry no identity
+COMPANY_SUFFIXES = {'inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation',
+                    'co', 'company', 'plc', 'gmbh', 'pvt', 'private'}
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+_TAG_RE = re.compile(r"<[^>]+>")
+_BRACKET_SUFFIX_RE = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]\s*$")
+_SEPARATOR_SUFFIX_RE = re.compile(r"\s+[-–—|@]\s+([^-–—|@]+)$")
+
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalize_title(title, location=""):
+    """
+    Normalize a job title for duplicate detection
+
+    Expands common abbreviations ("Sr." -> "senior") and strips trailing
+    location or remote qualifiers such as "(Remote)" or "- London".
+
+    Args:
+        title (str): Job title
+        location (str): Job location, used to recognise location suffixes
+
+    Returns:
+        str: Normalized title
+    """
+    title = (title or "").lower().strip()
+    location = (location or "").lower()
+
+    # Strip trailing "(Remote)" / "[London]" qualifiers
+    title = _BRACKET_SUFFIX_RE.sub("", title)
+
+    # Strip a trailing "- London" segment when it repeats the location
+    match = _SEPARATOR_SUFFIX_RE.search(title)
+    if match:
+        suffix = match.group(1).strip()
+        if suffix in ('remote', 'hybrid', 'onsite', 'on-site') or (location and suffix in location):
+            title = title[:match.start()]
+
+    words = [TITLE_ABBREVIATIONS.get(word, word) for word in _WORD_RE.findall(title)]
+    return " ".join(words)
+
+
+def normalize_company(company):
+    """
+    Normalize a company name by dropping legal suffixes and punctuation
+
+    Args:
+        company (str): Company name
+
+    Returns:
+        str: Normalized company name
+    """
+    words = [word for word in _WORD_RE.findall((company or "").lower()) if word not in COMPANY_SUFFIXES]
+    return " ".join(words)
+
+
+def job_shingles(job, description_words=200):
+    """
+    Build the shingle set for a job from its title, company and description
+
+    Args:
+        job (dict): Job dictionary
+        description_words (int): Number of leading description words to shingle
+
+    Returns:
+        set: Set of string shingles
+    """
+    title_words = normalize_title(job.get('title', ''), job.get('location', '')).split()
+    company = normalize_company(job.get('company', ''))
+    description = job.get('full_description') or job.get('description') or ''
+    description_tokens = _WORD_RE.findall(_TAG_RE.sub(" ", description).lower())[:description_words]
+
+    shingles = {f"t:{word}" for word in title_words}
+    shingles.update(f"t2:{a}_{b}" for a, b in zip(title_words, title_words[1:]))
+    if company:
+        shingles.add(f"c:{company}")
+    shingles.update(
+        "d:" + " ".join(description_tokens[i:i + 3])
+        for i in range(max(0, len(description_tokens) - 2))
+    )
+    return shingles
+
+
+# One keyed BLAKE2b digest yields 16 independent 32-bit hash values
+_HASHES_PER_DIGEST = 16
+_DIGEST_VALUES = struct.Struct(f'<{_HASHES_PER_DIGEST}I')
+
+
+class MinHasher:
+    """MinHash signature generator using keyed BLAKE2b hash functions"""
+
+    def __init__(self, num_perm=64, seed=1):
+        """
+        Initialize the hasher
+
+        Args:
+            num_perm (int): Number of hash functions (signature length)
+            seed (int): Seed for the hash function keys
+        """
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        # Each key gives one 64-byte digest per shingle, i.e. 16 hash functions
+        self.keys = [rng.getrandbits(128).to_bytes(16, 'little')
+                     for _ in range(-(-num_perm // _HASHES_PER_DIGEST))]
+
+    def signature(self, shingles):
+        """
+        Compute the MinHash signature of a shingle set
+
+        Args:
+            shingles (set): Set of string shingles
+
+        Returns:
+            tuple: Signature of length num_perm
+        """
+        if not shingles:
+            return tuple([_MAX_HASH] * self.num_perm)
+
+        rows = []
+        for shingle in shingles:
+            data = shingle.encode('utf-8')
+            row = ()
+            for key in self.keys:
+                row += _DIGEST_VALUES.unpack(hashlib.blake2b(data, key=key).digest())
+            rows.append(row)
+        return tuple(map(min, zip(*rows)))[:self.num_perm]
+
+
+def estimate_similarity(signature_a, signature_b):
+    """
+    Estimate the Jaccard similarity of two MinHash signatures
+
+    Args:
+        signature_a (tuple): First signature
+        signature_b (tuple): Second signature
+
+    Returns:
+        float: Estimated similarity (0-1)
+    """
+    if not signature_a or len(signature_a) != len(signature_b):
+        return 0.0
+    return sum(1 for a, b in zip(signature_a, signature_b) if a == b) / len(signature_a)
+
+
+class NearDuplicateIndex:
+    """
+    LSH index of job postings for near-duplicate lookups
+
+    Signatures are split into bands; two jobs become candidates when any band
+    matches exactly, and candidates are then verified on estimated similarity,
+    company and title overlap. Lookups touch only the candidate buckets.
+    """
+
+    def __init__(self, threshold=0.6, title_threshold=0.5, num_perm=64, bands=16,
+                 max_entries=None, ttl=None, hasher=None):
+        """
+        Initialize the index
+
+        Args:
+            threshold (float): Minimum estimated Jaccard similarity for a duplicate
+            title_threshold (float): Minimum title token overlap for a duplicate
+            num_perm (int): MinHash signature length
+            bands (int): Number of LSH bands (must divide num_perm)
+            max_entries (int): Evict the oldest entries beyond this size (None = unbounded)
+            ttl (int): Seconds after which entries expire (None = never)
+            hasher (MinHasher): Shared hasher, created if not given
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.title_threshold = title_threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hasher = hasher or MinHasher(num_perm)
+
+        self._entries = OrderedDict()  # key -> (signature, company, title words, timestamp)
+        self._buckets = [dict() for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _band_keys(self, signature):
+        return [signature[i * self.rows:(i + 1) * self.rows] for i in range(self.bands)]
+
+    def describe(self, job):
+        """
+        Compute what the index compares for a job, so it can be reused across indexes
+
+        Args:
+            job (dict): Job dictionary
+
+        Returns:
+            tuple: (MinHash signature, normalized company, title words)
+        """
+        title_words = frozenset(normalize_title(job.get('title', ''), job.get('location', '')).split())
+        company = normalize_company(job.get('company', ''))
+        signature = self.hasher.signature(job_shingles(job))
+        return signature, company, title_words
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if not entry:
+            return
+        for band, band_key in enumerate(self._band_keys(entry[0])):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def _expire(self):
+        if self.ttl:
+            cutoff = time.time() - self.ttl
+            while self._entries:
+                key, entry = next(iter(self._entries.items()))
+                if entry[3] >= cutoff:
+                    break
+                self._remove(key)
+        if self.max_entries:
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _query(self, signature, company, title_words):
+        candidates = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        best_key, best_score = None, 0.0
+        for key in candidates:
+            other_signature, other_company, other_title, _ = self._entries[key]
+            # Different employers never merge, unless one side is unknown
+            if company and other_company and company != other_company:
+                continue
+            union = title_words | other_title
+            if union and len(title_words & other_title) / len(union) < self.title_threshold:
+                continue
+            score = estimate_similarity(signature, other_signature)
+            if score >= self.threshold and score > best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def find_duplicate(self, job):
+        """
+        Find an indexed job that is a near-duplicate of the given job
+
+        Args:
+            job (dict): Job dictionary
+
+        Returns:
+            str: Key of the matching indexed job, or None
+        """
+        description = self.describe(job)
+        with self._lock:
+            self._expire()
+            return self._query(*description)
+
+    def add(self, key, job):
+        """
+        Add a job to the index
+
+        Args:
+            key (str): Key to return from lookups (e.g. the job ID)
+            job (dict): Job dictionary
+        """
+        signature, company, title_words = self.describe(job)
+        with self._lock:
+            self._insert(key, signature, company, title_words)
+
+    def _insert(self, key, signature, company, title_words):
+        self._remove(key)
+        self._entries[key] = (signature, company, title_words, time.time())
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+        self._expire()
+
+    def find_or_add(self, key, job, description=None):
+        """
+        Return the key of an existing near-duplicate, or index the job under key
+
+        Args:
+            key (str): Key for the job if it is new
+            job (dict): Job dictionary
+            description (tuple): describe(job) from an index with the same hasher, if already computed
+
+        Returns:
+            str: Key of the existing duplicate, or key if the job was added
+        """
+        return self._find_or_add(key, job, description)[0]
+
+    def _find_or_add(self, key, job, description=None):
+        """find_or_add() that also reports whether the job was added"""
+        description = description or self.describe(job)
+        with self._lock:
+            self._expire()
+            existing = self._query(*description)
+            if existing is not None:
+                return existing, False
+            self._insert(key, *description)
+            return key, True
+
+
+def _content_key(job):
+    """Stable key for a job without an ID, so postings from different searches do not collide"""
+    content = '\x1f'.join(str(job.get(field) or '') for field in ('title', 'company', 'location', 'description'))
+    return "job_" + hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
+
+
+# Process-wide index of recently seen postings, shared by all scrapers
+shared_job_index = NearDuplicateIndex(max_entries=20000, ttl=24 * 3600)
+
+
+def dedupe_jobs(jobs, index=None, new_jobs=None):
+    """
+    Remove near-duplicate jobs from a result list, keeping the first occurrence
+
+    Each job is checked against the jobs already kept in this result set. When
+    an index of previously seen postings is given, jobs are also resolved to a
+    canonical posting there, so two variants of a posting that only match
+    through an earlier sighting are still merged. Kept jobs get a
+    'canonical_id' field.
+
+    Args:
+        jobs (list): List of job dictionaries
+        index (NearDuplicateIndex): Long-lived index of seen postings (optional)
+        new_jobs (list): If given, receives the kept jobs that index had not seen before
+
+    Returns:
+        list: Deduplicated list of job dictionaries
+    """
+    result_index = NearDuplicateIndex(hasher=index.hasher if index else None)
+    seen_canonical = set()
+    unique_jobs = []
+
+    for position, job in enumerate(jobs):
+        key = str(job.get('id') or _content_key(job))
+        # Both indexes share a hasher, so the job is only signed once
+        description = result_index.describe(job)
+
+        canonical_id, added = index._find_or_add(key, job, description) if index is not None else (key, True)
+        if canonical_id in seen_canonical:
+            continue
+
+        if result_index.find_or_add(position, job, description) != position:
+            continue
+
+        seen_canonical.add(canonical_id)
+        job['canonical_id'] = canonical_id
+        unique_jobs.append(job)
+        if added and new_jobs is not None:
+            new_jobs.append(job)
+
+    return unique_jobs
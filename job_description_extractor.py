@@ -1,6 +1,7 @@
 # job_description_extractor.py
 import requests
-from bs4 import BeautifulSoup
+
+from html_text import extract_visible_text
 
 
 def extract_job_description(url):
@@ -18,8 +19,8 @@ def extract_job_description(url):
         response = requests.get(url, timeout=10)
 
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            text = soup.get_text(separator=' ').lower()  # Get the whole text from the page
+            # Visible page text only - scripts, styles and navigation are skipped while parsing
+            text = extract_visible_text(response.text).lower()
 
             # Skill keywords to look for in the job description
             skill_keywords = ['python', 'java', 'sql', 'machine learning', 'deep learning', 'nlp', 'data analysis',
@@ -5,6 +5,7 @@ This module fetches job listings using Selenium WebDriver for dynamic web scrapi
 and connects to various job APIs to provide real job listings.
 """
 
+import asyncio
 import json
 import os
 import re
@@ -12,9 +13,19 @@ import logging
 import random
 import time
 import requests
-from urllib.parse import quote_plus, urlencode
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from urllib.parse import quote_plus, urlencode, urlparse, parse_qs
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+import lxml.html
+
+from job_dedup import dedupe_jobs, shared_job_index
+from rate_limiter import get_limiter
+from async_http import async_http_available, run_sync, shared_http_client
+from source_metrics import scraper_metrics
+from selector_registry import SelectorRegistry
+from html_text import parse_html_tree, element_text
+from browser_resources import ResourcePolicy, SCRAPER_RESOURCE_POLICY, record_page_usage, report_resource_usage
 
 # Selenium and WebDriver dependencies
 from selenium import webdriver
@@ -32,6 +43,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger("job_scraper")
 
+# Maximum results per Adzuna API page
+ADZUNA_PAGE_SIZE = 50
+
+# Maximum Adzuna page requests scheduled at once (the rate limiter still applies)
+ADZUNA_MAX_PAGES_IN_FLIGHT = 8
+
+# Interface language requested from Google; card selectors are learned per language
+GOOGLE_INTERFACE_LANGUAGE = 'en'
+
+# Parallelism for GitHub job detail pages (admitted by the 'github_details' limiter)
+GITHUB_DETAIL_WORKERS = 8
+GITHUB_MAX_TABS = 6
+
 class JobScraper:
     """Main class for scraping jobs using Selenium WebDriver and API connections"""
     
@@ -70,6 +94,8 @@ class JobScraper:
             WebDriver: Configured WebDriver instance
         """
         try:
+            policy = ResourcePolicy.from_env(SCRAPER_RESOURCE_POLICY)
+            
             if self.browser == 'edge':
                 from selenium.webdriver.edge.service import Service
                 from selenium.webdriver.edge.options import Options
@@ -79,8 +105,9 @@ class JobScraper:
                 edge_options.add_argument('--disable-gpu')
                 edge_options.add_argument('--no-sandbox')
                 edge_options.add_argument('--disable-dev-shm-usage')
+                policy.apply_to_options(edge_options, vendor='ms')
                 edge_service = Service('msedgedriver.exe')  # Ensure this is in PATH
-                return webdriver.Edge(service=edge_service, options=edge_options)
+                driver = webdriver.Edge(service=edge_service, options=edge_options)
             
             elif self.browser == 'chrome':
                 from selenium.webdriver.chrome.service import Service
@@ -90,25 +117,122 @@ class JobScraper:
                 chrome_options.add_argument('--disable-gpu')
                 chrome_options.add_argument('--no-sandbox')
                 chrome_options.add_argument('--disable-dev-shm-usage')
+                policy.apply_to_options(chrome_options)
                 chrome_service = Service('chromedriver.exe')  # Ensure this is in PATH
-                return webdriver.Chrome(service=chrome_service, options=chrome_options)
+                driver = webdriver.Chrome(service=chrome_service, options=chrome_options)
             
             else:
                 raise ValueError(f"Unsupported browser: {self.browser}")
+            
+            policy.install(driver)
+            return driver
         
         except Exception as e:
             logger.error(f"WebDriver setup error: {e}")
             raise
     
+    def _quit_driver(self):
+        """Report the browser session's network usage and close it"""
+        if not self.driver:
+            return
+        report_resource_usage(self.driver, "Scraper browser")
+        try:
+            self.driver.quit()
+        except Exception as quit_error:
+            logger.error(f"Error closing WebDriver: {str(quit_error)}")
+        self.driver = None
+    
     def search_google_jobs(self, query, location="", limit=20):
         """
-        Search for jobs on Google Jobs using Selenium
+        Search for jobs on Google Jobs
+        
+        The results page is first fetched over plain HTTP and parsed with lxml.
+        A headless browser is only started when that fast path finds nothing.
         
         Args:
             query (str): Job search query (e.g., "python developer")
             location (str): Location for job search (e.g., "New York")
             limit (int): Maximum number of jobs to return
             
+        Returns:
+            list: List of job dictionaries
+        """
+        # Construct Google Jobs search URL - make sure to include "jobs" in the query
+        search_query = f"{quote_plus(query)} jobs"
+        if location:
+            search_query += f" in {quote_plus(location)}"
+        
+        # The interface language is part of the URL, so both paths get (and learn selectors for) one layout
+        google_jobs_url = f"https://www.google.com/search?q={search_query}&hl={GOOGLE_INTERFACE_LANGUAGE}"
+        logger.info(f"Searching Google Jobs with URL: {google_jobs_url}")
+        
+        start_time = time.time()
+        job_listings = self._search_google_jobs_http(google_jobs_url, query, location, limit)
+        scraper_metrics.record('google_http', bool(job_listings), time.time() - start_time)
+        
+        if job_listings is None:
+            # Blocked - a browser from the same address would be blocked too
+            return []
+        if job_listings:
+            logger.info(f"Found {len(job_listings)} jobs from Google Jobs (HTTP) for query: {query}")
+            return job_listings
+        
+        start_time = time.time()
+        job_listings = self._search_google_jobs_browser(google_jobs_url, query, location, limit)
+        scraper_metrics.record('google_browser', bool(job_listings), time.time() - start_time)
+        return job_listings
+    
+    def _search_google_jobs_http(self, google_jobs_url, query, location="", limit=20):
+        """
+        Fast path: fetch the Google results HTML directly and parse it with lxml
+        
+        Args:
+            google_jobs_url (str): Google search URL
+            query (str): Job search query
+            location (str): Location for job search
+            limit (int): Maximum number of jobs to return
+            
+        Returns:
+            list: List of job dictionaries (empty if nothing was found), or None
+                if Google is blocking us
+        """
+        limiter = get_limiter('google')
+        slot = None
+        try:
+            with limiter.slot() as slot:
+                response = self.session.get(google_jobs_url, timeout=5)
+                slot.record_response(response)
+                if '/sorry/' in response.url:
+                    slot.record_throttled()
+                    
+            if slot.retry_after:
+                logger.warning("Google is blocking automated traffic, skipping Google Jobs")
+                return None
+            response.raise_for_status()
+            
+            job_listings = parse_google_jobs_html(response.text, query, location, limit, google_jobs_url,
+                                                  locale=google_locale(google_jobs_url))
+            
+        except Exception as e:
+            logger.warning(f"Google Jobs HTTP fetch failed: {str(e)}")
+            job_listings = []
+        
+        if not job_listings and slot is not None:
+            # The browser fallback requests the same page next; let it use this request's token
+            # instead of waiting a full refill interval for another one
+            limiter.refund()
+        return job_listings
+    
+    def _search_google_jobs_browser(self, google_jobs_url, query, location="", limit=20):
+        """
+        Fallback path: render the Google results page in a headless browser
+        
+        Args:
+            google_jobs_url (str): Google search URL
+            query (str): Job search query
+            location (str): Location for job search
+            limit (int): Maximum number of jobs to return
+            
         Returns:
             list: List of job dictionaries
         """
@@ -116,44 +240,40 @@ class JobScraper:
             # Initialize the driver if not already done
             if not self.driver:
                 self.driver = self._setup_webdriver()
-                
-            # Construct Google Jobs search URL - make sure to include "jobs" in the query
-            search_query = f"{quote_plus(query)} jobs"
-            if location:
-                search_query += f" in {quote_plus(location)}"
-            
-            google_jobs_url = f"https://www.google.com/search?q={search_query}"
-            logger.info(f"Searching Google Jobs with URL: {google_jobs_url}")
-            
-            # Navigate to Google Jobs
-            self.driver.get(google_jobs_url)
-            
-            # Wait for page to load - try multiple selectors since Google's UI can vary
-            selectors_to_try = [
-                "div.job_seen_beacon",
-                "div.jobsearch-JobCard",
-                "div.BjJfJf",
-                "div[data-ved]",  # More generic selector that might catch job cards
-                "div.g"  # Generic Google search result
-            ]
-            
-            # Try each selector until one works
-            job_cards = []
-            for selector in selectors_to_try:
-                try:
-                    # Wait up to 3 seconds for this selector
-                    WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if job_cards:
-                        logger.info(f"Found job cards using selector: {selector}")
-                        break
-                except Exception:
-                    continue
+            
+            # Navigate to Google Jobs (rate limited - Google blocks bursts of automated traffic)
+            with get_limiter('google').slot() as slot:
+                self.driver.get(google_jobs_url)
+                if '/sorry/' in self.driver.current_url:
+                    slot.record_throttled()
+                    logger.warning("Google is blocking automated traffic, skipping Google Jobs")
+                    return []
+            
+            # Wait once for any known card selector, trying the ones that worked recently first
+            context = (google_locale(google_jobs_url), 'browser')
+            selectors_to_try = google_selector_registry.ordered(context)
+            tried = []
+            
+            def find_job_cards(driver):
+                del tried[:]
+                for selector in selectors_to_try:
+                    cards = driver.find_elements(By.CSS_SELECTOR, selector)
+                    if cards:
+                        return selector, cards
+                    tried.append(selector)
+                return False
+            
+            try:
+                matched_selector, job_cards = WebDriverWait(self.driver, 5).until(find_job_cards)
+                logger.info(f"Found job cards using selector: {matched_selector}")
+            except TimeoutException:
+                matched_selector, job_cards = None, []
+            record_page_usage(self.driver)
             
             # If we still don't have job cards, try taking a screenshot and parsing the page content
             if not job_cards:
+                google_selector_registry.record_result(context, tried, None, False)
+                
                 # Take a screenshot for debugging
                 screenshot_path = "google_jobs_screenshot.png"
                 self.driver.save_screenshot(screenshot_path)
@@ -267,7 +387,9 @@ class JobScraper:
                 except Exception as card_error:
                     logger.warning(f"Error parsing job card: {str(card_error)}")
             
-            logger.info(f"Found {len(job_listings)} jobs from Google Jobs for query: {query}")
+            if matched_selector:
+                google_selector_registry.record_result(context, tried, matched_selector, bool(job_listings))
+            logger.info(f"Found {len(job_listings)} jobs from Google Jobs (browser) for query: {query}")
             return job_listings
         
         except Exception as e:
@@ -275,32 +397,26 @@ class JobScraper:
             return []
         finally:
             # Close the browser if it was initialized
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except Exception as quit_error:
-                    logger.error(f"Error closing WebDriver: {str(quit_error)}")
-                self.driver = None
+            self._quit_driver()
                 
     def _extract_jobs_from_page_content(self, page_content, query, limit=20):
         """
         Fallback method to extract job information from page content when selectors fail
         """
         try:
-            # Create a soup object
-            soup = BeautifulSoup(page_content, 'html.parser')
+            # Parse with lxml; script and style blocks are stripped
+            doc = parse_html_tree(page_content)
+            if doc is None:
+                return []
             
             # Try to find job-like elements
             job_listings = []
             
             # Look for potential job titles (h3 elements or bold text)
-            potential_titles = soup.find_all(['h3', 'b', 'strong'])
+            potential_titles = islice(doc.iter('h3', 'b', 'strong'), limit)
             
-            for i, title_elem in enumerate(potential_titles[:limit]):
-                if i >= limit:
-                    break
-                    
-                title = title_elem.get_text().strip()
+            for title_elem in potential_titles:
+                title = title_elem.text_content().strip()
                 
                 # Skip if title is too short or doesn't look like a job title
                 if len(title) < 5 or len(title) > 100:
@@ -308,21 +424,23 @@ class JobScraper:
                 
                 # Try to find company name (often near the title)
                 company = "Company Not Specified"
-                parent = title_elem.parent
-                if parent:
+                parent = title_elem.getparent()
+                if parent is not None:
                     # Look for text that might be a company name
-                    for sibling in parent.find_next_siblings():
-                        text = sibling.get_text().strip()
+                    for sibling in parent.itersiblings():
+                        if not isinstance(sibling.tag, str):
+                            continue
+                        text = sibling.text_content().strip()
                         if text and 5 < len(text) < 50 and text != title:
                             company = text
                             break
                 
                 # Create a description from nearby text
                 description = ""
-                container = title_elem.find_parent('div')
-                if container:
+                container = next(title_elem.iterancestors('div'), None)
+                if container is not None:
                     # Get all text in this container
-                    all_text = container.get_text().strip()
+                    all_text = container.text_content().strip()
                     # Remove the title and company from the text
                     description = all_text.replace(title, "").replace(company, "").strip()
                 
@@ -360,10 +478,75 @@ class JobScraper:
             logger.error(f"Error extracting jobs from page content: {str(e)}")
             return []
 
+    def _get_cached(self, cache_key, limit):
+        """Return cached jobs for a key if they have not expired, otherwise None"""
+        if cache_key in self.job_cache and time.time() - self.cache_expiry.get(cache_key, 0) < self.cache_duration:
+            return self.job_cache[cache_key][:limit]
+        return None
+
+    def _set_cached(self, cache_key, jobs):
+        """Store jobs in the cache"""
+        self.job_cache[cache_key] = jobs
+        self.cache_expiry[cache_key] = time.time()
+
+    def _parse_remotive_jobs(self, data, location, limit):
+        """
+        Convert a Remotive API response into job dictionaries
+
+        Args:
+            data (dict): Decoded API response
+            location (str): Location filter used for the search
+            limit (int): Maximum number of jobs to return
+
+        Returns:
+            list: List of job dictionaries
+        """
+        jobs = []
+        for job in data.get('jobs', [])[:limit]:
+            # Extract job details
+            job_id = f"remotive_{job.get('id', random.randint(1000, 9999))}"
+            title = job.get('title', 'No Title')
+            company = job.get('company_name', 'Unknown Company')
+            job_location = job.get('candidate_required_location', location or 'Remote')
+            description = job.get('description', 'No description available')
+            job_url = job.get('url', '')
+            job_type = job.get('job_type', 'Unknown')
+            salary = job.get('salary', 'Not specified')
+            
+            # Extract skills from description
+            skills = extract_skills_from_text(description)
+            
+            # Create job object
+            job_obj = {
+                'id': job_id,
+                'title': title,
+                'company': company,
+                'location': job_location,
+                'description': description[:500] + '...' if len(description) > 500 else description,  # Truncate long descriptions
+                'full_description': description,
+                'source': 'Remotive',
+                'url': job_url,
+                'application_url': job_url,
+                'job_type': job_type,
+                'salary': salary,
+                'posted_date': job.get('publication_date', 'Recently'),
+                'skills': skills
+            }
+            
+            jobs.append(job_obj)
+            
+            if len(jobs) >= limit:
+                break
+                
+        return jobs
+
     def search_remotive(self, query, location="", limit=20):
         """
         Search for remote jobs on Remotive API
         
+        Uses the async adapter through the background event loop when aiohttp
+        is installed, and the blocking requests session otherwise.
+        
         Args:
             query (str): Job search query (e.g., "python developer")
             location (str): Location filter (optional for remote jobs)
@@ -372,11 +555,15 @@ class JobScraper:
         Returns:
             list: List of job dictionaries
         """
+        if async_http_available:
+            return run_sync(self.search_remotive_async(query, location, limit))
+            
         # Check cache first
         cache_key = f"remotive_{query}_{location}_{limit}"
-        if cache_key in self.job_cache and time.time() - self.cache_expiry.get(cache_key, 0) < self.cache_duration:
+        cached = self._get_cached(cache_key, limit)
+        if cached is not None:
             logger.info(f"Using cached Remotive results for query: {query}")
-            return self.job_cache[cache_key][:limit]
+            return cached
             
         try:
             # Prepare API parameters
@@ -385,51 +572,13 @@ class JobScraper:
                 params['search'] = query
                 
             # Make API request
-            response = self.session.get(f"{self.remotive_api_url}", params=params)
+            with get_limiter('remotive').slot() as slot:
+                response = self.session.get(f"{self.remotive_api_url}", params=params, timeout=20)
+                slot.record_response(response)
             response.raise_for_status()
-            data = response.json()
             
-            # Process results
-            jobs = []
-            for job in data.get('jobs', [])[:limit]:
-                # Extract job details
-                job_id = f"remotive_{job.get('id', random.randint(1000, 9999))}"
-                title = job.get('title', 'No Title')
-                company = job.get('company_name', 'Unknown Company')
-                job_location = job.get('candidate_required_location', location or 'Remote')
-                description = job.get('description', 'No description available')
-                job_url = job.get('url', '')
-                job_type = job.get('job_type', 'Unknown')
-                salary = job.get('salary', 'Not specified')
-                
-                # Extract skills from description
-                skills = extract_skills_from_text(description)
-                
-                # Create job object
-                job_obj = {
-                    'id': job_id,
-                    'title': title,
-                    'company': company,
-                    'location': job_location,
-                    'description': description[:500] + '...' if len(description) > 500 else description,  # Truncate long descriptions
-                    'full_description': description,
-                    'source': 'Remotive',
-                    'url': job_url,
-                    'application_url': job_url,
-                    'job_type': job_type,
-                    'salary': salary,
-                    'posted_date': job.get('publication_date', 'Recently'),
-                    'skills': skills
-                }
-                
-                jobs.append(job_obj)
-                
-                if len(jobs) >= limit:
-                    break
-                    
-            # Update cache
-            self.job_cache[cache_key] = jobs
-            self.cache_expiry[cache_key] = time.time()
+            jobs = self._parse_remotive_jobs(response.json(), location, limit)
+            self._set_cached(cache_key, jobs)
             
             logger.info(f"Found {len(jobs)} Remotive jobs for query: {query}")
             return jobs
@@ -437,11 +586,147 @@ class JobScraper:
         except Exception as e:
             logger.error(f"Remotive API error: {e}")
             return []
+
+    async def search_remotive_async(self, query, location="", limit=20):
+        """
+        Search for remote jobs on Remotive API without blocking the event loop
+        
+        Args:
+            query (str): Job search query (e.g., "python developer")
+            location (str): Location filter (optional for remote jobs)
+            limit (int): Maximum number of jobs to return
+            
+        Returns:
+            list: List of job dictionaries
+        """
+        cache_key = f"remotive_{query}_{location}_{limit}"
+        cached = self._get_cached(cache_key, limit)
+        if cached is not None:
+            logger.info(f"Using cached Remotive results for query: {query}")
+            return cached
+            
+        try:
+            params = {'search': query} if query else {}
+            data = await shared_http_client.get_json(self.remotive_api_url, params, source='remotive')
+            
+            jobs = self._parse_remotive_jobs(data, location, limit)
+            self._set_cached(cache_key, jobs)
+            
+            logger.info(f"Found {len(jobs)} Remotive jobs for query: {query}")
+            return jobs
+            
+        except Exception as e:
+            logger.error(f"Remotive API error: {e}")
+            return []
+
+    def _adzuna_request(self, query, location, results_per_page, page=1):
+        """
+        Build the Adzuna API URL and parameters for one results page
+        
+        Args:
+            query (str): Job search query
+            location (str): Location for job search
+            results_per_page (int): Number of results on the page
+            page (int): 1-based page number
             
+        Returns:
+            tuple: (api_url, params)
+        """
+        country = "gb"  # Default to UK
+        if location and any(loc in location.lower() for loc in ["us", "united states", "america"]):
+            country = "us"
+            
+        # Construct API URL
+        api_url = f"{self.adzuna_api_url}/{country}/search/{page}"
+        
+        params = {
+            "app_id": self.adzuna_app_id,
+            "app_key": self.adzuna_api_key,
+            "results_per_page": min(results_per_page, ADZUNA_PAGE_SIZE),  # API limit
+            "what": query,
+            "content-type": "application/json"
+        }
+        
+        if location and country == "us":
+            # Extract state or city
+            location_parts = location.split(",")
+            if len(location_parts) > 1:
+                params["where"] = location_parts[0].strip()
+            else:
+                params["where"] = location
+                
+        return api_url, params
+
+    def _parse_adzuna_jobs(self, data, location, limit):
+        """
+        Convert an Adzuna API response into job dictionaries
+
+        Args:
+            data (dict): Decoded API response
+            location (str): Location used for the search
+            limit (int): Maximum number of jobs to return
+
+        Returns:
+            list: List of job dictionaries
+        """
+        jobs = []
+        for job in data.get('results', [])[:limit]:
+            # Extract job details
+            job_id = f"adzuna_{job.get('id', random.randint(1000, 9999))}"
+            title = job.get('title', 'No Title')
+            company = job.get('company', {}).get('display_name', 'Unknown Company')
+            job_location = job.get('location', {}).get('display_name', location or 'Unknown')
+            description = job.get('description', 'No description available')
+            job_url = job.get('redirect_url', '')
+            salary = job.get('salary_is_predicted', 'Not specified')
+            if isinstance(salary, bool) and job.get('salary_min') and job.get('salary_max'):
+                currency = job.get('salary_currency', '$')
+                salary = f"{currency}{int(job.get('salary_min', 0)):,} - {currency}{int(job.get('salary_max', 0)):,}"
+            
+            # Format posted date
+            posted_date = 'Recently'
+            if 'created' in job:
+                try:
+                    date_obj = datetime.strptime(job['created'], "%Y-%m-%dT%H:%M:%SZ")
+                    days_ago = (datetime.now() - date_obj).days
+                    posted_date = f"{days_ago} days ago" if days_ago > 0 else "Today"
+                except Exception:
+                    pass
+            
+            # Extract skills from description
+            skills = extract_skills_from_text(description)
+            
+            # Create job object
+            job_obj = {
+                'id': job_id,
+                'title': title,
+                'company': company,
+                'location': job_location,
+                'description': description[:500] + '...' if len(description) > 500 else description,  # Truncate long descriptions
+                'full_description': description,
+                'source': 'Adzuna',
+                'url': job_url,
+                'application_url': job_url,
+                'job_type': job.get('contract_type', 'Unknown'),
+                'salary': salary,
+                'posted_date': posted_date,
+                'skills': skills
+            }
+            
+            jobs.append(job_obj)
+            
+            if len(jobs) >= limit:
+                break
+                
+        return jobs
+
     def search_adzuna(self, query, location="", limit=20):
         """
         Search for jobs on Adzuna API
         
+        Uses the async adapter through the background event loop when aiohttp
+        is installed, and the blocking requests session otherwise.
+        
         Args:
             query (str): Job search query
             location (str): Location for job search
@@ -450,6 +735,9 @@ class JobScraper:
         Returns:
             list: List of job dictionaries
         """
+        if async_http_available:
+            return run_sync(self.search_adzuna_async(query, location, limit))
+            
         # Check if API credentials are available
         if not self.adzuna_app_id or not self.adzuna_api_key:
             logger.warning("Adzuna API credentials not found. Set ADZUNA_APP_ID and ADZUNA_API_KEY environment variables.")
@@ -457,93 +745,33 @@ class JobScraper:
             
         # Check cache first
         cache_key = f"adzuna_{query}_{location}_{limit}"
-        if cache_key in self.job_cache and time.time() - self.cache_expiry.get(cache_key, 0) < self.cache_duration:
+        cached = self._get_cached(cache_key, limit)
+        if cached is not None:
             logger.info(f"Using cached Adzuna results for query: {query}")
-            return self.job_cache[cache_key][:limit]
+            return cached
             
         try:
-            # Prepare API parameters
-            country = "gb"  # Default to UK
-            if location and any(loc in location.lower() for loc in ["us", "united states", "america"]):
-                country = "us"
-                
-            # Construct API URL
-            api_url = f"{self.adzuna_api_url}/{country}/search/1"
-            
-            params = {
-                "app_id": self.adzuna_app_id,
-                "app_key": self.adzuna_api_key,
-                "results_per_page": min(limit, 50),  # API limit
-                "what": query,
-                "content-type": "application/json"
-            }
-            
-            if location and country == "us":
-                # Extract state or city
-                location_parts = location.split(",")
-                if len(location_parts) > 1:
-                    params["where"] = location_parts[0].strip()
-                else:
-                    params["where"] = location
-                    
-            # Make API request
-            response = self.session.get(api_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Process results
+            page_size = min(limit, ADZUNA_PAGE_SIZE)
             jobs = []
-            for job in data.get('results', [])[:limit]:
-                # Extract job details
-                job_id = f"adzuna_{job.get('id', random.randint(1000, 9999))}"
-                title = job.get('title', 'No Title')
-                company = job.get('company', {}).get('display_name', 'Unknown Company')
-                job_location = job.get('location', {}).get('display_name', location or 'Unknown')
-                description = job.get('description', 'No description available')
-                job_url = job.get('redirect_url', '')
-                salary = job.get('salary_is_predicted', 'Not specified')
-                if isinstance(salary, bool) and job.get('salary_min') and job.get('salary_max'):
-                    currency = job.get('salary_currency', '$')
-                    salary = f"{currency}{int(job.get('salary_min', 0)):,} - {currency}{int(job.get('salary_max', 0)):,}"
-                
-                # Format posted date
-                posted_date = 'Recently'
-                if 'created' in job:
-                    try:
-                        date_obj = datetime.strptime(job['created'], "%Y-%m-%dT%H:%M:%SZ")
-                        days_ago = (datetime.now() - date_obj).days
-                        posted_date = f"{days_ago} days ago" if days_ago > 0 else "Today"
-                    except Exception:
-                        pass
+            page = 1
+            while len(jobs) < limit:
+                api_url, params = self._adzuna_request(query, location, page_size, page)
                 
-                # Extract skills from description
-                skills = extract_skills_from_text(description)
+                # Make API request
+                with get_limiter('adzuna').slot() as slot:
+                    response = self.session.get(api_url, params=params, timeout=20)
+                    slot.record_response(response)
+                response.raise_for_status()
+                data = response.json()
                 
-                # Create job object
-                job_obj = {
-                    'id': job_id,
-                    'title': title,
-                    'company': company,
-                    'location': job_location,
-                    'description': description[:500] + '...' if len(description) > 500 else description,  # Truncate long descriptions
-                    'full_description': description,
-                    'source': 'Adzuna',
-                    'url': job_url,
-                    'application_url': job_url,
-                    'job_type': job.get('contract_type', 'Unknown'),
-                    'salary': salary,
-                    'posted_date': posted_date,
-                    'skills': skills
-                }
-                
-                jobs.append(job_obj)
+                jobs.extend(self._parse_adzuna_jobs(data, location, limit - len(jobs)))
                 
-                if len(jobs) >= limit:
+                # Stop on a short page
+                if len(data.get('results', [])) < page_size:
                     break
-                    
-            # Update cache
-            self.job_cache[cache_key] = jobs
-            self.cache_expiry[cache_key] = time.time()
+                page += 1
+                
+            self._set_cached(cache_key, jobs)
             
             logger.info(f"Found {len(jobs)} Adzuna jobs for query: {query}")
             return jobs
@@ -551,6 +779,134 @@ class JobScraper:
         except Exception as e:
             logger.error(f"Adzuna API error: {e}")
             return []
+
+    async def search_adzuna_async(self, query, location="", limit=20):
+        """
+        Search for jobs on Adzuna API without blocking the event loop
+        
+        Limits above one API page are fetched with fetch_adzuna_pages_async().
+        
+        Args:
+            query (str): Job search query
+            location (str): Location for job search
+            limit (int): Maximum number of jobs to return
+            
+        Returns:
+            list: List of job dictionaries
+        """
+        if not self.adzuna_app_id or not self.adzuna_api_key:
+            logger.warning("Adzuna API credentials not found. Set ADZUNA_APP_ID and ADZUNA_API_KEY environment variables.")
+            return []
+            
+        cache_key = f"adzuna_{query}_{location}_{limit}"
+        cached = self._get_cached(cache_key, limit)
+        if cached is not None:
+            logger.info(f"Using cached Adzuna results for query: {query}")
+            return cached
+            
+        try:
+            jobs, fetched = await self.fetch_adzuna_pages_async(query, location, limit)
+            
+            # Don't cache a search where every page failed
+            if fetched:
+                self._set_cached(cache_key, jobs)
+            
+            logger.info(f"Found {len(jobs)} Adzuna jobs for query: {query}")
+            return jobs
+            
+        except Exception as e:
+            logger.error(f"Adzuna API error: {e}")
+            return []
+
+    async def fetch_adzuna_pages_async(self, query, location="", limit=100,
+                                       max_in_flight=ADZUNA_MAX_PAGES_IN_FLIGHT):
+        """
+        Fetch Adzuna result pages 1..N concurrently and merge them in page order
+        
+        Pages are requested through the 'adzuna' rate limiter, at most
+        max_in_flight at a time. Once a page comes back short (or the reported
+        result count shows there are no more), later pages are cancelled.
+        
+        Args:
+            query (str): Job search query
+            location (str): Location for job search
+            limit (int): Maximum number of jobs to return
+            max_in_flight (int): Maximum number of page requests scheduled at once
+            
+        Returns:
+            tuple: (jobs, fetched) where fetched is False if every page failed
+        """
+        page_size = min(limit, ADZUNA_PAGE_SIZE)
+        last_page = max(1, -(-limit // page_size))
+        next_page = 1
+        pages = {}  # page number -> decoded response, None if the request failed
+        pending = {}  # task -> page number
+        
+        async def fetch_page(page):
+            api_url, params = self._adzuna_request(query, location, page_size, page)
+            return await shared_http_client.get_json(api_url, params, source='adzuna')
+        
+        try:
+            while pending or next_page <= last_page:
+                while next_page <= last_page and len(pending) < max_in_flight:
+                    pending[asyncio.ensure_future(fetch_page(next_page))] = next_page
+                    next_page += 1
+                    
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = pending.pop(task)
+                    try:
+                        data = task.result()
+                    except Exception as e:
+                        logger.error(f"Adzuna API error on page {page}: {e}")
+                        pages[page] = None
+                        continue
+                        
+                    pages[page] = data
+                    count = data.get('count')
+                    if isinstance(count, int):
+                        last_page = min(last_page, max(1, -(-count // page_size)))
+                    if len(data.get('results', [])) < page_size:
+                        last_page = min(last_page, page)
+                        
+                # Drop requests for pages past the end of the results
+                for task, page in list(pending.items()):
+                    if page > last_page:
+                        task.cancel()
+                        del pending[task]
+        finally:
+            for task in pending:
+                task.cancel()
+                
+        jobs = []
+        for page in sorted(pages):
+            if page > last_page or len(jobs) >= limit:
+                break
+            if pages[page] is not None:
+                jobs.extend(self._parse_adzuna_jobs(pages[page], location, limit - len(jobs)))
+                
+        return jobs, any(data is not None for data in pages.values())
+
+    async def search_apis_async(self, queries, location="", sources=("remotive", "adzuna"), limit=20):
+        """
+        Run API source searches for several queries concurrently
+        
+        Args:
+            queries (list): Job search queries
+            location (str): Location for job search
+            sources (tuple): API sources to query ("remotive", "adzuna")
+            limit (int): Maximum number of jobs per query and source
+            
+        Returns:
+            dict: Jobs keyed by (query, source)
+        """
+        adapters = {
+            'remotive': self.search_remotive_async,
+            'adzuna': self.search_adzuna_async,
+        }
+        keys = [(query, source) for query in queries for source in sources if source in adapters]
+        results = await asyncio.gather(*(adapters[source](query, location, limit) for query, source in keys))
+        return dict(zip(keys, results))
             
     def search_github_jobs(self, query, location="", limit=20):
         """
@@ -587,73 +943,65 @@ class JobScraper:
             url = f"{base_url}?{urlencode(params)}"
             
             # Navigate to GitHub Jobs
-            self.driver.get(url)
+            with get_limiter('github').slot():
+                self.driver.get(url)
             
             # Wait for job results to load
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".job"))
             )
+            record_page_usage(self.driver)
             
-            # Find job listings
-            job_listings = []
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, ".job")
-            
-            for job_elem in job_elements[:limit]:
+            # Parse the list page once into plain values, before any navigation
+            listings = []
+            for job_elem in self.driver.find_elements(By.CSS_SELECTOR, ".job")[:limit]:
                 try:
-                    # Extract job details
                     title_elem = job_elem.find_element(By.CSS_SELECTOR, ".title h4 a")
-                    title = title_elem.text
-                    job_url = title_elem.get_attribute("href")
-                    
-                    company_elem = job_elem.find_element(By.CSS_SELECTOR, ".company")
-                    company = company_elem.text
-                    
-                    location_elem = job_elem.find_element(By.CSS_SELECTOR, ".location")
-                    job_location = location_elem.text
-                    
-                    # Get job description by visiting the job URL
-                    self.driver.get(job_url)
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, ".job-description"))
-                    )
-                    
-                    description_elem = self.driver.find_element(By.CSS_SELECTOR, ".job-description")
-                    description = description_elem.text
-                    
-                    # Extract skills from description
-                    skills = extract_skills_from_text(description)
-                    
-                    # Create job object
-                    job_obj = {
-                        'id': f"github_{random.randint(1000, 9999)}",
-                        'title': title,
-                        'company': company,
-                        'location': job_location,
-                        'description': description[:500] + '...' if len(description) > 500 else description,  # Truncate long descriptions
-                        'full_description': description,
-                        'source': 'GitHub Jobs',
-                        'url': job_url,
-                        'application_url': job_url,
-                        'job_type': extract_job_type(description),
-                        'salary': 'Not specified',
-                        'posted_date': 'Recently',
-                        'skills': skills
-                    }
-                    
-                    job_listings.append(job_obj)
-                    
-                    # Go back to search results
-                    self.driver.back()
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, ".job"))
-                    )
-                    
-                    if len(job_listings) >= limit:
-                        break
-                        
+                    listings.append({
+                        'title': title_elem.text,
+                        'url': title_elem.get_attribute("href"),
+                        'company': job_elem.find_element(By.CSS_SELECTOR, ".company").text,
+                        'location': job_elem.find_element(By.CSS_SELECTOR, ".location").text
+                    })
                 except Exception as e:
                     logger.warning(f"Error parsing GitHub job: {e}")
                     continue
+            
+            # Fetch detail pages in parallel: plain HTTP first, browser tabs for the rest
+            urls = [listing['url'] for listing in listings if listing['url']]
+            descriptions = self._fetch_github_descriptions_http(urls)
+            missing = [url for url in urls if url not in descriptions]
+            if missing:
+                descriptions.update(self._fetch_github_descriptions_browser(missing))
+            
+            job_listings = []
+            for listing in listings:
+                description = descriptions.get(listing['url'])
+                if not description:
+                    continue
+                job_url = listing['url']
+                
+                # Extract skills from description
+                skills = extract_skills_from_text(description)
+                
+                # Create job object
+                job_obj = {
+                    'id': f"github_{random.randint(1000, 9999)}",
+                    'title': listing['title'],
+                    'company': listing['company'],
+                    'location': listing['location'],
+                    'description': description[:500] + '...' if len(description) > 500 else description,  # Truncate long descriptions
+                    'full_description': description,
+                    'source': 'GitHub Jobs',
+                    'url': job_url,
+                    'application_url': job_url,
+                    'job_type': extract_job_type(description),
+                    'salary': 'Not specified',
+                    'posted_date': 'Recently',
+                    'skills': skills
+                }
+                
+                job_listings.append(job_obj)
                     
             # Update cache
             self.job_cache[cache_key] = job_listings
@@ -667,10 +1015,101 @@ class JobScraper:
             return []
         finally:
             # Close the browser if it was initialized
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
+            self._quit_driver()
+                
+    def _fetch_github_descriptions_http(self, urls):
+        """
+        Fetch GitHub job detail pages concurrently over plain HTTP
+        
+        Args:
+            urls (list): Detail page URLs
+            
+        Returns:
+            dict: Job description text keyed by URL, for pages that could be parsed
+        """
+        if not urls:
+            return {}
+        
+        if async_http_available:
+            async def fetch_all():
+                return await asyncio.gather(
+                    *(shared_http_client.get_text(url, source='github_details') for url in urls),
+                    return_exceptions=True
+                )
+            pages = run_sync(fetch_all())
+        else:
+            def fetch(url):
+                try:
+                    with get_limiter('github_details').slot() as slot:
+                        response = self.session.get(url, timeout=15)
+                        slot.record_response(response)
+                    response.raise_for_status()
+                    return response.text
+                except Exception as e:
+                    return e
+            with ThreadPoolExecutor(max_workers=GITHUB_DETAIL_WORKERS) as executor:
+                pages = list(executor.map(fetch, urls))
+        
+        descriptions = {}
+        for url, page in zip(urls, pages):
+            if isinstance(page, Exception):
+                logger.warning(f"GitHub job detail fetch failed for {url}: {page}")
+                continue
+            description = parse_github_description_html(page)
+            if description:
+                descriptions[url] = description
+        return descriptions
+    
+    def _fetch_github_descriptions_browser(self, urls):
+        """
+        Load GitHub job detail pages in parallel browser tabs
+        
+        Tabs are opened in batches of GITHUB_MAX_TABS so the pages load
+        concurrently, then each tab is read and closed. Only tabs opened here
+        are ever closed; the main window is restored afterwards.
+        
+        Args:
+            urls (list): Detail page URLs
+            
+        Returns:
+            dict: Job description text keyed by URL
+        """
+        descriptions = {}
+        main_window = self.driver.current_window_handle
+        
+        for start in range(0, len(urls), GITHUB_MAX_TABS):
+            tabs = []
+            try:
+                for url in urls[start:start + GITHUB_MAX_TABS]:
+                    known_handles = set(self.driver.window_handles)
+                    with get_limiter('github_details').slot():
+                        self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+                    new_handles = [handle for handle in self.driver.window_handles
+                                   if handle not in known_handles and handle != main_window]
+                    if new_handles:
+                        tabs.append((url, new_handles[0]))
                 
+                for url, handle in tabs:
+                    try:
+                        self.driver.switch_to.window(handle)
+                        WebDriverWait(self.driver, 10).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, ".job-description"))
+                        )
+                        descriptions[url] = self.driver.find_element(By.CSS_SELECTOR, ".job-description").text
+                    except Exception as e:
+                        logger.warning(f"Error loading GitHub job detail {url}: {e}")
+            finally:
+                # Close only the tabs opened above, by handle, then go back to the main window
+                for url, handle in tabs:
+                    try:
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                    except Exception as e:
+                        logger.warning(f"Could not close GitHub job detail tab {url}: {e}")
+                self.driver.switch_to.window(main_window)
+        
+        return descriptions
+    
     def search_jobs(self, query, location="", sources=None, limit=20):
         """
         Search for jobs across multiple sources
@@ -692,10 +1131,21 @@ class JobScraper:
         
         all_jobs = []
         
+        # Fetch the API sources concurrently on the background event loop
+        api_jobs = {}
+        api_sources = [source for source in sources if source in ("remotive", "adzuna")]
+        if async_http_available and api_sources:
+            try:
+                api_jobs = run_sync(self.search_apis_async([query], location, api_sources, jobs_per_source))
+            except Exception as e:
+                logger.error(f"Error searching API sources: {e}")
+        
         # Search each source
         for source in sources:
             try:
-                if source == "remotive":
+                if (query, source) in api_jobs:
+                    jobs = api_jobs[(query, source)]
+                elif source == "remotive":
                     jobs = self.search_remotive(query, location, jobs_per_source)
                 elif source == "adzuna":
                     jobs = self.search_adzuna(query, location, jobs_per_source)
@@ -712,16 +1162,9 @@ class JobScraper:
                 logger.error(f"Error searching {source}: {e}")
                 continue
                 
-        # Deduplicate jobs by title and company
-        unique_jobs = []
-        seen = set()
+        # Drop near-duplicates (same posting syndicated across sources)
+        unique_jobs = dedupe_jobs(all_jobs, shared_job_index)
         
-        for job in all_jobs:
-            key = f"{job['title']}_{job['company']}".lower()
-            if key not in seen:
-                seen.add(key)
-                unique_jobs.append(job)
-                
         # Sort by relevance (presence of query terms in title)
         query_terms = query.lower().split()
         
@@ -744,6 +1187,154 @@ class JobScraper:
         return unique_jobs[:limit]
 
 # Helper functions for job parsing
+def _has_class(name):
+    """XPath predicate matching elements with the given CSS class"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Card containers on Google results pages, most specific first
+GOOGLE_CARD_XPATHS = [
+    f"//div[{_has_class('job_seen_beacon')}]",
+    f"//div[{_has_class('BjJfJf')}]/ancestor::li[1]",
+    f"//div[{_has_class('g')}]",
+    f"//div[{_has_class('Gx5Zad')}]",  # Results page served to clients without JavaScript
+]
+
+
+def _first_text(element, xpaths, min_length=1):
+    """Return the text of the first element matched by any of the XPaths"""
+    for xpath in xpaths:
+        for match in element.xpath(xpath):
+            text = element_text(match)
+            if len(text) >= min_length:
+                return text
+    return None
+
+
+# Card selectors for the browser-rendered Google results page, most specific first
+GOOGLE_CARD_SELECTORS = [
+    "div.job_seen_beacon",
+    "div.jobsearch-JobCard",
+    "div.BjJfJf",
+    "div[data-ved]",  # More generic selector that might catch job cards
+    "div.g"  # Generic Google search result
+]
+
+# Remember which card selector worked last for each (locale, layout)
+google_selector_registry = SelectorRegistry(GOOGLE_CARD_SELECTORS)
+google_xpath_registry = SelectorRegistry(GOOGLE_CARD_XPATHS)
+
+
+def google_locale(url, default=None):
+    """Return the interface language (hl parameter) of a Google URL"""
+    return parse_qs(urlparse(url).query).get('hl', [default or GOOGLE_INTERFACE_LANGUAGE])[0]
+
+
+def parse_google_jobs_html(html, query, location="", limit=20, search_url="", locale=None):
+    """
+    Parse job cards out of a Google results page with lxml
+    
+    Args:
+        html (str): Results page HTML
+        query (str): Job search query
+        location (str): Location used for the search
+        limit (int): Maximum number of jobs to return
+        search_url (str): URL of the results page, used when a card has no link
+        locale (str): Interface language of the page, which selectors are learned per
+            (defaults to the hl parameter of search_url)
+        
+    Returns:
+        list: List of job dictionaries
+    """
+    locale = locale or google_locale(search_url)
+    try:
+        doc = lxml.html.fromstring(html)
+    except Exception as e:
+        logger.warning(f"Could not parse Google results HTML: {str(e)}")
+        return []
+    
+    # Try card XPaths in learned order until one yields jobs
+    context = (locale, 'basic')
+    tried = []
+    for xpath in google_xpath_registry.ordered(context):
+        cards = doc.xpath(xpath)
+        if not cards:
+            tried.append(xpath)
+            continue
+        job_listings = _parse_google_cards(cards, location, limit, search_url)
+        google_xpath_registry.record_result(context, tried, xpath, bool(job_listings))
+        if job_listings:
+            return job_listings
+        tried = []
+    
+    google_xpath_registry.record_result(context, tried, None, False)
+    return []
+
+
+def _parse_google_cards(cards, location, limit, search_url):
+    """Convert lxml card elements from a Google results page into job dictionaries"""
+    job_listings = []
+    for card in cards:
+        title = _first_text(card, [f".//div[{_has_class('BjJfJf')}]", ".//h3"])
+        if not title or len(title) > 100:
+            continue
+        
+        company = _first_text(card, [f".//div[{_has_class('nJlQsc')}]", ".//span[@class='company']"]) or "Company Not Specified"
+        location_text = _first_text(card, [f".//div[{_has_class('Qk80Jf')}]", ".//span[@class='location']"]) or location or "Remote/Various"
+        snippet = _first_text(card, [f".//div[{_has_class('HBvzbc')}]", f".//div[{_has_class('VwiC3b')}]",
+                                     f".//div[{_has_class('BNeawe')}]"], min_length=21) or "No description available"
+        
+        # Get the job URL, unwrapping Google's /url?q= redirects
+        job_url = search_url
+        for href in card.xpath(".//a/@href"):
+            if href.startswith('/url?'):
+                href = parse_qs(urlparse(href).query).get('q', [''])[0]
+            if href.startswith('http'):
+                job_url = href
+                break
+        
+        job_listings.append({
+            'id': f"google_{random.randint(1000, 9999)}",
+            'title': title,
+            'company': company,
+            'location': location_text,
+            'description': snippet,
+            'full_description': snippet,
+            'source': 'Google Jobs',
+            'url': job_url,
+            'application_url': job_url,
+            'skills': extract_skills_from_text(snippet),
+            'posted_date': 'Recently',
+            'job_type': extract_job_type(snippet)
+        })
+        
+        if len(job_listings) >= limit:
+            break
+    
+    return job_listings
+
+
+def parse_github_description_html(html):
+    """
+    Extract the job description text from a GitHub job detail page
+    
+    Args:
+        html (str): Detail page HTML
+        
+    Returns:
+        str: Description text, or None if the page has no description element
+    """
+    try:
+        doc = lxml.html.fromstring(html)
+    except Exception:
+        return None
+    for element in doc.xpath(f"//div[{_has_class('job-description')}]"):
+        text = element.text_content().strip()
+        if text:
+            return text
+    return None
+
+
 def extract_skills_from_text(text):
     """
     Extract potential skills from job description text
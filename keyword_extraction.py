@@ -0,0 +1,354 @@
+"""
+Keyword Extraction Module for Berojgar
+
+This module extracts weighted keywords and skills from job descriptions.
+Text is tokenized with precompiled patterns (keeping terms such as "c++",
+"node.js" and "ci/cd" intact) and split at punctuation so phrases never span
+sentences. One linear pass counts 1-3 word phrases and picks out known skills
+(longest phrase first). Phrases are ranked by TF-IDF against document
+frequencies collected from job descriptions, so boilerplate that appears in
+every posting sinks below the terms that set a job apart. The table is built
+from scraped job descriptions as they arrive; until it has seen enough of
+them, phrases are ranked by plain term frequency. Scoring reads a published
+snapshot of the table that only changes every SAVE_EVERY new postings, when
+the table is also written out on a background thread, and the snapshot's
+version is part of the ATS result cache key. Posting
+boilerplate ("join our team", "experience", "looking") never forms a keyword.
+"""
+
+import ast
+import csv
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import tempfile
+import threading
+from dataclasses import dataclass
+
+logger = logging.getLogger("keyword_extraction")
+
+# Longest phrase counted as a keyword
+MAX_NGRAM = 3
+
+# Keywords kept per job description
+KEYWORD_LIMIT = 30
+
+# Skills outrank other phrases with the same TF-IDF weight by this factor
+SKILL_BOOST = 2.0
+
+# Unsaved documents after which the IDF table is written out and published for scoring
+SAVE_EVERY = 25
+
+# Descriptions the table must hold before IDF is applied; below this, keywords use plain TF
+MIN_IDF_DOCUMENTS = 50
+
+# The table drops terms seen in only one document once it grows past this
+MAX_TERMS = 200000
+
+STOPWORDS = frozenset('''
+a about above after again all also am an and any are as at be been being below between both but by can
+could did do does doing down during each etc few for from further had has have having he her here hers
+him his how i if in into is it its itself just may me might more most must my no nor not of off on once
+only or other our ours out over own per same shall she should so some such than that the their theirs
+them then there these they this those through to too under until up upon us very via was we were what
+when where which while who whom why will with within without would you your yours
+'''.split())
+
+# Job posting boilerplate; like stopwords, these never start or end a keyword
+BOILERPLATE_TERMS = frozenset('''
+ability able apply applicant applicants benefits candidate candidates closely company deliver description
+desired driven ensure environment excellent exciting experience experienced fast good great help ideal
+including job join knowledge looking maintain new opportunity passion passionate plus position preferred
+proven qualifications related required requirements responsibilities responsible role seeking skills
+strong team teams understanding using well work working world year years
+'''.split())
+
+# Skills recognised in job descriptions, on top of those in the bundled job data.
+# Words that are usually plain English in a posting ("go", "rest", "excel") are left out.
+SKILL_TERMS = (
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'golang', 'rust', 'ruby', 'php',
+    'scala', 'kotlin', 'matlab', 'bash', 'sql', 'nosql', 'html', 'css',
+    'react', 'angular', 'vue', 'node', 'node.js', 'express.js', 'django', 'flask', 'fastapi',
+    'spring boot', '.net', 'ruby on rails', 'graphql', 'rest api', 'microservices',
+    'aws', 'azure', 'gcp', 'google cloud', 'cloud', 'docker', 'kubernetes', 'terraform', 'ansible', 'jenkins',
+    'ci/cd', 'devops', 'linux', 'git',
+    'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'kafka', 'spark', 'hadoop', 'airflow',
+    'snowflake', 'tableau', 'power bi',
+    'machine learning', 'deep learning', 'nlp', 'natural language processing', 'computer vision',
+    'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'data analysis', 'data science',
+    'data engineering', 'statistics', 'big data', 'etl',
+    'agile', 'scrum', 'kanban', 'jira', 'project management', 'product management',
+    'security', 'cybersecurity', 'networking',
+    'communication', 'leadership', 'problem solving', 'teamwork', 'management',
+)
+
+DEFAULT_IDF_PATH = os.environ.get(
+    'KEYWORD_IDF_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'keyword_idf.json')
+)
+SEED_JOBS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'job.csv')
+
+# Sentence and list boundaries; a '.' only ends a sentence before whitespace or the end
+_SEGMENT_RE = re.compile(r'[,;:!?()\[\]{}<>"\n\r\t•|]+|\.(?=\s|$)')
+# Words, keeping inner '.', '/', '-' and trailing '+'/'#' ("node.js", "ci/cd", "c++", "c#")
+_TOKEN_RE = re.compile(r'\.?[a-z0-9][a-z0-9+#]*(?:[./-][a-z0-9+#]+)*')
+
+
+def tokenize(text):
+    """
+    Split text into lower-case token runs, one per sentence or list item
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Token lists; phrases are only formed within one list
+    """
+    segments = []
+    for segment in _SEGMENT_RE.split(text.lower()):
+        tokens = _TOKEN_RE.findall(segment)
+        if tokens:
+            segments.append(tokens)
+    return segments
+
+
+def _is_term_edge(token):
+    """Phrases start and end with a word that is not a stopword, boilerplate or a bare number ("5+")"""
+    return token not in STOPWORDS and token not in BOILERPLATE_TERMS and any(char.isalpha() for char in token)
+
+
+def _seed_skills(path=SEED_JOBS_PATH):
+    """Required skills listed in the bundled job data (lower case)"""
+    skills = set()
+    try:
+        with open(path, newline='', encoding='utf-8') as handle:
+            for row in csv.DictReader(handle):
+                try:
+                    row_skills = ast.literal_eval(row.get('Required_Skills') or '[]')
+                except (ValueError, SyntaxError):
+                    continue
+                skills.update(str(skill).strip().lower() for skill in row_skills if str(skill).strip())
+    except OSError as e:
+        logger.warning(f"Could not read seed job data from {path}: {e}")
+    return skills
+
+
+@dataclass(frozen=True)
+class JobKeywords:
+    """Keywords and skills of one job description"""
+
+    keywords: tuple  # Highest weighted phrases first
+    skills: tuple  # Known skills, in order of first mention
+    weights: dict  # Keyword -> TF-IDF weight
+
+
+class KeywordIdf:
+    """Document frequencies of phrases across job descriptions, updated as jobs arrive"""
+
+    def __init__(self, path=DEFAULT_IDF_PATH, min_documents=MIN_IDF_DOCUMENTS):
+        """
+        Initialize the table
+
+        Args:
+            path (str): JSON file holding the table
+            min_documents (int): Descriptions needed before IDF is applied
+        """
+        self.path = path
+        self.min_documents = min_documents
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._documents = 0
+        self._doc_freq = None
+        self._unsaved = 0
+        self._saving = False
+        self._published = None  # (documents, doc_freq, version) read by idf()
+
+    def _load(self):
+        if self._doc_freq is not None:
+            return
+        try:
+            with open(self.path, encoding='utf-8') as handle:
+                payload = handle.read()
+            data = json.loads(payload)
+            self._documents = int(data['documents'])
+            self._doc_freq = dict(data['terms'])
+        except (OSError, ValueError, KeyError, TypeError):
+            self._documents = 0
+            self._doc_freq = {}
+            payload = _serialize(0, {})
+        self._published = (self._documents, dict(self._doc_freq), _table_version(payload))
+
+    def _count(self, text):
+        self._documents += 1
+        for term in set(_ngrams(tokenize(text))):
+            self._doc_freq[term] = self._doc_freq.get(term, 0) + 1
+
+    def add_documents(self, texts):
+        """
+        Count new job descriptions into the table
+
+        Args:
+            texts (iterable): Job description texts (empty ones are skipped)
+        """
+        with self._lock:
+            self._load()
+            for text in texts:
+                if text:
+                    self._count(text)
+                    self._unsaved += 1
+            if len(self._doc_freq) > MAX_TERMS:
+                self._doc_freq = {term: count for term, count in self._doc_freq.items() if count > 1}
+            if self._unsaved < SAVE_EVERY or self._saving:
+                return
+            self._saving = True
+        # Serializing and writing a large table is slow, so keep it off the caller's request
+        threading.Thread(target=self._save_in_background, name="keyword-idf-save", daemon=True).start()
+
+    @property
+    def version(self):
+        """Identifier of the published table; changes whenever idf() results may change"""
+        with self._lock:
+            self._load()
+            return self._published[2]
+
+    def idf(self, terms):
+        """
+        Get smoothed inverse document frequencies from the published table
+
+        Args:
+            terms (iterable): Phrases
+
+        Returns:
+            dict: Phrase -> IDF; unseen phrases get the highest value, and every
+                phrase gets 1.0 until the table holds min_documents descriptions
+        """
+        with self._lock:
+            self._load()
+            documents, doc_freq, _ = self._published
+        if documents < self.min_documents:
+            return {term: 1.0 for term in terms}
+        return {term: math.log((1 + documents) / (1 + doc_freq.get(term, 0))) + 1 for term in terms}
+
+    def save(self):
+        """Write the table out and publish it now"""
+        with self._lock:
+            self._load()
+        self._save()
+
+    def _save_in_background(self):
+        try:
+            self._save()
+        finally:
+            with self._lock:
+                self._saving = False
+
+    def _save(self):
+        with self._save_lock:
+            with self._lock:
+                documents, doc_freq = self._documents, dict(self._doc_freq)
+                self._unsaved = 0
+            payload = _serialize(documents, doc_freq)
+            with self._lock:
+                self._published = (documents, doc_freq, _table_version(payload))
+            try:
+                _write_atomic(self.path, payload)
+            except OSError as e:
+                logger.warning(f"Could not save keyword IDF table: {e}")
+
+
+def _serialize(documents, doc_freq):
+    return json.dumps({'documents': documents, 'terms': doc_freq}, sort_keys=True)
+
+
+def _table_version(payload):
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _write_atomic(path, payload):
+    directory = os.path.dirname(path) or '.'
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+            handle.write(payload)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _ngrams(segments, max_n=MAX_NGRAM):
+    """Phrases of 1 to max_n tokens that neither start nor end with a stopword or number"""
+    for tokens in segments:
+        for start, first in enumerate(tokens):
+            if not _is_term_edge(first):
+                continue
+            for end in range(start, min(start + max_n, len(tokens))):
+                if _is_term_edge(tokens[end]):
+                    yield ' '.join(tokens[start:end + 1])
+
+
+class KeywordExtractor:
+    """TF-IDF keyword and skill extraction for job descriptions"""
+
+    def __init__(self, idf, skills=SKILL_TERMS, limit=KEYWORD_LIMIT):
+        """
+        Initialize the extractor
+
+        Args:
+            idf (KeywordIdf): Document frequency table
+            skills (iterable): Known skill phrases (lower case)
+            limit (int): Keywords kept per description
+        """
+        self.idf = idf
+        self.skills = frozenset(skills)
+        self.limit = limit
+
+    def extract(self, text):
+        """
+        Extract keywords and skills from a job description in one pass
+
+        Args:
+            text (str): Job description
+
+        Returns:
+            JobKeywords: Weighted keywords and skills
+        """
+        counts = {}
+        skills = {}
+        for tokens in tokenize(text or ''):
+            skip_until = 0
+            for start, first in enumerate(tokens):
+                edge = _is_term_edge(first)
+                longest_skill = None
+                for end in range(start, min(start + MAX_NGRAM, len(tokens))):
+                    phrase = ' '.join(tokens[start:end + 1])
+                    if edge and _is_term_edge(tokens[end]):
+                        counts[phrase] = counts.get(phrase, 0) + 1
+                    if phrase in self.skills:
+                        longest_skill = phrase
+                # Skills are matched longest first and do not overlap
+                if longest_skill and start >= skip_until:
+                    skills.setdefault(longest_skill, len(skills))
+                    skip_until = start + longest_skill.count(' ') + 1
+
+        idf = self.idf.idf(counts)
+        weights = {}
+        for phrase, count in counts.items():
+            weight = (1 + math.log(count)) * idf[phrase]
+            if phrase in self.skills:
+                weight *= SKILL_BOOST
+            weights[phrase] = round(weight, 4)
+        keywords = sorted(weights, key=lambda phrase: (-weights[phrase], phrase))[:self.limit]
+        return JobKeywords(
+            keywords=tuple(keywords),
+            skills=tuple(sorted(skills, key=skills.get)),
+            weights={phrase: weights[phrase] for phrase in keywords},
+        )
+
+
+# Process-wide IDF table and extractor
+keyword_idf = KeywordIdf()
+keyword_extractor = KeywordExtractor(keyword_idf, skills=set(SKILL_TERMS) | _seed_skills())
@@ -0,0 +1,322 @@
+"""
+Live Scoring Module for Berojgar
+
+This module scores the resume being edited in the resume builder while the
+user types. The builder sends only the sections that changed since its last
+request. Each section's features are derived from that section alone and
+cached in a per-editor session, and every score component remembers which
+sections it was computed from, so an edit to the summary re-runs the format
+points but not the experience text scans or the job keyword extraction.
+"""
+
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+from ats_analysis import (ResumeFeatures, DEGREE_KEYWORDS, content_hash, experience_content_features,
+                          format_points, content_points, keyword_points, relevance_points, final_score,
+                          generate_improvements, get_missing_skills, job_relevance_keywords)
+from keyword_extraction import keyword_extractor
+
+# Idle sessions are dropped after this many seconds
+SESSION_TTL = 1800
+MAX_SESSIONS = 500
+
+MAX_SUGGESTIONS = 5
+
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_ONGOING_RE = re.compile(r'\b(?:present|current|now|ongoing)\b', re.IGNORECASE)
+_BULLET_RE = re.compile(r'^\s*[•\-*▪◦]', re.MULTILINE)
+
+# ResumeFeatures values for sections the builder has not sent yet
+_DEFAULT_FEATURES = {
+    'raw_text': '', 'experience_text': '', 'job_description': '',
+    'has_summary': False, 'has_experience_section': False, 'has_education': False,
+    'has_skills_section': False, 'has_degree_keyword': False,
+    'skills': (), 'experience_years': 0, 'education': '',
+    'email': 'Not found', 'phone': 'Not found', 'job_role': 'Unknown', 'word_count': 0,
+    'has_bullet_points': None, 'has_dates': None, 'has_tables': False, 'has_images': False,
+    'extracted_scores': None,
+    'action_verbs': frozenset(), 'measurable_matches': 0, 'has_impact_statement': False, 'has_digits': False,
+    'job_keywords': (), 'relevance_keywords': (),
+}
+
+
+def _text(data, key):
+    value = data.get(key) if isinstance(data, dict) else None
+    return value.strip() if isinstance(value, str) else ''
+
+
+def _entries(data):
+    return [entry for entry in data if isinstance(entry, dict)] if isinstance(data, list) else []
+
+
+def _words(*texts):
+    return sum(len(text.split()) for text in texts)
+
+
+def _split_list(text):
+    return [item.strip() for item in text.split(',') if item.strip()]
+
+
+def _period_years(period):
+    """Years spanned by an employment period such as 'Jan 2019 - Present'"""
+    years = [int(year) for year in _YEAR_RE.findall(period)]
+    if _ONGOING_RE.search(period):
+        years.append(datetime.now().year)
+    return max(years) - min(years) if years else 0
+
+
+def _contact_features(data):
+    """Contact details and target job title"""
+    email = _text(data, 'email')
+    phone = _text(data, 'phone')
+    return {
+        'email': email or 'Not found',
+        'phone': phone or 'Not found',
+        'job_role': _text(data, 'jobTitle') or 'Unknown',
+        'words': _words(_text(data, 'fullName'), _text(data, 'jobTitle'), _text(data, 'location')),
+    }
+
+
+def _summary_features(data):
+    """Whether there is a summary"""
+    summary = _text(data, 'summary')
+    return {'has_summary': bool(summary), 'words': _words(summary)}
+
+
+def _skills_features(data):
+    """Technical and soft skills (languages and certifications only count as words)"""
+    skills = tuple(_split_list(_text(data, 'technicalSkills')) + _split_list(_text(data, 'softSkills')))
+    return {
+        'skills': skills,
+        'has_skills_section': bool(skills),
+        'words': _words(_text(data, 'technicalSkills'), _text(data, 'softSkills'), _text(data, 'languages'),
+                        _text(data, 'certifications')),
+    }
+
+
+def _experience_features(data):
+    """Experience text, years, dates, bullets and the content scans of the text"""
+    entries = _entries(data)
+    descriptions = [_text(entry, 'description') for entry in entries]
+    periods = [_text(entry, 'period') for entry in entries]
+    experience_text = '\n'.join(
+        part for entry, description in zip(entries, descriptions)
+        for part in (_text(entry, 'title'), description) if part
+    )
+    features = {
+        'experience_text': experience_text,
+        'has_experience_section': bool(experience_text),
+        'experience_years': sum(_period_years(period) for period in periods),
+        'has_dates': any(periods),
+        'has_bullet_points': any(_BULLET_RE.search(description) for description in descriptions),
+        'words': _words(experience_text, *(_text(entry, 'company') for entry in entries)),
+    }
+    features.update(experience_content_features(experience_text))
+    return features
+
+
+def _education_features(data):
+    """Degrees and whether they name a degree level"""
+    entries = _entries(data)
+    degrees = [_text(entry, 'degree') for entry in entries if _text(entry, 'degree')]
+    degrees_lower = ' / '.join(degrees).lower()
+    return {
+        'education': ' / '.join(degrees),
+        'has_education': any(_text(entry, 'degree') or _text(entry, 'institution') for entry in entries),
+        'has_degree_keyword': any(keyword in degrees_lower for keyword in DEGREE_KEYWORDS),
+        'words': _words(*(_text(entry, key) for entry in entries
+                          for key in ('degree', 'institution', 'description'))),
+    }
+
+
+def _projects_features(data):
+    """Projects only add to the word count"""
+    return {'words': _words(*(_text(entry, key) for entry in _entries(data)
+                              for key in ('name', 'technologies', 'description')))}
+
+
+def _job_features(data):
+    """Target job description keywords and skills, extracted once per change"""
+    job_description = _text(data, 'description')
+    job = keyword_extractor.extract(job_description) if job_description else None
+    job_keywords = list(job.keywords) if job else []
+    return {
+        'job_description': job_description,
+        'job_keywords': tuple(job_keywords),
+        'relevance_keywords': tuple(job_relevance_keywords(job_description, job_keywords)),
+        'job_skills': job.skills if job else (),
+    }
+
+
+# Builder sections and the features each one owns
+SECTION_FEATURES = OrderedDict([
+    ('contact', _contact_features),
+    ('summary', _summary_features),
+    ('skills', _skills_features),
+    ('experience', _experience_features),
+    ('education', _education_features),
+    ('projects', _projects_features),
+    ('job', _job_features),
+])
+
+# Score components and the sections they are computed from
+COMPONENT_SECTIONS = {
+    'format': ('summary', 'experience', 'education', 'skills'),
+    'content': ('experience',),
+    'keyword': ('skills',),
+    'relevance': ('skills', 'job'),
+}
+
+# Sections the score is computed from; only these seed the score jitter, so
+# edits elsewhere (contact details, projects) never move the displayed score
+SCORED_SECTIONS = tuple(name for name in SECTION_FEATURES
+                        if any(name in sections for sections in COMPONENT_SECTIONS.values()))
+
+
+class LiveScoringSession:
+    """Cached section features and score components for one resume being edited"""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.last_used = time.time()
+        self._sections = {}  # Section -> (content hash, features)
+        self._components = {}  # Component -> (section hashes it was computed from, value)
+        self._lock = threading.Lock()
+
+    def _cached(self, name, sections, compute, recomputed):
+        key = tuple(self._sections[section][0] if section in self._sections else None for section in sections)
+        cached = self._components.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = compute()
+        self._components[name] = (key, value)
+        recomputed.append(name)
+        return value
+
+    def update(self, sections, mode=None):
+        """
+        Apply section edits and re-score
+
+        Args:
+            sections (dict): Section name -> section data, for the sections that changed
+            mode (str): Scoring mode, one of SCORING_MODES
+
+        Returns:
+            dict: score, components, missing_skills, suggestions, changed and
+                recomputed (section and component names) and elapsed_ms
+        """
+        started = time.perf_counter()
+        with self._lock:
+            self.last_used = time.time()
+            changed = []
+            for name, data in sections.items():
+                if name not in SECTION_FEATURES:
+                    continue
+                # Job keywords depend on the published IDF table as well as the text
+                digest = content_hash([data, keyword_extractor.idf.version] if name == 'job' else data)
+                if name not in self._sections or self._sections[name][0] != digest:
+                    self._sections[name] = (digest, SECTION_FEATURES[name](data))
+                    changed.append(name)
+
+            fields = dict(_DEFAULT_FEATURES)
+            words = 0
+            for name in SECTION_FEATURES:
+                if name in self._sections:
+                    section = dict(self._sections[name][1])
+                    words += section.pop('words', 0)
+                    section.pop('job_skills', None)
+                    fields.update(section)
+            fields['word_count'] = words
+
+            recomputed = []
+            job_skills = self._sections['job'][1]['job_skills'] if 'job' in self._sections else ()
+            fields['missing_skills'] = self._cached(
+                'missing_skills', ('skills', 'job'),
+                lambda: tuple(get_missing_skills(fields['skills'], fields['job_description'], job_skills)), recomputed)
+            fields['job_title_match'] = self._cached(
+                'job_title_match', ('contact', 'job'),
+                lambda: any(keyword in fields['job_role'].lower() for keyword in fields['job_keywords']), recomputed)
+            seed = content_hash([self._sections[name][0] if name in self._sections else None
+                                 for name in SCORED_SECTIONS])
+            features = ResumeFeatures(**fields, content_hash=seed)
+
+            components = {
+                'format': self._cached('format', COMPONENT_SECTIONS['format'],
+                                       lambda: format_points(features), recomputed),
+                'content': self._cached('content', COMPONENT_SECTIONS['content'],
+                                        lambda: content_points(features), recomputed),
+                'keyword': self._cached('keyword', COMPONENT_SECTIONS['keyword'],
+                                        lambda: keyword_points(features.skills), recomputed),
+                'relevance': self._cached('relevance', COMPONENT_SECTIONS['relevance'],
+                                          lambda: relevance_points(features.skills, features.relevance_keywords,
+                                                                   features.job_description), recomputed),
+            }
+            score = final_score(sum(components.values()), seed, mode)
+            suggestions = generate_improvements(features)[:MAX_SUGGESTIONS]
+
+        return {
+            'score': score,
+            'components': {name: round(value, 1) for name, value in components.items()},
+            'missing_skills': list(features.missing_skills),
+            'suggestions': suggestions,
+            'changed': changed,
+            'recomputed': recomputed,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 3),
+        }
+
+
+class LiveScoringStore:
+    """In-memory registry of live scoring sessions"""
+
+    def __init__(self, ttl=SESSION_TTL, max_sessions=MAX_SESSIONS):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        """
+        Get a session by id
+
+        Args:
+            session_id (str): Session identifier
+
+        Returns:
+            LiveScoringSession: The session, or None if unknown or expired
+        """
+        with self._lock:
+            self._evict()
+            session = self._sessions.get(session_id) if session_id else None
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def create(self):
+        """
+        Create a session
+
+        Returns:
+            LiveScoringSession: The new session
+        """
+        session = LiveScoringSession()
+        with self._lock:
+            self._evict()
+            while len(self._sessions) >= self.max_sessions:
+                self._sessions.popitem(last=False)
+            self._sessions[session.id] = session
+        return session
+
+    def _evict(self):
+        now = time.time()
+        for session_id, session in list(self._sessions.items()):
+            if now - session.last_used > self.ttl:
+                del self._sessions[session_id]
+
+
+# Process-wide live scoring sessions
+live_sessions = LiveScoringStore()
@@ -0,0 +1,157 @@
+"""
+Page Waits Module for Berojgar
+
+This module replaces fixed sleeps in browser automation with explicit
+conditions: the document is loaded, the DOM has stopped changing and no
+fetch/XHR requests are in flight (quiescence), and a field's value has stuck
+after being set. Every wait returns as soon as its condition holds and gives
+up after a configurable timeout.
+"""
+
+import os
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# Timeouts in seconds, overridable through the environment
+PAGE_LOAD_TIMEOUT = float(os.environ.get('AUTOFILL_PAGE_LOAD_TIMEOUT', 15))
+SETTLE_TIMEOUT = float(os.environ.get('AUTOFILL_SETTLE_TIMEOUT', 10))
+VALUE_TIMEOUT = float(os.environ.get('AUTOFILL_VALUE_TIMEOUT', 1.5))
+
+# How long the page must stay quiet (no DOM mutations, no requests) to count as settled
+QUIET_PERIOD_MS = int(os.environ.get('AUTOFILL_QUIET_PERIOD_MS', 500))
+
+POLL_INTERVAL = 0.1
+
+# Tracks the last DOM mutation and the number of in-flight fetch/XHR requests
+_INSTRUMENT_SCRIPT = """
+if (window.__berojgarWaits) { return; }
+const state = window.__berojgarWaits = {lastMutation: performance.now(), inflight: 0};
+
+new MutationObserver(function() { state.lastMutation = performance.now(); })
+    .observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+
+if (window.fetch) {
+    const originalFetch = window.fetch;
+    window.fetch = function() {
+        state.inflight++;
+        return originalFetch.apply(this, arguments).finally(function() { state.inflight--; });
+    };
+}
+
+const originalSend = XMLHttpRequest.prototype.send;
+XMLHttpRequest.prototype.send = function() {
+    state.inflight++;
+    this.addEventListener('loadend', function() { state.inflight--; }, {once: true});
+    return originalSend.apply(this, arguments);
+};
+"""
+
+_QUIET_STATE_SCRIPT = """
+const state = window.__berojgarWaits;
+if (!state) { return null; }
+return [performance.now() - state.lastMutation, state.inflight];
+"""
+
+_VALUE_SCRIPT = "return arguments[0].value;"
+
+
+def instrument_page(driver):
+    """
+    Install the mutation and request tracking used by wait_for_quiescence
+
+    Must be called again after every navigation; calling it twice is harmless.
+
+    Args:
+        driver: Selenium WebDriver instance
+    """
+    try:
+        driver.execute_script(_INSTRUMENT_SCRIPT)
+    except WebDriverException:
+        pass
+
+
+def wait_for_quiescence(driver, timeout=SETTLE_TIMEOUT, quiet_ms=QUIET_PERIOD_MS):
+    """
+    Wait until the DOM has not changed for quiet_ms and no requests are in flight
+
+    Args:
+        driver: Selenium WebDriver instance (instrumented with instrument_page)
+        timeout (float): Maximum seconds to wait
+        quiet_ms (int): Required quiet period in milliseconds
+
+    Returns:
+        bool: True if the page settled, False on timeout
+    """
+    def settled(driver):
+        state = driver.execute_script(_QUIET_STATE_SCRIPT)
+        if state is None:
+            # Page navigated and lost its instrumentation
+            instrument_page(driver)
+            return False
+        since_mutation, inflight = state
+        return since_mutation >= quiet_ms and inflight <= 0
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(settled)
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_page_ready(driver, timeout=PAGE_LOAD_TIMEOUT, quiet_ms=QUIET_PERIOD_MS):
+    """
+    Wait for the document to load and then for the page to settle
+
+    Args:
+        driver: Selenium WebDriver instance
+        timeout (float): Maximum seconds to wait in total
+        quiet_ms (int): Required quiet period in milliseconds
+
+    Returns:
+        bool: True if the page is ready, False on timeout
+    """
+    deadline = time.time() + timeout
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+        )
+    except TimeoutException:
+        return False
+
+    instrument_page(driver)
+    return wait_for_quiescence(driver, max(0.0, deadline - time.time()), quiet_ms)
+
+
+def wait_for_value(driver, field, value, timeout=VALUE_TIMEOUT, stable_ms=200):
+    """
+    Wait until a field holds the expected value and keeps it for stable_ms
+
+    Catches frameworks that reset a value right after it was set.
+
+    Args:
+        driver: Selenium WebDriver instance
+        field: WebElement of the field
+        value (str): Expected value
+        timeout (float): Maximum seconds to wait
+        stable_ms (int): How long the value must stay unchanged
+
+    Returns:
+        bool: True if the value stuck, False on timeout
+    """
+    since = [None]
+
+    def stuck(driver):
+        if driver.execute_script(_VALUE_SCRIPT, field) != value:
+            since[0] = None
+            return False
+        if since[0] is None:
+            since[0] = time.time()
+        return (time.time() - since[0]) * 1000 >= stable_ms
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(stuck)
+        return True
+    except TimeoutException:
+        return False
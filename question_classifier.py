@@ -0,0 +1,277 @@
+"""
+Question Classifier Module for Berojgar
+
+This module classifies application-form questions with compiled keyword
+matchers instead of chains of substring checks. Every keyword of a rule set
+goes into one regex alternation that is scanned once per question; the
+priority (or score) of each category is then read off the matched keywords.
+Matching keeps plain substring semantics, so results are the same as testing
+each keyword with `in`, only without rescanning the question per keyword.
+"""
+
+import re
+
+
+def _trie_pattern(keywords):
+    """Build a regex for a keyword set with shared prefixes factored out, longest match first"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        ends = node.get('') is True
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional: a longer keyword is tried before stopping at a shorter one
+        return '(?:' + body + ')?' if ends else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Finds every keyword that occurs in a text in a single regex scan"""
+
+    def __init__(self, keywords):
+        """
+        Initialize the matcher
+
+        Args:
+            keywords (iterable): Lower-case keywords (substrings) to look for
+        """
+        self.keywords = sorted(set(keywords))
+        # At each position the scan reports the longest keyword starting there;
+        # every other keyword starting there is a prefix of it
+        self._pattern = re.compile('(?=(' + _trie_pattern(self.keywords) + '))')
+        self._prefixes = {
+            keyword: frozenset(other for other in self.keywords if keyword.startswith(other))
+            for keyword in self.keywords
+        }
+
+    def find(self, text):
+        """
+        Get the keywords that occur in a text
+
+        Args:
+            text (str): Lower-case text
+
+        Returns:
+            set: Keywords found anywhere in the text
+        """
+        found = set()
+        for longest in self.find_longest(text):
+            found |= self._prefixes[longest]
+        return found
+
+    def find_longest(self, text):
+        """
+        Get the longest keyword starting at each match position
+
+        Args:
+            text (str): Lower-case text
+
+        Returns:
+            set: Longest keywords found; the keywords that are their prefixes occur as well
+        """
+        return set(self._pattern.findall(text))
+
+    def prefixes(self, keyword):
+        """
+        Get the keywords that are prefixes of a keyword (including itself)
+
+        Args:
+            keyword (str): Keyword of this matcher
+
+        Returns:
+            frozenset: Keywords implied by a match of keyword
+        """
+        return self._prefixes[keyword]
+
+
+class KeywordClassifier:
+    """Priority-ordered keyword rules compiled into one matcher"""
+
+    def __init__(self, rules, default):
+        """
+        Initialize the classifier
+
+        Args:
+            rules (list): (category, keywords) or (category, keywords, required_keywords)
+                tuples in priority order. A rule with required keywords only applies
+                when one of them occurs in the text as well.
+            default (str): Category returned when no rule applies
+        """
+        self.default = default
+        self._rules = []
+        vocabulary = set()
+        ranks = {}
+        for rank, rule in enumerate(rules):
+            category, keywords = rule[0], rule[1]
+            required = frozenset(rule[2]) if len(rule) > 2 else None
+            self._rules.append((category, required))
+            vocabulary.update(keywords)
+            vocabulary.update(required or ())
+            for keyword in keywords:
+                ranks.setdefault(keyword, []).append(rank)
+        self._matcher = KeywordMatcher(vocabulary)
+        # Rule ranks implied by each keyword the scan can report
+        self._ranks = {
+            keyword: frozenset(rank for prefix in self._matcher.prefixes(keyword) for rank in ranks.get(prefix, ()))
+            for keyword in self._matcher.keywords
+        }
+        self._conditional = any(required for _, required in self._rules)
+
+    def classify(self, text):
+        """
+        Get the category of a text
+
+        Args:
+            text (str): Text to classify (case-insensitive)
+
+        Returns:
+            str: Category of the highest-priority rule that applies
+        """
+        longest = self._matcher.find_longest(text.lower())
+        if not longest:
+            return self.default
+        candidates = frozenset().union(*(self._ranks[keyword] for keyword in longest))
+        if not self._conditional:
+            return self._rules[min(candidates)][0] if candidates else self.default
+
+        found = None
+        for rank in sorted(candidates):
+            category, required = self._rules[rank]
+            if required is None:
+                return category
+            if found is None:
+                found = set().union(*(self._matcher.prefixes(keyword) for keyword in longest))
+            if required & found:
+                return category
+        return self.default
+
+
+class KeywordScorer:
+    """Scores topics by how many of their keywords occur, in one scan"""
+
+    def __init__(self, topics, default):
+        """
+        Initialize the scorer
+
+        Args:
+            topics (dict): Topic -> keywords, in tie-break order
+            default (str): Topic returned when no keyword occurs
+        """
+        self.default = default
+        self._order = {topic: i for i, topic in enumerate(topics)}
+        self._topics = {}
+        for topic, keywords in topics.items():
+            for keyword in keywords:
+                self._topics.setdefault(keyword, []).append(topic)
+        self._matcher = KeywordMatcher(self._topics)
+
+    def best(self, text):
+        """
+        Get the topic with the most matching keywords
+
+        Args:
+            text (str): Text to score (case-insensitive)
+
+        Returns:
+            str: Best topic, earliest topic on ties
+        """
+        scores = {}
+        for keyword in self._matcher.find(text.lower()):
+            for topic in self._topics[keyword]:
+                scores[topic] = scores.get(topic, 0) + 1
+        if not scores:
+            return self.default
+        return min(scores, key=lambda topic: (-scores[topic], self._order[topic]))
+
+
+# Categories for generate_targeted_answer, highest priority first
+QUESTION_CATEGORY_RULES = [
+    # Exact phrases for common form fields
+    ("website_url", ['website']),
+    ("website_url", ['linkedin']),
+    ("website_url", ['github']),
+    ("website_url", ['portfolio']),
+    ("website_url", ['url']),
+    ("website_url", ['link']),
+    ("publications", ['scholar profile']),
+    ("publications", ['google scholar']),
+    ("college_name", ['full name of college', 'university name', 'college name', 'name of institution',
+                      'name of university', 'school name']),
+    ("start_date", ['earliest start date', 'when can you start', 'available to start', 'start date']),
+    ("referral_source", ['how did you hear', 'how did you find', 'referral source']),
+    # Keywords
+    ("website_url", ['website', 'url', 'portfolio', 'linkedin', 'github', 'profile link']),
+    ("college_name", ['college', 'university', 'school', 'institution', 'alma mater', 'education'],
+     ['name', 'which', 'what']),
+    ("publications", ['publication', 'research paper', 'project', 'portfolio', 'github', 'scholar', 'ml', 'dl',
+                      'machine learning']),
+    ("referral_source", ['how did you hear', 'referral', 'how did you find', 'source', 'learn about']),
+    ("salary", ['salary', 'compensation', 'pay', 'wage', 'package', 'ctc', 'expected', 'expectation']),
+    ("start_date", ['notice period', 'start date', 'when can you start', 'join', 'available', 'earliest', 'begin',
+                    'commence']),
+    ("why_company", ['why do you want to work', 'why are you interested', 'why this company', 'why us', 'why join',
+                     'why would you like']),
+    ("strengths", ['strength', 'strengths', 'what are you good at', 'best at', 'excel']),
+    ("weaknesses", ['weakness', 'weaknesses', 'areas of improvement', 'improve', 'development areas']),
+    ("work_authorization", ['authorized to work', 'work authorization', 'visa', 'sponsorship', 'legally']),
+    ("reason_for_leaving", ['why did you leave', 'reason for leaving', 'why are you looking', 'current job']),
+    ("experience", ['experience', 'work history', 'previous jobs', 'tell us about your background']),
+    ("education", ['education', 'degree', 'university', 'college', 'academic']),
+    ("achievements", ['achievement', 'accomplishment', 'proud of', 'success']),
+    ("teamwork", ['team', 'collaborate', 'work with others', 'group']),
+    ("problem_solving", ['problem', 'challenge', 'difficult situation', 'obstacle', 'overcome']),
+    ("leadership", ['lead', 'leadership', 'manage', 'supervise', 'team lead']),
+    ("communication", ['communicat', 'present', 'explain', 'articulate']),
+    ("career_goals", ['goal', 'aspiration', 'future', 'five years', '5 years', 'career path']),
+    ("skills_match", ['skill', 'qualify', 'qualification', 'requirement', 'match']),
+    ("relocation", ['relocate', 'relocation', 'move', 'willing to']),
+    ("work_style", ['work style', 'work environment', 'prefer to work', 'remote', 'office']),
+]
+
+# Categories for rule_based_answer, highest priority first
+FALLBACK_ANSWER_RULES = [
+    ("salary", ['salary', 'compensation', 'pay', 'wage']),
+    ("start_date", ['notice period', 'start date', 'when can you start']),
+    ("why_company", ['why do you want to work', 'why are you interested', 'why this company']),
+    ("strengths", ['strength', 'strengths', 'what are you good at']),
+    ("weaknesses", ['weakness', 'weaknesses', 'areas of improvement']),
+    ("work_authorization", ['authorized to work', 'work authorization', 'visa', 'sponsorship']),
+    ("reason_for_leaving", ['why did you leave', 'reason for leaving']),
+    ("experience", ['experience', 'work history', 'previous jobs']),
+    ("education", ['education', 'degree', 'university', 'college']),
+    ("achievements", ['achievement', 'accomplishment', 'proud of']),
+    ("teamwork", ['team', 'collaborate', 'work with others']),
+    ("problem_solving", ['problem', 'challenge', 'difficult situation']),
+]
+
+# Topics for generate_answer_with_local_model, in tie-break order
+ANSWER_TOPICS = {
+    'experience': ['experience', 'background', 'work history', 'previous', 'job', 'role'],
+    'skills': ['skills', 'abilities', 'competencies', 'proficient', 'expertise', 'capable', 'familiar'],
+    'education': ['education', 'degree', 'university', 'college', 'academic', 'study', 'qualification'],
+    'strengths': ['strength', 'good at', 'excel', 'best', 'advantage', 'strong'],
+    'weaknesses': ['weakness', 'improve', 'development', 'challenge', 'difficult', 'struggle'],
+    'motivation': ['why', 'interest', 'reason', 'motivate', 'aspire', 'goal', 'passion'],
+    'teamwork': ['team', 'collaborate', 'group', 'work with others', 'cooperation'],
+    'leadership': ['lead', 'manage', 'supervise', 'direct', 'guide', 'oversee'],
+    'problem_solving': ['problem', 'challenge', 'solution', 'resolve', 'overcome', 'address'],
+    'communication': ['communicate', 'explain', 'present', 'articulate', 'express', 'convey'],
+    'availability': ['available', 'start', 'notice', 'join', 'when', 'begin'],
+    'salary': ['salary', 'compensation', 'pay', 'wage', 'package', 'expect', 'money'],
+    'relocation': ['relocate', 'move', 'location', 'city', 'state', 'country'],
+    'remote': ['remote', 'work from home', 'wfh', 'telecommute', 'virtual', 'distance'],
+    'project': ['project', 'achievement', 'accomplish', 'deliver', 'success', 'implement'],
+    'tools': ['tool', 'software', 'technology', 'platform', 'system', 'framework', 'language'],
+}
+
+question_categories = KeywordClassifier(QUESTION_CATEGORY_RULES, default="general")
+fallback_answer_categories = KeywordClassifier(FALLBACK_ANSWER_RULES, default="general")
+answer_topics = KeywordScorer(ANSWER_TOPICS, default="general")
@@ -0,0 +1,448 @@
+"""
+Rate Limiter Module for Berojgar
+
+This module provides per-source rate limiting for the job scraper: a token
+bucket caps the request rate (optionally shared across processes through a
+small state file), and an AIMD concurrency limiter grows the number of
+in-flight requests while a source is healthy and halves it on errors or
+HTTP 429 responses. Callers block in a queue instead of failing.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger("rate_limiter")
+
+# Default limits per source: requests per second, burst size and concurrency bounds
+DEFAULT_SOURCE_LIMITS = {
+    'remotive': {'rate': 2.0, 'burst': 4, 'initial_concurrency': 2, 'max_concurrency': 6},
+    'adzuna': {'rate': 1.0, 'burst': 3, 'initial_concurrency': 2, 'max_concurrency': 4},
+    'google': {'rate': 0.2, 'burst': 1, 'initial_concurrency': 1, 'max_concurrency': 2},
+    'github': {'rate': 0.5, 'burst': 2, 'initial_concurrency': 1, 'max_concurrency': 3},
+    # Detail pages of one GitHub result list, fetched as a batch right after the list page
+    'github_details': {'rate': 2.0, 'burst': 8, 'initial_concurrency': 4, 'max_concurrency': 8},
+}
+FALLBACK_SOURCE_LIMITS = {'rate': 1.0, 'burst': 2, 'initial_concurrency': 1, 'max_concurrency': 4}
+
+# Directory for the cross-process token state; set RATE_LIMIT_STATE_DIR="" to keep budgets per process
+RATE_LIMIT_STATE_DIR = os.environ.get(
+    'RATE_LIMIT_STATE_DIR', os.path.join(tempfile.gettempdir(), 'berojgar_rate_limits')
+)
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a request waited longer than allowed for a rate-limit slot"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket, optionally persisted to a file shared by processes"""
+
+    def __init__(self, rate, capacity, state_path=None):
+        """
+        Initialize the bucket
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum number of stored tokens (burst size)
+            state_path (str): File holding the shared bucket state (None = in-process only)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.state_path = state_path
+        self._tokens = self.capacity
+        self._updated = time.time()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _shared_state(self):
+        """Lock the state file and yield its contents; the yielded dict is written back"""
+        with open(self.state_path, 'a+') as handle:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                handle.seek(0)
+                try:
+                    state = json.loads(handle.read() or '{}')
+                except ValueError:
+                    state = {}
+                yield state
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(state))
+                handle.flush()
+            finally:
+                if fcntl:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                else:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _take(self, state, now):
+        tokens = min(self.capacity, state['tokens'] + (now - state['updated']) * self.rate)
+        state['updated'] = now
+        paused_until = state.get('paused_until', 0.0)
+        if now < paused_until:
+            state['tokens'] = tokens
+            return paused_until - now
+        if tokens >= 1:
+            state['tokens'] = tokens - 1
+            return 0.0
+        state['tokens'] = tokens
+        return (1 - tokens) / self.rate
+
+    def try_acquire(self):
+        """
+        Take a token if one is available
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available
+        """
+        now = time.time()
+        with self._lock:
+            if self.state_path:
+                try:
+                    with self._shared_state() as state:
+                        state.setdefault('tokens', self.capacity)
+                        state.setdefault('updated', now)
+                        return self._take(state, now)
+                except OSError as e:
+                    logger.warning(f"Shared rate-limit state unavailable, using local bucket: {e}")
+                    self.state_path = None
+
+            state = {'tokens': self._tokens, 'updated': self._updated, 'paused_until': self._paused_until}
+            wait = self._take(state, now)
+            self._tokens, self._updated = state['tokens'], state['updated']
+            return wait
+
+    def refund(self):
+        """Put back a token whose request turned out not to count (e.g. handed to a retry of the same page)"""
+        now = time.time()
+        with self._lock:
+            if self.state_path:
+                try:
+                    with self._shared_state() as state:
+                        state.setdefault('tokens', self.capacity)
+                        state.setdefault('updated', now)
+                        refilled = state['tokens'] + (now - state['updated']) * self.rate
+                        state['tokens'], state['updated'] = min(self.capacity, refilled + 1), now
+                        return
+                except OSError as e:
+                    logger.warning(f"Shared rate-limit state unavailable, using local bucket: {e}")
+                    self.state_path = None
+
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate + 1)
+            self._updated = now
+
+    def pause(self, seconds):
+        """
+        Stop handing out tokens for the given number of seconds (e.g. after HTTP 429)
+
+        Args:
+            seconds (float): Pause duration
+        """
+        until = time.time() + seconds
+        with self._lock:
+            self._paused_until = max(self._paused_until, until)
+            if self.state_path:
+                try:
+                    with self._shared_state() as state:
+                        state.setdefault('tokens', 0.0)
+                        state.setdefault('updated', time.time())
+                        state['paused_until'] = max(state.get('paused_until', 0.0), until)
+                except OSError:
+                    pass
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limiter with additive-increase / multiplicative-decrease sizing"""
+
+    def __init__(self, initial=1, minimum=1, maximum=8, decrease_factor=0.5):
+        """
+        Initialize the limiter
+
+        Args:
+            initial (int): Starting number of concurrent requests
+            minimum (int): Lower bound for the limit
+            maximum (int): Upper bound for the limit
+            decrease_factor (float): Multiplier applied to the limit on errors
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.limit = float(max(minimum, min(maximum, initial)))
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, deadline=None):
+        """
+        Wait for a free concurrency slot
+
+        Args:
+            deadline (float): Absolute time.time() deadline (None = wait forever)
+
+        Returns:
+            bool: True if a slot was acquired before the deadline
+        """
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self.in_flight += 1
+            return True
+
+    def try_acquire(self):
+        """
+        Take a concurrency slot without waiting
+
+        Returns:
+            bool: True if a slot was acquired
+        """
+        with self._condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, success=True):
+        """
+        Release a slot and adapt the limit
+
+        Args:
+            success (bool): Whether the request succeeded (None = it was never sent;
+                the limit is left as it is)
+        """
+        with self._condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            if success:
+                # Roughly +1 per window of `limit` successful requests
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            elif success is not None:
+                self.limit = max(self.minimum, self.limit * self.decrease_factor)
+            self._condition.notify_all()
+
+
+class RateLimitSlot:
+    """Handle for one admitted request; report the outcome through it"""
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+        self.success = None
+        self.retry_after = None
+
+    def record_response(self, response):
+        """
+        Record the HTTP response of the request
+
+        Args:
+            response: Response object with status_code and headers
+        """
+        status = getattr(response, 'status_code', None) or getattr(response, 'status', None) or 0
+        if status == 429:
+            self.record_throttled((getattr(response, 'headers', None) or {}).get('Retry-After'))
+        elif status >= 500:
+            self.success = False
+        else:
+            self.success = True
+
+    def record_throttled(self, retry_after=None):
+        """
+        Record that the source throttled or blocked the request
+
+        Args:
+            retry_after: Seconds to pause the source (default_backoff if missing)
+        """
+        self.success = False
+        try:
+            self.retry_after = float(retry_after)
+        except (TypeError, ValueError):
+            self.retry_after = self.limiter.default_backoff
+
+    def record_error(self):
+        """Record that the request failed (timeout, connection error, blocked page...)"""
+        self.success = False
+
+
+class SourceRateLimiter:
+    """Token-bucket rate limit plus adaptive concurrency for one job source"""
+
+    def __init__(self, name, rate, burst, initial_concurrency=1, max_concurrency=4,
+                 max_wait=60.0, default_backoff=30.0, state_dir=None):
+        """
+        Initialize the limiter
+
+        Args:
+            name (str): Source name (e.g. 'adzuna')
+            rate (float): Sustained requests per second
+            burst (int): Requests allowed in a burst
+            initial_concurrency (int): Starting number of in-flight requests
+            max_concurrency (int): Upper bound for in-flight requests
+            max_wait (float): Seconds a request may queue before RateLimitTimeout
+            default_backoff (float): Pause after HTTP 429 without Retry-After
+            state_dir (str): Directory for the cross-process token state
+        """
+        self.name = name
+        self.max_wait = max_wait
+        self.default_backoff = default_backoff
+
+        state_path = None
+        if state_dir:
+            try:
+                os.makedirs(state_dir, exist_ok=True)
+                state_path = os.path.join(state_dir, f"{name}.json")
+            except OSError as e:
+                logger.warning(f"Cannot use rate-limit state dir {state_dir}: {e}")
+
+        self.bucket = TokenBucket(rate, burst, state_path)
+        self.concurrency = AdaptiveConcurrencyLimiter(initial_concurrency, 1, max_concurrency)
+
+    def acquire(self, max_wait=None):
+        """
+        Block until the request may be sent
+
+        Args:
+            max_wait (float): Override for the maximum queueing time
+
+        Raises:
+            RateLimitTimeout: If no slot became available in time
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+        deadline = time.time() + max_wait
+
+        if not self.concurrency.acquire(deadline):
+            raise RateLimitTimeout(f"Timed out waiting for a {self.name} concurrency slot")
+
+        while True:
+            wait = self.bucket.try_acquire()
+            if wait <= 0:
+                return
+            if time.time() + wait > deadline:
+                self.concurrency.release(success=None)
+                raise RateLimitTimeout(f"Timed out waiting for a {self.name} rate-limit token")
+            time.sleep(wait)
+
+    async def acquire_async(self, max_wait=None, poll_interval=0.05):
+        """
+        Asynchronous version of acquire() that yields to the event loop while queued
+
+        Args:
+            max_wait (float): Override for the maximum queueing time
+            poll_interval (float): Seconds between concurrency slot checks
+
+        Raises:
+            RateLimitTimeout: If no slot became available in time
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+        deadline = time.time() + max_wait
+
+        while not self.concurrency.try_acquire():
+            if time.time() >= deadline:
+                raise RateLimitTimeout(f"Timed out waiting for a {self.name} concurrency slot")
+            await asyncio.sleep(poll_interval)
+
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                # The shared bucket locks and rewrites its state file, so keep it off the event loop
+                wait = await loop.run_in_executor(None, self.bucket.try_acquire)
+                if wait <= 0:
+                    return
+                if time.time() + wait > deadline:
+                    raise RateLimitTimeout(f"Timed out waiting for a {self.name} rate-limit token")
+                await asyncio.sleep(wait)
+        except BaseException:
+            # Timed out or cancelled while queued for a token: give the slot back
+            self.concurrency.release(success=None)
+            raise
+
+    def refund(self):
+        """Put back the rate-limit token of a request that is about to be retried another way"""
+        self.bucket.refund()
+
+    def release(self, slot):
+        """
+        Release an acquired slot, adapting concurrency to its outcome
+
+        Args:
+            slot (RateLimitSlot): Slot returned by slot()
+        """
+        success = slot.success is not False
+        if slot.retry_after:
+            logger.warning(f"{self.name} is throttling us, pausing for {slot.retry_after:.1f}s")
+            self.bucket.pause(slot.retry_after)
+        self.concurrency.release(success)
+
+    @contextmanager
+    def slot(self, max_wait=None):
+        """
+        Context manager admitting one request
+
+        Usage:
+            with limiter.slot() as slot:
+                response = session.get(url)
+                slot.record_response(response)
+
+        Exceptions raised inside the block count as failures.
+        """
+        self.acquire(max_wait)
+        slot = RateLimitSlot(self)
+        try:
+            yield slot
+        except Exception:
+            slot.record_error()
+            raise
+        finally:
+            self.release(slot)
+
+    @asynccontextmanager
+    async def slot_async(self, max_wait=None):
+        """Asynchronous version of slot() for use with ``async with``"""
+        await self.acquire_async(max_wait)
+        slot = RateLimitSlot(self)
+        try:
+            yield slot
+        except Exception:
+            slot.record_error()
+            raise
+        finally:
+            self.release(slot)
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(source):
+    """
+    Get the process-wide rate limiter for a source
+
+    Args:
+        source (str): Source name ('remotive', 'adzuna', 'google', 'github', ...)
+
+    Returns:
+        SourceRateLimiter: Shared limiter for the source
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(source)
+        if limiter is None:
+            limits = DEFAULT_SOURCE_LIMITS.get(source, FALLBACK_SOURCE_LIMITS)
+            limiter = SourceRateLimiter(source, state_dir=RATE_LIMIT_STATE_DIR or None, **limits)
+            _limiters[source] = limiter
+        return limiter
@@ -0,0 +1,224 @@
+"""
+Search Snapshot Module for Berojgar
+
+This module keeps a short-lived, server-side snapshot of each merged job search
+result so the search API can page through it with opaque cursors, and so job
+details (including full descriptions) can be served without re-scraping.
+"""
+
+import base64
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+# Fields returned to list views by default (no full_description)
+SUMMARY_FIELDS = (
+    'id', 'title', 'company', 'location', 'description', 'source', 'url',
+    'application_url', 'skills', 'posted_date', 'job_type', 'salary',
+    'match_score', 'matching_skills', 'canonical_id'
+)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or its snapshot has expired"""
+
+
+def encode_cursor(snapshot_id, offset):
+    """
+    Encode a snapshot position as an opaque cursor string
+
+    Args:
+        snapshot_id (str): Snapshot identifier
+        offset (int): Index of the next job to return
+
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = json.dumps({'s': snapshot_id, 'o': offset}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor (str): Cursor string
+
+    Returns:
+        tuple: (snapshot_id, offset)
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        snapshot_id, offset = str(payload['s']), int(payload['o'])
+    except Exception:
+        raise InvalidCursorError("Invalid pagination cursor")
+    if offset < 0:
+        raise InvalidCursorError("Invalid pagination cursor")
+    return snapshot_id, offset
+
+
+def parse_fields(fields):
+    """
+    Parse a field-projection parameter
+
+    Args:
+        fields (str or list): Comma-separated field names, a list of names,
+            'all' for every field, or None for the summary fields
+
+    Returns:
+        tuple: Field names to include, or None for all fields
+    """
+    if not fields:
+        return SUMMARY_FIELDS
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    fields = tuple(field.strip() for field in fields if field and field.strip())
+    if not fields:
+        return SUMMARY_FIELDS
+    if 'all' in fields:
+        return None
+    # The ID is always needed to fetch details later
+    if 'id' not in fields:
+        fields = ('id',) + fields
+    return fields
+
+
+def parse_page_size(limit):
+    """
+    Clamp a requested page size to the allowed range
+
+    Args:
+        limit: Requested page size (str, int or None)
+
+    Returns:
+        int: Page size between 1 and MAX_PAGE_SIZE
+    """
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(MAX_PAGE_SIZE, limit))
+
+
+def project_job(job, fields):
+    """
+    Return a copy of the job restricted to the given fields
+
+    Args:
+        job (dict): Job dictionary
+        fields (tuple): Field names, or None for all fields
+
+    Returns:
+        dict: Projected job dictionary
+    """
+    if fields is None:
+        return dict(job)
+    return {field: job[field] for field in fields if field in job}
+
+
+class SearchSnapshotStore:
+    """Thread-safe store of search result snapshots with expiry"""
+
+    def __init__(self, ttl=900, max_snapshots=200):
+        """
+        Initialize the store
+
+        Args:
+            ttl (int): Seconds a snapshot stays available
+            max_snapshots (int): Maximum number of snapshots kept in memory
+        """
+        self.ttl = ttl
+        self.max_snapshots = max_snapshots
+        self._snapshots = OrderedDict()  # snapshot_id -> (created, jobs, jobs_by_id, meta)
+        self._lock = threading.Lock()
+
+    def _expire(self):
+        cutoff = time.time() - self.ttl
+        while self._snapshots:
+            snapshot_id, snapshot = next(iter(self._snapshots.items()))
+            if snapshot[0] >= cutoff and len(self._snapshots) <= self.max_snapshots:
+                break
+            del self._snapshots[snapshot_id]
+
+    def create(self, jobs, **meta):
+        """
+        Store a result set and return its snapshot ID
+
+        Args:
+            jobs (list): Full job dictionaries, in result order
+            **meta: Extra information kept with the snapshot (query, location...)
+
+        Returns:
+            str: Snapshot ID
+        """
+        snapshot_id = uuid.uuid4().hex
+        jobs_by_id = {job['id']: job for job in jobs if job.get('id')}
+        with self._lock:
+            self._snapshots[snapshot_id] = (time.time(), list(jobs), jobs_by_id, meta)
+            self._expire()
+        return snapshot_id
+
+    def page(self, snapshot_id, offset=0, limit=DEFAULT_PAGE_SIZE, fields=SUMMARY_FIELDS):
+        """
+        Return one page of a snapshot
+
+        Args:
+            snapshot_id (str): Snapshot ID
+            offset (int): Index of the first job to return
+            limit (int): Maximum number of jobs to return
+            fields (tuple): Field projection (None for all fields)
+
+        Returns:
+            dict: Page with 'jobs', 'total', 'next_cursor' and 'snapshot_id'
+
+        Raises:
+            InvalidCursorError: If the snapshot does not exist or has expired
+        """
+        with self._lock:
+            self._expire()
+            snapshot = self._snapshots.get(snapshot_id)
+        if snapshot is None:
+            raise InvalidCursorError("Search results have expired, please search again")
+
+        jobs = snapshot[1]
+        page_jobs = [project_job(job, fields) for job in jobs[offset:offset + limit]]
+        next_offset = offset + len(page_jobs)
+
+        return {
+            'jobs': page_jobs,
+            'total': len(jobs),
+            'snapshot_id': snapshot_id,
+            'next_cursor': encode_cursor(snapshot_id, next_offset) if next_offset < len(jobs) else None
+        }
+
+    def find_job(self, job_id):
+        """
+        Look up a job by ID in the live snapshots, newest first
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            dict: Full job dictionary, or None if not found
+        """
+        with self._lock:
+            self._expire()
+            for snapshot in reversed(self._snapshots.values()):
+                job = snapshot[2].get(job_id)
+                if job is not None:
+                    return job
+        return None
+
+
+# Process-wide snapshot store used by the search API
+search_snapshots = SearchSnapshotStore()
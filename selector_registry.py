@@ -0,0 +1,104 @@
+"""
+Selector Registry Module for Berojgar
+
+This module remembers which of several candidate selectors last worked for a
+scraped page, per context (e.g. locale and page layout), so the scraper tries
+the known-good selector first instead of walking a fixed list. Hit statistics
+are kept for each selector.
+"""
+
+import threading
+import time
+
+
+class SelectorRegistry:
+    """Adaptive ordering of candidate selectors with per-context hit statistics"""
+
+    def __init__(self, candidates):
+        """
+        Initialize the registry
+
+        Args:
+            candidates (list): Selectors in their default order (most specific first)
+        """
+        self.candidates = list(candidates)
+        self._stats = {}  # context -> {selector: {'hits', 'misses', 'last_hit'}}
+        self._lock = threading.Lock()
+
+    def ordered(self, context):
+        """
+        Get the candidates in the order they should be tried for a context
+
+        Selectors that matched most recently come first; selectors that never
+        matched keep their default order after them.
+
+        Args:
+            context (tuple): Context key, e.g. (locale, layout)
+
+        Returns:
+            list: Candidate selectors
+        """
+        with self._lock:
+            stats = self._stats.get(context, {})
+            default_rank = {selector: i for i, selector in enumerate(self.candidates)}
+            return sorted(
+                self.candidates,
+                key=lambda selector: (-(stats.get(selector, {}).get('last_hit') or 0), default_rank[selector])
+            )
+
+    def record(self, context, selector, hit):
+        """
+        Record whether a selector produced results in a context
+
+        Args:
+            context (tuple): Context key
+            selector (str): Selector that was tried
+            hit (bool): Whether it produced results
+        """
+        with self._lock:
+            stats = self._stats.setdefault(context, {}).setdefault(
+                selector, {'hits': 0, 'misses': 0, 'last_hit': None}
+            )
+            if hit:
+                stats['hits'] += 1
+                stats['last_hit'] = time.time()
+            else:
+                stats['misses'] += 1
+                # A selector that stops working loses its place at the front
+                stats['last_hit'] = None
+
+    def record_result(self, context, tried, matched, hit):
+        """
+        Record the outcome of one lookup
+
+        Args:
+            context (tuple): Context key
+            tried (list): Selectors checked before the matching one, in order
+            matched (str): Selector that matched, or None
+            hit (bool): Whether the matched selector produced results
+        """
+        for selector in tried:
+            self.record(context, selector, False)
+        if matched:
+            self.record(context, matched, hit)
+
+    def stats(self):
+        """
+        Get hit statistics for every context
+
+        Returns:
+            dict: {"locale/layout": {selector: {'hits', 'misses', 'hit_rate'}}}
+        """
+        with self._lock:
+            summary = {}
+            for context, selectors in self._stats.items():
+                key = "/".join(str(part) for part in context)
+                summary[key] = {
+                    selector: {
+                        'hits': stats['hits'],
+                        'misses': stats['misses'],
+                        'hit_rate': round(stats['hits'] / (stats['hits'] + stats['misses']), 3)
+                    }
+                    for selector, stats in selectors.items()
+                }
+            return summary
@@ -0,0 +1,72 @@
+"""
+Source Metrics Module for Berojgar
+
+This module keeps lightweight success-rate and latency counters for each job
+fetch path (e.g. Google's HTTP fast path versus the Selenium fallback), so we
+can see which paths are actually producing results.
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class SourceMetrics:
+    """Thread-safe per-path success and latency counters"""
+
+    def __init__(self, window=200):
+        """
+        Initialize the metrics store
+
+        Args:
+            window (int): Number of recent attempts used for the recent success rate
+        """
+        self.window = window
+        self._paths = {}
+        self._lock = threading.Lock()
+
+    def record(self, path, success, duration):
+        """
+        Record one fetch attempt
+
+        Args:
+            path (str): Fetch path name (e.g. 'google_http')
+            success (bool): Whether the attempt produced results
+            duration (float): Attempt duration in seconds
+        """
+        with self._lock:
+            stats = self._paths.get(path)
+            if stats is None:
+                stats = {'attempts': 0, 'successes': 0, 'total_time': 0.0,
+                         'recent': deque(maxlen=self.window), 'last_attempt': None}
+                self._paths[path] = stats
+            stats['attempts'] += 1
+            stats['successes'] += 1 if success else 0
+            stats['total_time'] += duration
+            stats['recent'].append(bool(success))
+            stats['last_attempt'] = time.time()
+
+    def snapshot(self):
+        """
+        Get a summary of all recorded paths
+
+        Returns:
+            dict: Per-path attempts, successes, success rates and average latency
+        """
+        with self._lock:
+            summary = {}
+            for path, stats in self._paths.items():
+                recent = stats['recent']
+                summary[path] = {
+                    'attempts': stats['attempts'],
+                    'successes': stats['successes'],
+                    'success_rate': round(stats['successes'] / stats['attempts'], 3),
+                    'recent_success_rate': round(sum(recent) / len(recent), 3) if recent else None,
+                    'avg_ms': round(1000 * stats['total_time'] / stats['attempts'], 1),
+                    'last_attempt': stats['last_attempt']
+                }
+            return summary
+
+
+# Process-wide metrics shared by all scrapers
+scraper_metrics = SourceMetrics()
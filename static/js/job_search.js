@@ -18,6 +18,9 @@ document.addEventListener('DOMContentLoaded', function() {
     let resumeFile = null;
     let resumeData = null;
     
+    // Cursor for the next page of the current search (null when there are no more)
+    let nextCursor = null;
+    
     // Event listeners
     jobSearchForm.addEventListener('submit', handleJobSearch);
     resumeInput.addEventListener('change', handleResumeUpload);
@@ -82,9 +85,11 @@ document.addEventListener('DOMContentLoaded', function() {
             
             // Handle both possible response formats
             const jobs = data.jobs || (Array.isArray(data) ? data : []);
+            nextCursor = data.next_cursor || null;
             
             // Display results
             renderJobResults(jobs);
+            renderLoadMoreButton(data.total);
         })
         .catch(error => {
             console.error('Job search error:', error);
@@ -104,6 +109,65 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
     
+    /**
+     * Fetch the next page of the current search and append it to the results
+     */
+    function loadMoreJobs() {
+        if (!nextCursor) return;
+        
+        const loadMoreButton = document.getElementById('loadMoreJobs');
+        if (loadMoreButton) {
+            loadMoreButton.disabled = true;
+            loadMoreButton.textContent = 'Loading...';
+        }
+        
+        fetch('/api/jobs/search', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ cursor: nextCursor })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) {
+                throw new Error(data.error || 'Could not load more jobs');
+            }
+            nextCursor = data.next_cursor || null;
+            renderJobResults(data.jobs || [], true);
+            renderLoadMoreButton(data.total);
+        })
+        .catch(error => {
+            console.error('Error loading more jobs:', error);
+            nextCursor = null;
+            renderLoadMoreButton();
+            showAlert(`Error loading more jobs: ${error.message}`, 'warning');
+        });
+    }
+    
+    /**
+     * Show a "Load more" button while the current search has more pages
+     */
+    function renderLoadMoreButton(total) {
+        const existingButton = document.getElementById('loadMoreJobs');
+        if (existingButton) {
+            existingButton.parentElement.remove();
+        }
+        
+        if (!nextCursor) return;
+        
+        const shown = document.querySelectorAll('#jobSearchResults .job-card').length;
+        const wrapper = document.createElement('div');
+        wrapper.className = 'text-center my-3';
+        wrapper.innerHTML = `
+            <button type="button" class="btn btn-outline-primary" id="loadMoreJobs">
+                Load more jobs${total ? ` (${shown} of ${total})` : ''}
+            </button>
+        `;
+        jobSearchResults.appendChild(wrapper);
+        document.getElementById('loadMoreJobs').addEventListener('click', loadMoreJobs);
+    }
+    
     /**
      * Handle resume file upload
      */
@@ -166,10 +230,12 @@ document.addEventListener('DOMContentLoaded', function() {
     /**
      * Render job search results
      */
-    function renderJobResults(jobs) {
-        jobSearchResults.innerHTML = '';
+    function renderJobResults(jobs, append = false) {
+        if (!append) {
+            jobSearchResults.innerHTML = '';
+        }
         
-        if (!jobs || jobs.length === 0) {
+        if (!append && (!jobs || jobs.length === 0)) {
             jobSearchResults.innerHTML = `
                 <div class="col-12 text-center py-5">
                     <div class="alert alert-info">
@@ -188,10 +254,13 @@ document.addEventListener('DOMContentLoaded', function() {
             window.jobCache = {};
         }
         
-        // Create a container for all jobs
-        const jobsContainer = document.createElement('div');
-        jobsContainer.className = 'job-listings';
-        jobSearchResults.appendChild(jobsContainer);
+        // Create a container for all jobs, or reuse it when appending a page
+        let jobsContainer = append ? jobSearchResults.querySelector('.job-listings') : null;
+        if (!jobsContainer) {
+            jobsContainer = document.createElement('div');
+            jobsContainer.className = 'job-listings';
+            jobSearchResults.appendChild(jobsContainer);
+        }
         
         jobs.forEach(job => {
             // Skip jobs with missing essential data
@@ -390,7 +459,7 @@ document.addEventListener('DOMContentLoaded', function() {
                     <div class="job-description mb-4">
                         <h6>Description:</h6>
                         <div class="description-content">
-                            ${formatJobDescription(job.description || job.full_description || 'No description available')}
+                            ${formatJobDescription(job.full_description || job.description || 'No description available')}
                         </div>
                     </div>
                     
@@ -70,6 +70,43 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 });
 
+// Largest page size /api/jobs/search serves
+const MAX_JOB_PAGE_SIZE = 100;
+
+// Fields /api/jobs/search returns by default (SUMMARY_FIELDS in search_snapshots.py)
+const SUMMARY_FIELDS = [
+    'id', 'title', 'company', 'location', 'description', 'source', 'url',
+    'application_url', 'skills', 'posted_date', 'job_type', 'salary',
+    'match_score', 'matching_skills', 'canonical_id'
+];
+
+// Summary fields plus the extra ones the results view renders or filters on
+const JOB_LIST_FIELDS = SUMMARY_FIELDS.concat(['is_remote', 'posted_date_timestamp', 'requirements']).join(',');
+
+// Run a job search and follow next_cursor until every page of the result snapshot is loaded
+async function fetchAllJobPages(apiUrl, requestData) {
+    const post = body => fetch(apiUrl, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(body)
+    }).then(response => response.json());
+    
+    const data = await post(requestData);
+    let cursor = data.success ? data.next_cursor : null;
+    while (cursor) {
+        const page = await post({ cursor: cursor, limit: requestData.limit, fields: requestData.fields });
+        if (!page.success) {
+            console.error('Error loading more jobs:', page.error);
+            break;
+        }
+        data.jobs = (data.jobs || []).concat(page.jobs || []);
+        cursor = page.next_cursor;
+    }
+    return data;
+}
+
 // Function to search for jobs
 async function searchJobs() {
     const query = document.getElementById('jobQuery').value;
@@ -104,11 +141,14 @@ async function searchJobs() {
         // Using the new API endpoint with POST method
         const apiUrl = '/api/jobs/search';
         
-        // Prepare the request data
+        // Prepare the request data; this view renders the whole result set, so ask for
+        // the fields it uses in the largest pages the API serves and follow the cursor below
         const requestData = {
             query: query,
             location: location,
-            resume_data: null
+            resume_data: null,
+            limit: MAX_JOB_PAGE_SIZE,
+            fields: JOB_LIST_FIELDS
         };
         
         // If resume is uploaded, extract skills and other data
@@ -137,15 +177,8 @@ async function searchJobs() {
         }, 5000);
         
         // Make API request to search for jobs using POST method
-        const response = await fetch(apiUrl, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify(requestData)
-        });
+        const data = await fetchAllJobPages(apiUrl, requestData);
         clearTimeout(timeoutId);
-        const data = await response.json();
         
         // Hide loading spinner
         if (loadingSpinner) {
@@ -430,4 +430,159 @@ document.addEventListener('DOMContentLoaded', function() {
         // Update preview
         resumePreview.innerHTML = resumeHtml;
     }
+
+    // Live ATS scoring: only the sections edited since the last request are sent and re-scored
+    const resumeForm = document.getElementById('resumeForm');
+    const liveJobDescription = document.getElementById('liveJobDescription');
+    const liveScoreValue = document.getElementById('live-ats-score-value');
+    const liveMissing = document.getElementById('live-ats-missing');
+    const liveSuggestions = document.getElementById('live-ats-suggestions');
+    const LIVE_SCORE_DELAY = 300;
+    let liveSessionId = null;
+    let liveScoreTimer = null;
+    let liveScoreInFlight = false;
+    
+    function fieldValue(id) {
+        const field = document.getElementById(id);
+        return field ? field.value : '';
+    }
+    
+    function entryValues(selector, fields) {
+        return Array.from(document.querySelectorAll(selector)).map(entry => {
+            const values = {};
+            Object.entries(fields).forEach(([key, name]) => {
+                const field = entry.querySelector(`[name="${name}"]`);
+                values[key] = field ? field.value : '';
+            });
+            return values;
+        });
+    }
+    
+    const sectionReaders = {
+        contact: () => ({
+            fullName: fieldValue('fullName'),
+            jobTitle: fieldValue('jobTitle'),
+            email: fieldValue('email'),
+            phone: fieldValue('phone'),
+            location: fieldValue('location'),
+            website: fieldValue('website')
+        }),
+        summary: () => ({ summary: fieldValue('summary') }),
+        skills: () => ({
+            technicalSkills: fieldValue('technicalSkills'),
+            softSkills: fieldValue('softSkills'),
+            languages: fieldValue('languages'),
+            certifications: fieldValue('certifications')
+        }),
+        experience: () => entryValues('.experience-entry', {
+            title: 'expTitle[]', company: 'company[]', location: 'expLocation[]',
+            period: 'employmentPeriod[]', description: 'expDescription[]'
+        }),
+        education: () => entryValues('.education-entry', {
+            degree: 'degree[]', institution: 'institution[]', location: 'eduLocation[]',
+            date: 'graduationDate[]', description: 'eduDescription[]'
+        }),
+        projects: () => entryValues('.project-entry', {
+            name: 'projectName[]', technologies: 'technologies[]', url: 'projectUrl[]',
+            description: 'projectDescription[]'
+        }),
+        job: () => ({ description: liveJobDescription.value })
+    };
+    const dirtySections = new Set(Object.keys(sectionReaders));
+    
+    // Section an event came from; the event path still holds entries that were just removed
+    function sectionForEvent(event) {
+        const path = event.composedPath();
+        if (path.includes(liveJobDescription)) {
+            return 'job';
+        }
+        const pane = path.find(el => el.classList && el.classList.contains('tab-pane'));
+        if (!pane) {
+            return null;
+        }
+        if (pane.id === 'personal') {
+            return event.target.id === 'summary' ? 'summary' : 'contact';
+        }
+        return pane.id in sectionReaders ? pane.id : null;
+    }
+    
+    function markSectionDirty(event) {
+        const section = sectionForEvent(event);
+        if (section) {
+            dirtySections.add(section);
+            scheduleLiveScore();
+        }
+    }
+    
+    function scheduleLiveScore() {
+        clearTimeout(liveScoreTimer);
+        liveScoreTimer = setTimeout(sendLiveScore, LIVE_SCORE_DELAY);
+    }
+    
+    function sendLiveScore() {
+        // One request at a time keeps the server's copy of each section in order
+        if (liveScoreInFlight) {
+            scheduleLiveScore();
+            return;
+        }
+        if (dirtySections.size === 0) {
+            return;
+        }
+        
+        const sections = {};
+        dirtySections.forEach(name => {
+            sections[name] = sectionReaders[name]();
+        });
+        dirtySections.clear();
+        liveScoreInFlight = true;
+        
+        fetch('/api/resume_builder/score', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ session_id: liveSessionId, sections: sections })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.error) {
+                throw new Error(data.error);
+            }
+            liveSessionId = data.sessionId;
+            if (data.resync) {
+                // The server dropped our session; send every section again
+                Object.keys(sectionReaders).forEach(name => dirtySections.add(name));
+                scheduleLiveScore();
+            }
+            renderLiveScore(data);
+        })
+        .catch(error => {
+            console.error('Live ATS scoring failed:', error);
+            Object.keys(sections).forEach(name => dirtySections.add(name));
+        })
+        .finally(() => {
+            liveScoreInFlight = false;
+        });
+    }
+    
+    function renderLiveScore(data) {
+        liveScoreValue.textContent = data.score;
+        liveScoreValue.className = 'badge fs-6 ' + (data.score >= 80 ? 'bg-success' : data.score >= 70 ? 'bg-warning' : 'bg-danger');
+        
+        liveMissing.textContent = data.missingSkills.length ? `Missing skills: ${data.missingSkills.join(', ')}` : '';
+        
+        liveSuggestions.innerHTML = '';
+        data.suggestions.forEach(suggestion => {
+            const item = document.createElement('li');
+            item.textContent = suggestion;
+            liveSuggestions.appendChild(item);
+        });
+    }
+    
+    resumeForm.addEventListener('input', markSectionDirty);
+    resumeForm.addEventListener('click', function(event) {
+        if (event.target.closest('.remove-entry, #add-education, #add-experience, #add-project')) {
+            markSectionDirty(event);
+        }
+    });
+    liveJobDescription.addEventListener('input', markSectionDirty);
+    scheduleLiveScore();
 });